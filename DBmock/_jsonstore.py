@@ -0,0 +1,460 @@
+"""
+Shared JSON Lines key/value store backing the consensus mock DB modules.
+
+Rows are plain dicts keyed by a caller-supplied tuple (e.g. sku/customer/location/date).
+Writes append one compact line per mutation; load dedupes by key keeping the row with
+the latest `timestamp_field`, normalizes legacy fields, and sorts for display.
+"""
+
+from __future__ import annotations
+
+import atexit
+import mmap
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+    import json
+
+
+Row = Dict[str, Any]
+KeyFn = Callable[[Row], tuple]
+
+# Stores at least this large are parsed through a read-only mmap instead of read_bytes().
+_MMAP_MIN_BYTES = 64 * 1024
+
+# Reloads with at least this many rows find legacy-fraction rows with one NumPy mask.
+_VECTORIZE_MIN_ROWS = 2048
+
+
+_CLOCK_LOCK = threading.Lock()
+_LAST_NOW = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def now_iso() -> str:
+    """
+    UTC ISO-8601 timestamp, strictly increasing within the process.
+
+    Latest-timestamp-wins dedupe compares these as strings, so two writes in the same
+    microsecond (or a clock step backwards) must still order correctly.
+    """
+    global _LAST_NOW
+    # fromtimestamp(time.time()) is cheaper than datetime.now(tz) on the write path.
+    now = datetime.fromtimestamp(time.time(), timezone.utc)
+    with _CLOCK_LOCK:
+        if now <= _LAST_NOW:
+            now = _LAST_NOW + timedelta(microseconds=1)
+        _LAST_NOW = now
+    # Fixed-width microseconds keep lexicographic order equal to time order.
+    return now.isoformat(timespec="microseconds")
+
+
+def _loads(buf: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _atomic_write(path: Path, buf: bytes) -> None:
+    # Write to a sibling temp file and rename over the target, so a crash mid-write
+    # never leaves a truncated store behind.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(buf)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+_SORT_FIELDS = itemgetter("as_of_date", "location_id", "customer_id", "sku_id")
+
+
+def _sort_key(row: Row) -> tuple:
+    # Fast path: all four display fields present as strings (every row the graph writes).
+    try:
+        key = _SORT_FIELDS(row)
+    except KeyError:
+        get = row.get
+        return (
+            str(get("as_of_date", "")),
+            str(get("location_id", "")),
+            str(get("customer_id", "")),
+            str(get("sku_id", "")),
+        )
+    a, b, c, d = key
+    if a.__class__ is str and b.__class__ is str and c.__class__ is str and d.__class__ is str:
+        return key
+    return (str(a), str(b), str(c), str(d))
+
+
+def _normalize_row(r: Row) -> Row:
+    # Normalize legacy rows where total_boost_percent accidentally stored as fraction (-0.3).
+    row = dict(r)
+    tbp = row.get("total_boost_percent")
+    # If percent looks like a fraction and no explicit fraction is present, fix it.
+    if row.get("total_boost_fraction") is None and isinstance(tbp, (int, float)) and -1.0 <= float(tbp) <= 1.0:
+        frac = float(tbp)
+        row["total_boost_fraction"] = frac
+        row["total_boost_percent"] = round(frac * 100.0, 2)
+    return row
+
+
+def _legacy_fraction_rows(rows: List[Row]) -> Iterable[int]:
+    """
+    Indices of rows _normalize_row would fix, computed as one vectorized mask.
+    """
+    import numpy as np
+
+    n = len(rows)
+    nan = float("nan")
+    tbp = np.fromiter(
+        (v if isinstance(v, (int, float)) else nan for v in (r.get("total_boost_percent") for r in rows)),
+        dtype=np.float64,
+        count=n,
+    )
+    no_tbf = np.fromiter((r.get("total_boost_fraction") is None for r in rows), dtype=bool, count=n)
+    # NaN (missing / non-numeric percent) compares False, so those rows are left alone.
+    return np.flatnonzero(no_tbf & (np.abs(tbp) <= 1.0)).tolist()
+
+
+def _iter_lines(path: Path, size: int) -> Iterator[bytes]:
+    if size < _MMAP_MIN_BYTES:
+        # mmap setup costs more than it saves on small files.
+        yield from path.read_bytes().splitlines()
+        return
+    # Page-cache-backed mapping: only one line at a time is copied into Python bytes.
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from iter(mm.readline, b"")
+
+
+def _parse_lines(path: Path, size: int) -> Tuple[List[Row], int]:
+    """
+    Returns (rows, line_count). A torn trailing line from an interrupted append is skipped.
+    """
+    rows: List[Row] = []
+    append = rows.append
+    loads = _loads
+    for line in _iter_lines(path, size):
+        if not line.strip():
+            continue
+        try:
+            row = loads(line)
+        except ValueError:
+            continue
+        if isinstance(row, dict):
+            append(row)
+    return rows, len(rows)
+
+
+@dataclass(slots=True)
+class _Snapshot:
+    """
+    Parsed store state, valid while `sig` matches the file's (st_mtime_ns, st_size).
+    """
+
+    sig: Optional[Tuple[int, int]]
+    # Parsed rows in display order, then rows added since in arrival order.
+    rows: List[Row]
+    # key_fn(row) -> position in rows
+    index: Dict[tuple, int]
+    line_count: int
+    # rows sorted for display, built on first load()/load_table() for this snapshot.
+    display: Optional[List[Row]] = None
+    # pyarrow.Table of display rows, built on first load_table() for this snapshot.
+    table: Any = None
+
+
+def _rows_to_table(rows: List[Row]) -> Any:
+    """
+    Build a pyarrow.Table (columns in first-seen order) for st.dataframe / to_pandas().
+    Columns with mixed types that Arrow cannot unify are rendered as strings.
+    """
+    import pyarrow as pa
+
+    names = list(dict.fromkeys(k for row in rows for k in row))
+    columns: Dict[str, Any] = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        try:
+            columns[name] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            columns[name] = pa.array([None if v is None else str(v) for v in values], type=pa.string())
+    return pa.table(columns)
+
+
+class JsonKVStore:
+    """
+    Append-only JSON Lines store with an in-process (mtime, size)-validated cache.
+
+    - path: the *.jsonl file
+    - key_fn: row -> identity tuple used for upsert/dedupe
+    - timestamp_field: latest value wins when the log holds several rows per key
+    - legacy_path: optional pre-JSONL array file, imported once on first load
+    - preserve_fields: fields copied from the existing row on upsert (e.g. created_at)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        key_fn: KeyFn,
+        timestamp_field: str,
+        *,
+        legacy_path: Optional[Path] = None,
+        preserve_fields: Iterable[str] = (),
+        compact_ratio: int = 2,
+        batch_size: int = 256,
+    ) -> None:
+        self.path = path
+        self.key_fn = key_fn
+        self.timestamp_field = timestamp_field
+        self.legacy_path = legacy_path
+        self._legacy_checked = False
+        self.preserve_fields = tuple(preserve_fields)
+        # Rewrite the log with deduped rows once it holds this many lines per unique key.
+        self.compact_ratio = compact_ratio
+        # Unflushed writes (flush=False) are written out once this many are pending.
+        self.batch_size = batch_size
+        self._cache: Optional[_Snapshot] = None
+        # Rows already applied to the cached rows but not yet appended to the log.
+        self._pending: List[Row] = []
+        atexit.register(self.flush)
+
+    # ---- internal helpers ----
+
+    def _normalize_rows(self, rows: List[Row]) -> List[Row]:
+        # Hot on every external reload: builtins and bound methods are aliased to locals.
+        _str, _dict, _float, _isinstance, _round = str, dict, float, isinstance, round
+        key_fn = self.key_fn
+        ts_field = self.timestamp_field
+        decorated: List[Tuple[tuple, tuple, str, int, Row]] = []
+        append = decorated.append
+        vectorize = len(rows) >= _VECTORIZE_MIN_ROWS
+        if vectorize:
+            rows = [_dict(r) for r in rows]
+            for i in _legacy_fraction_rows(rows):
+                # Fixed up with the same float()/round() as the scalar path, so results match exactly.
+                row = rows[i]
+                frac = _float(row["total_boost_percent"])
+                row["total_boost_fraction"] = frac
+                row["total_boost_percent"] = _round(frac * 100.0, 2)
+        for seq, r in enumerate(rows):
+            if vectorize:
+                row = r
+            else:
+                row = _dict(r)
+                # Inlined _normalize_row.
+                tbp = row.get("total_boost_percent")
+                if row.get("total_boost_fraction") is None and _isinstance(tbp, (int, float)) and -1.0 <= _float(tbp) <= 1.0:
+                    frac = _float(tbp)
+                    row["total_boost_fraction"] = frac
+                    row["total_boost_percent"] = _round(frac * 100.0, 2)
+            # seq breaks timestamp ties in favour of the later line (and keeps dicts out of comparisons).
+            append((_sort_key(row), key_fn(row), _str(row.get(ts_field, "")), seq, row))
+
+        # One sort orders rows for display and groups each key's rows oldest -> newest,
+        # so keeping the last row of every run of equal keys dedupes in a single pass.
+        decorated.sort()
+        out: List[Row] = []
+        n = len(decorated)
+        for i, (_, k, _, _, row) in enumerate(decorated):
+            if i + 1 == n or decorated[i + 1][1] != k:
+                out.append(row)
+        return out
+
+    def _index(self, rows: List[Row]) -> Dict[tuple, int]:
+        key_fn = self.key_fn
+        return {key_fn(row): i for i, row in enumerate(rows)}
+
+    def _upsert_row(self, rows: List[Row], index: Dict[tuple, int], row: Row) -> None:
+        """
+        Replace `row` in place or append it, keeping `index` in sync; O(1) per write.
+        Display order is restored lazily by _display_rows().
+        """
+        k = self.key_fn(row)
+        i = index.get(k)
+        if i is None:
+            index[k] = len(rows)
+            rows.append(row)
+        else:
+            rows[i] = row
+
+    def _display_rows(self) -> List[Row]:
+        """
+        The cached rows sorted for display (memoized per snapshot; mostly-sorted input, so
+        the sort after a batch of writes is close to linear).
+        """
+        self._load_indexed()
+        snap = self._cache
+        if snap is None:
+            return []
+        if snap.display is None:
+            snap.display = sorted(snap.rows, key=_sort_key)
+        return snap.display
+
+    def _rewrite(self, rows: List[Row]) -> None:
+        # Any order: reloads sort and dedupe.
+        _atomic_write(self.path, b"".join(_dumps(r) + b"\n" for r in rows))
+
+    def _migrate_legacy(self) -> None:
+        # Checked once per process; keeps the per-load cost at a single stat().
+        legacy = self.legacy_path
+        if legacy is None or self._legacy_checked:
+            return
+        self._legacy_checked = True
+        if self.path.exists() or not legacy.exists():
+            return
+        rows = _loads(legacy.read_bytes())
+        self._rewrite(self._normalize_rows(rows if isinstance(rows, list) else []))
+        legacy.unlink()
+
+    def _stat_sig(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load_indexed(self) -> Tuple[List[Row], Dict[tuple, int], int]:
+        """
+        Returns the cached (rows, index, line_count), re-parsing the store only if it changed on disk.
+        The returned rows/index are the live cache: writers mutate them in place, load() copies.
+        """
+        self._migrate_legacy()
+        sig = self._stat_sig()
+        cached = self._cache
+        if cached is not None and cached.sig == sig:
+            return cached.rows, cached.index, cached.line_count
+        if sig is None or sig[1] == 0:
+            # Missing or empty (first run): nothing to parse.
+            raw, line_count = [], 0
+        else:
+            raw, line_count = _parse_lines(self.path, sig[1])
+        rows = self._normalize_rows(raw)
+        index = self._index(rows)
+        # Unflushed local writes stay visible across an external change to the file.
+        for row in self._pending:
+            self._upsert_row(rows, index, row)
+        self._cache = _Snapshot(sig, rows, index, line_count)
+        return rows, index, line_count
+
+    def _load_for_write(self) -> Tuple[List[Row], Dict[tuple, int], int]:
+        try:
+            return self._load_indexed()
+        except (OSError, ValueError):
+            return [], {}, 0
+
+    def _commit_row(self, rows: List[Row], index: Dict[tuple, int], line_count: int, row: Row, flush: bool) -> None:
+        """
+        Queue `row` (already upserted into `rows`) for the log and write the queue out if due.
+        """
+        self._pending.append(row)
+        if flush or len(self._pending) >= self.batch_size:
+            self._write_pending(rows, index, line_count)
+        else:
+            sig = self._cache.sig if self._cache is not None else self._stat_sig()
+            self._cache = _Snapshot(sig, rows, index, line_count)
+
+    def _write_pending(self, rows: List[Row], index: Dict[tuple, int], line_count: int) -> None:
+        """
+        Append all pending rows in one write, compacting instead when the log gets stale.
+        """
+        pending = self._pending
+        line_count += len(pending)
+        if line_count > self.compact_ratio * len(rows):
+            self._rewrite(rows)
+            line_count = len(rows)
+        else:
+            with open(self.path, "ab") as f:
+                f.write(b"".join(_dumps(r) + b"\n" for r in pending))
+        pending.clear()
+        self._cache = _Snapshot(self._stat_sig(), rows, index, line_count)
+
+    # ---- public API ----
+
+    def load(self) -> List[Row]:
+        try:
+            # Shallow copy: callers may reorder/replace rows, but never mutate them in place.
+            return list(self._display_rows())
+        except (OSError, ValueError):
+            return []
+
+    def load_table(self) -> Any:
+        """
+        Rows as a pyarrow.Table, memoized until the store changes (on disk or via a write).
+        """
+        try:
+            rows = self._display_rows()
+        except (OSError, ValueError):
+            return _rows_to_table([])
+        snap = self._cache
+        if snap is None:
+            return _rows_to_table([])
+        if snap.table is None:
+            snap.table = _rows_to_table(rows)
+        return snap.table
+
+    def upsert(self, row: Row, *, flush: bool = True) -> Row:
+        """
+        Upsert `row` by key_fn(row). `preserve_fields` are carried over from an existing row.
+        Returns `row` (updated in place with any preserved fields).
+
+        With flush=False the row is visible to load() immediately but only written out
+        after `batch_size` pending rows or an explicit flush().
+        """
+        rows, index, line_count = self._load_for_write()
+        i = index.get(self.key_fn(row))
+        if i is not None:
+            existing = rows[i]
+            for field in self.preserve_fields:
+                if field in existing:
+                    row[field] = existing[field]
+        normalized = _normalize_row(row)
+        self._upsert_row(rows, index, normalized)
+        self._commit_row(rows, index, line_count, normalized, flush)
+        return row
+
+    def set_field(self, key: tuple, field: str, value: Any, *, flush: bool = True) -> Optional[Row]:
+        """
+        Update one field on an existing row (and stamp timestamp_field). Returns None if absent.
+        """
+        rows, index, line_count = self._load_for_write()
+        i = index.get(key)
+        if i is None:
+            return None
+        row = dict(rows[i])
+        row[field] = value
+        row[self.timestamp_field] = now_iso()
+        rows[i] = row
+        self._commit_row(rows, index, line_count, row, flush)
+        return row
+
+    def flush(self) -> None:
+        """
+        Write out rows queued by upsert(..., flush=False).
+        """
+        if not self._pending:
+            return
+        rows, index, line_count = self._load_for_write()
+        self._write_pending(rows, index, line_count)
+
+    def clear(self) -> None:
+        self._cache = None
+        self._pending.clear()
+        for path in (self.path, self.legacy_path):
+            if path is not None and path.exists():
+                path.unlink()
@@ -0,0 +1,19 @@
+"""
+Shared id normalization for the mock DB lookups.
+
+SKU / location / customer ids arrive in mixed case with stray whitespace; lookups use the
+stripped uppercase form. The same few ids flow through every tool call, so results are memoized.
+Results are interned: the stored ids are identifier-like literals (interned by CPython), so
+normalized ids hit the identity fast path when probing the mock tables.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from sys import intern
+from typing import Optional
+
+
+@lru_cache(maxsize=2048)
+def _norm(value: Optional[str]) -> str:
+    return intern((value or "").strip().upper())
@@ -0,0 +1,194 @@
+"""
+SQLite backend for the consensus mock DB stores (opt-in).
+
+Same interface as JsonKVStore, but rows live in one table per store with a unique
+index on (sku_id, customer_id, location_id, as_of_date), so upserts and status updates
+are single indexed statements instead of log appends + in-memory dedupe. Stores on the
+same file share one connection, and every write commits before the call returns.
+
+Enable with DBMOCK_BACKEND=sqlite. Rows are kept as JSON text (the schema is open-ended);
+only the key columns are real columns.
+"""
+
+from __future__ import annotations
+
+import atexit
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ._jsonstore import KeyFn, Row, _dumps, _loads, _normalize_row, _rows_to_table, now_iso
+
+
+# One connection + lock per database file: the consensus and approved stores share
+# consensus.db, and separate connections would make one store's write wait on (and
+# time out against) the other's.
+_CONNECTIONS: Dict[Path, Tuple[sqlite3.Connection, threading.RLock]] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _shared_connection(path: Path) -> Tuple[sqlite3.Connection, threading.RLock]:
+    key = path.resolve()
+    with _CONNECTIONS_LOCK:
+        shared = _CONNECTIONS.get(key)
+        if shared is None:
+            conn = sqlite3.connect(key, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Streamlit reruns scripts on worker threads; the lock serializes them.
+            shared = _CONNECTIONS[key] = (conn, threading.RLock())
+        return shared
+
+
+class SqliteKVStore:
+    """
+    - path: the sqlite database file (shared by several stores)
+    - table: table name for this store
+    - key_fn: row -> (sku_id, customer_id, location_id, as_of_date)
+    - timestamp_field: stamped by set_field
+    - preserve_fields: fields copied from the existing row on upsert (e.g. created_at)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        table: str,
+        key_fn: KeyFn,
+        timestamp_field: str,
+        *,
+        preserve_fields: Iterable[str] = (),
+        batch_size: int = 256,
+    ) -> None:
+        self.path = path
+        self.table = table
+        self.key_fn = key_fn
+        self.timestamp_field = timestamp_field
+        self.preserve_fields = tuple(preserve_fields)
+        # Unflushed upserts (flush=False) are written in one transaction once this many are pending.
+        self.batch_size = batch_size
+        # key -> row queued by upsert(..., flush=False); no transaction stays open between calls.
+        self._pending: Dict[tuple, Row] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock: Optional[threading.RLock] = None
+        atexit.register(self.flush)
+
+    def _connect(self) -> Tuple[sqlite3.Connection, threading.RLock]:
+        if self._conn is None or self._lock is None:
+            conn, lock = _shared_connection(self.path)
+            with lock:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                    "sku_id TEXT NOT NULL, customer_id TEXT NOT NULL, location_id TEXT NOT NULL, "
+                    "as_of_date TEXT NOT NULL, row TEXT NOT NULL)"
+                )
+                conn.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {self.table}_key "
+                    f"ON {self.table}(sku_id, customer_id, location_id, as_of_date)"
+                )
+            self._conn, self._lock = conn, lock
+        return self._conn, self._lock
+
+    def _get(self, conn: sqlite3.Connection, key: tuple) -> Optional[Row]:
+        pending = self._pending.get(key)
+        if pending is not None:
+            return pending
+        hit = conn.execute(
+            f"SELECT row FROM {self.table} "
+            "WHERE sku_id = ? AND customer_id = ? AND location_id = ? AND as_of_date = ?",
+            key,
+        ).fetchone()
+        return _loads(hit[0]) if hit is not None else None
+
+    def _write_pending(self, conn: sqlite3.Connection) -> None:
+        # Caller holds the lock. One short transaction per batch.
+        if not self._pending:
+            return
+        params = [(*key, _dumps(row).decode("utf-8")) for key, row in self._pending.items()]
+        with conn:
+            conn.execute("BEGIN")
+            conn.executemany(
+                f"INSERT INTO {self.table} (sku_id, customer_id, location_id, as_of_date, row) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(sku_id, customer_id, location_id, as_of_date) DO UPDATE SET row = excluded.row",
+                params,
+            )
+        self._pending.clear()
+
+    # ---- public API ----
+
+    def load(self) -> List[Row]:
+        try:
+            conn, lock = self._connect()
+            with lock:
+                self._write_pending(conn)
+                cur = conn.execute(
+                    f"SELECT row FROM {self.table} ORDER BY as_of_date, location_id, customer_id, sku_id"
+                )
+                return [_loads(r[0]) for r in cur]
+        except (sqlite3.Error, ValueError):
+            return []
+
+    def load_table(self) -> Any:
+        """
+        Rows as a pyarrow.Table (rebuilt per call; the indexed SELECT is already cheap).
+        """
+        return _rows_to_table(self.load())
+
+    def upsert(self, row: Row, *, flush: bool = True) -> Row:
+        """
+        Upsert `row` by key_fn(row). `preserve_fields` are carried over from an existing row.
+        Returns `row` (updated in place with any preserved fields).
+
+        With flush=False the row is queued in memory (visible to load()) and written with
+        the rest of the batch after `batch_size` pending rows or an explicit flush().
+        """
+        key = tuple(str(k) for k in self.key_fn(row))
+        conn, lock = self._connect()
+        with lock:
+            if self.preserve_fields:
+                existing = self._get(conn, key)
+                if existing is not None:
+                    for field in self.preserve_fields:
+                        if field in existing:
+                            row[field] = existing[field]
+            self._pending[key] = _normalize_row(row)
+            if flush or len(self._pending) >= self.batch_size:
+                self._write_pending(conn)
+        return row
+
+    def set_field(self, key: tuple, field: str, value: Any, *, flush: bool = True) -> Optional[Row]:
+        """
+        Update one field on an existing row (and stamp timestamp_field). Returns None if absent.
+        """
+        conn, lock = self._connect()
+        with lock:
+            existing = self._get(conn, key)
+            if existing is None:
+                return None
+            row = dict(existing)
+            row[field] = value
+            row[self.timestamp_field] = now_iso()
+            self._pending[key] = row
+            if flush or len(self._pending) >= self.batch_size:
+                self._write_pending(conn)
+        return row
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        conn, lock = self._connect()
+        with lock:
+            self._write_pending(conn)
+
+    def clear(self) -> None:
+        conn, lock = self._connect()
+        with lock:
+            self._pending.clear()
+            conn.execute(f"DELETE FROM {self.table}")
+
+    def export_jsonl(self, path: Path) -> None:
+        """
+        Write all rows (display order) as JSON Lines, e.g. for inspection or the JSONL backend.
+        """
+        path.write_bytes(b"".join(_dumps(r) + b"\n" for r in self.load()))
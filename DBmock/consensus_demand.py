@@ -1,7 +1,7 @@
 """
 Consensus demand store (mock DB) for ALL planned forecasts (not just approved).
 
-This persists to a JSON file so Streamlit can show a table of:
+This persists to a JSON Lines file so Streamlit can show a table of:
 - planned forecasts
 - whether approval route was taken
 - approval status (pending/approved/rejected/not_required)
@@ -9,17 +9,18 @@ This persists to a JSON file so Streamlit can show a table of:
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ._jsonstore import JsonKVStore, now_iso
 
-_STORE_PATH = Path(__file__).resolve().parent / "consensus_demand_store.json"
 
-
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+_STORE_PATH = Path(__file__).resolve().parent / "consensus_demand_store.jsonl"
+# Pre-JSONL stores were a single pretty-printed JSON array; imported once on first load.
+_LEGACY_PATH = _STORE_PATH.with_suffix(".json")
+# Used instead of the JSONL file when DBMOCK_BACKEND=sqlite.
+_DB_PATH = Path(__file__).resolve().parent / "consensus.db"
 
 
 def _key(row: Dict[str, Any]) -> tuple[str, str, str, str]:
@@ -31,73 +32,46 @@ def _key(row: Dict[str, Any]) -> tuple[str, str, str, str]:
     )
 
 
+# Dedupe keeps the latest updated_at; created_at survives upserts.
+if os.getenv("DBMOCK_BACKEND", "jsonl").lower() == "sqlite":
+    from ._sqlite import SqliteKVStore
+
+    CONSENSUS_STORE = SqliteKVStore(
+        _DB_PATH, "consensus_demand", _key, "updated_at", preserve_fields=("created_at",)
+    )
+else:
+    CONSENSUS_STORE = JsonKVStore(
+        _STORE_PATH,
+        _key,
+        "updated_at",
+        legacy_path=_LEGACY_PATH,
+        preserve_fields=("created_at",),
+    )
+
+
 def load_consensus_demands() -> List[Dict[str, Any]]:
-    if not _STORE_PATH.exists():
-        return []
-    try:
-        rows = json.loads(_STORE_PATH.read_text())
-        if not isinstance(rows, list):
-            return []
-
-        # Normalize: if percent stored as fraction, fix it.
-        normalized: List[Dict[str, Any]] = []
-        for r in rows:
-            row = dict(r)
-            tbp = row.get("total_boost_percent")
-            tbf = row.get("total_boost_fraction")
-            if tbf is None and isinstance(tbp, (int, float)) and -1.0 <= float(tbp) <= 1.0:
-                frac = float(tbp)
-                row["total_boost_fraction"] = frac
-                row["total_boost_percent"] = round(frac * 100.0, 2)
-            normalized.append(row)
-
-        # Dedupe by key keeping latest updated_at
-        latest: Dict[tuple[str, str, str, str], Dict[str, Any]] = {}
-        for row in normalized:
-            k = _key(row)
-            existing = latest.get(k)
-            if existing is None:
-                latest[k] = row
-                continue
-            if str(row.get("updated_at", "")) >= str(existing.get("updated_at", "")):
-                latest[k] = row
-
-        return sorted(
-            latest.values(),
-            key=lambda x: (
-                str(x.get("as_of_date", "")),
-                str(x.get("location_id", "")),
-                str(x.get("customer_id", "")),
-                str(x.get("sku_id", "")),
-            ),
-        )
-    except Exception:
-        return []
-
-
-def upsert_consensus_demand(record: Dict[str, Any]) -> Dict[str, Any]:
+    return CONSENSUS_STORE.load()
+
+
+def load_consensus_demands_table() -> Any:
     """
-    Upsert a record by (sku_id, customer_id, location_id, as_of_date).
+    Same rows as load_consensus_demands(), as a pyarrow.Table cached until the store changes.
+    Pass straight to st.dataframe to skip the dict -> Arrow conversion on every rerun.
     """
-    rows = load_consensus_demands()
-    row = dict(record)
-    row.setdefault("created_at", _now_iso())
-    row["updated_at"] = _now_iso()
+    return CONSENSUS_STORE.load_table()
 
-    k = _key(row)
-    replaced = False
-    for i, existing in enumerate(rows):
-        if _key(existing) == k:
-            # preserve created_at if present
-            row["created_at"] = existing.get("created_at", row["created_at"])
-            rows[i] = row
-            replaced = True
-            break
-    if not replaced:
-        rows.append(row)
 
-    _STORE_PATH.write_text(json.dumps(rows, indent=2))
-    return row
+def upsert_consensus_demand(record: Dict[str, Any], *, flush: bool = True) -> Dict[str, Any]:
+    """
+    Upsert a record by (sku_id, customer_id, location_id, as_of_date).
+
+    Bulk callers can pass flush=False and call flush_consensus_demands() once at the end.
+    """
+    row = dict(record)
+    now = now_iso()
+    row.setdefault("created_at", now)
+    row["updated_at"] = now
+    return CONSENSUS_STORE.upsert(row, flush=flush)
 
 
 def set_consensus_approval_status(
@@ -111,25 +85,14 @@ def set_consensus_approval_status(
     """
     Update only the approval_status field for an existing record.
     """
-    rows = load_consensus_demands()
-    target_key = (sku_id, customer_id, location_id, as_of_date)
-    updated_row: Optional[Dict[str, Any]] = None
-    for i, row in enumerate(rows):
-        if _key(row) == target_key:
-            row = dict(row)
-            row["approval_status"] = approval_status
-            row["updated_at"] = _now_iso()
-            rows[i] = row
-            updated_row = row
-            break
-    if updated_row is None:
-        return None
-    _STORE_PATH.write_text(json.dumps(rows, indent=2))
-    return updated_row
+    return CONSENSUS_STORE.set_field(
+        (sku_id, customer_id, location_id, as_of_date), "approval_status", approval_status
+    )
 
 
-def clear_consensus_demands() -> None:
-    if _STORE_PATH.exists():
-        _STORE_PATH.unlink()
+def flush_consensus_demands() -> None:
+    CONSENSUS_STORE.flush()
 
 
+def clear_consensus_demands() -> None:
+    CONSENSUS_STORE.clear()
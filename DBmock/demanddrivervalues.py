@@ -8,7 +8,13 @@ Key requirement:
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple
+import functools
+import re
+import sys
+from collections import namedtuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 DEFAULT_AS_OF_DATE = "2026-01-01"
 CASE_2_AS_OF_DATE = "2026-01-02"
@@ -514,17 +520,194 @@ MOCK_DEMAND_DRIVER_SCENARIO: Dict[Tuple[str, str, str, str], str] = {
 }
 
 
+def _intern_keys(table: Dict[Tuple[str, str, str, str], Dict[str, Any]]) -> None:
+    for k, row in table.items():
+        table[k] = {sys.intern(name): v for name, v in row.items()}
+
+
+# Driver names are interned so lookups by names coming from other modules (e.g. the driver
+# catalog's driver_name strings) hit the identity fast path in dict probes.
+_intern_keys(MOCK_DEMAND_DRIVER_VALUES)
+_intern_keys(MOCK_DEMAND_DRIVER_NOTES)
+
+# Every driver name seen in the values table, in first-seen (catalog) order.
+_DRIVER_NAMES: Tuple[str, ...] = tuple(
+    dict.fromkeys(name for row in MOCK_DEMAND_DRIVER_VALUES.values() for name in row)
+)
+
+
+def _attr_name(driver_name: str) -> str:
+    # "Campaign Click-Through-Rate (CTR)" -> "campaign_click_through_rate_ctr"
+    return re.sub(r"[^0-9A-Za-z]+", "_", driver_name).strip("_").lower()
+
+
+_NAME_TO_ATTR: Dict[str, str] = {name: _attr_name(name) for name in _DRIVER_NAMES}
+assert len(set(_NAME_TO_ATTR.values())) == len(_NAME_TO_ATTR), "driver names must map to unique attributes"
+
+# Fixed-layout row for single-driver reads; drivers absent from a context default to None
+# (the dict views keep absent drivers absent).
+DriverRow = namedtuple("DriverRow", tuple(_NAME_TO_ATTR.values()), defaults=(None,) * len(_NAME_TO_ATTR))
+
+
+def _driver_row(values: Dict[str, Any]) -> Any:
+    attr = _NAME_TO_ATTR.get
+    return DriverRow(**{a: v for a, v in ((attr(n), v) for n, v in values.items()) if a is not None})
+
+
+@dataclass(frozen=True, slots=True)
+class Record:
+    """
+    Everything mocked for one (SKU_ID, CUSTOMER_ID, LOCATION_ID, AS_OF_DATE) context.
+    """
+
+    values: Dict[str, Any] = field(default_factory=dict)
+    notes: Dict[str, str] = field(default_factory=dict)
+    scenario: Optional[str] = None
+    # DriverRow built from `values`, or None when the context has no values row.
+    row: Any = None
+
+
+def _build_table() -> Dict[Tuple[str, str, str, str], Record]:
+    keys = dict.fromkeys(MOCK_DEMAND_DRIVER_VALUES)
+    keys.update(dict.fromkeys(MOCK_DEMAND_DRIVER_NOTES))
+    keys.update(dict.fromkeys(MOCK_DEMAND_DRIVER_SCENARIO))
+    return {
+        k: Record(
+            values=MOCK_DEMAND_DRIVER_VALUES.get(k, {}),
+            notes=MOCK_DEMAND_DRIVER_NOTES.get(k, {}),
+            scenario=MOCK_DEMAND_DRIVER_SCENARIO.get(k),
+            row=_driver_row(MOCK_DEMAND_DRIVER_VALUES[k]) if k in MOCK_DEMAND_DRIVER_VALUES else None,
+        )
+        for k in keys
+    }
+
+
+# One hash probe serves values, notes and scenario. Records alias (not copy) the MOCK_* dicts above.
+MOCK_TABLE: Dict[Tuple[str, str, str, str], Record] = _build_table()
+
+# Stored ids are uppercase, so callers passing canonical ids can skip .upper().
+assert all(k[0].isupper() and k[1].isupper() and k[2].isupper() for k in MOCK_TABLE)
+
+_EMPTY_PROXY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _canonical_key(sku_id: str, customer_id: str, location_id: str, as_of_date: str) -> Tuple[str, str, str, str]:
+    key = (sku_id, customer_id, location_id, as_of_date)
+    if key in MOCK_TABLE:
+        return key
+    return (sku_id.upper(), customer_id.upper(), location_id.upper(), as_of_date)
+
+
+# Read-only views built once per context; accessors hand these out instead of copying rows.
+# Mutating a returned view raises TypeError; use get_demand_driver_values_mutable() for a dict.
+_FROZEN_VALUES: Dict[Tuple[str, str, str, str], Mapping[str, Any]] = {}
+_FROZEN_NOTES: Dict[Tuple[str, str, str, str], Mapping[str, str]] = {}
+
+
+def _freeze() -> None:
+    _FROZEN_VALUES.clear()
+    _FROZEN_NOTES.clear()
+    for k, rec in MOCK_TABLE.items():
+        _FROZEN_VALUES[k] = MappingProxyType(rec.values)
+        _FROZEN_NOTES[k] = MappingProxyType(rec.notes)
+
+
+_freeze()
+
+
+@functools.lru_cache(maxsize=1)
+def _driver_matrix() -> Tuple[Tuple[Tuple[str, str, str, str], ...], Dict[str, int], Any]:
+    """
+    Columnar float64 view of MOCK_DEMAND_DRIVER_VALUES, built on first use.
+
+    Returns (row_keys, column_index, matrix) where matrix[i, column_index[name]] is the value for
+    row_keys[i]. Booleans become 1.0/0.0; missing or non-numeric values are NaN. float64 keeps the
+    mocked values exact (float32 would round e.g. 0.021).
+    """
+    import numpy as np
+
+    row_keys = tuple(MOCK_DEMAND_DRIVER_VALUES)
+    col_index = {name: j for j, name in enumerate(_DRIVER_NAMES)}
+    matrix = np.full((len(row_keys), len(_DRIVER_NAMES)), np.nan, dtype=np.float64)
+    for i, key in enumerate(row_keys):
+        for name, v in MOCK_DEMAND_DRIVER_VALUES[key].items():
+            if isinstance(v, (int, float)):
+                matrix[i, col_index[name]] = float(v)
+    matrix.setflags(write=False)
+    return row_keys, col_index, matrix
+
+
+def get_driver_row_keys() -> Tuple[Tuple[str, str, str, str], ...]:
+    """
+    (SKU_ID, CUSTOMER_ID, LOCATION_ID, AS_OF_DATE) for each position of get_driver_column().
+    """
+    return _driver_matrix()[0]
+
+
+def get_driver_column(driver_name: str) -> Any:
+    """
+    Read-only float64 numpy array of one driver across all mocked contexts (see get_driver_row_keys()).
+    A zero-copy column slice, for vectorized scans/aggregations. Raises KeyError for unknown drivers.
+    """
+    _, col_index, matrix = _driver_matrix()
+    return matrix[:, col_index[driver_name]]
+
+
+def clear_demand_driver_cache() -> None:
+    """
+    Rebuild derived lookups (e.g. after adding contexts to the MOCK_* dicts in a test or notebook).
+    """
+    MOCK_TABLE.clear()
+    MOCK_TABLE.update(_build_table())
+    _freeze()
+    _driver_matrix.cache_clear()
+
+
 def get_demand_driver_values(
     sku_id: str,
     customer_id: str,
     location_id: str,
     as_of_date: str = DEFAULT_AS_OF_DATE,
+) -> Mapping[str, Any]:
+    """
+    Returns a read-only {driver_name: value} mapping for the given context.
+    Use get_demand_driver_values_mutable() if you need a dict you can modify.
+    """
+    key = _canonical_key(sku_id, customer_id, location_id, as_of_date)
+    return _FROZEN_VALUES.get(key, _EMPTY_PROXY)
+
+
+def get_demand_driver_values_many(
+    keys: Iterable[Tuple[str, str, str, str]],
+) -> List[Mapping[str, Any]]:
+    """
+    Batched get_demand_driver_values() for (sku_id, customer_id, location_id, as_of_date) keys.
+    Results are in input order; unknown contexts map to an empty mapping. Worth it from ~8 keys up,
+    where the per-call overhead of the single-key accessor starts to dominate.
+    """
+    get = _FROZEN_VALUES.get
+    table = MOCK_TABLE
+    out: List[Mapping[str, Any]] = []
+    append = out.append
+    for key in keys:
+        key = tuple(key)
+        if key not in table:
+            sku_id, customer_id, location_id, as_of_date = key
+            key = (sku_id.upper(), customer_id.upper(), location_id.upper(), as_of_date)
+        append(get(key, _EMPTY_PROXY))
+    return out
+
+
+def get_demand_driver_values_mutable(
+    sku_id: str,
+    customer_id: str,
+    location_id: str,
+    as_of_date: str = DEFAULT_AS_OF_DATE,
 ) -> Dict[str, Any]:
     """
-    Returns a {driver_name: value} mapping for the given context.
+    Same as get_demand_driver_values(), as a fresh dict.
     """
-    key = (sku_id.upper(), customer_id.upper(), location_id.upper(), as_of_date)
-    return dict(MOCK_DEMAND_DRIVER_VALUES.get(key, {}))
+    return dict(get_demand_driver_values(sku_id, customer_id, location_id, as_of_date))
 
 
 def get_demand_driver_notes(
@@ -532,13 +715,13 @@ def get_demand_driver_notes(
     customer_id: str,
     location_id: str,
     as_of_date: str = DEFAULT_AS_OF_DATE,
-) -> Dict[str, str]:
+) -> Mapping[str, str]:
     """
-    Returns {driver_name: short_note} for the given context/date.
+    Returns read-only {driver_name: short_note} for the given context/date.
     Notes are optional; missing drivers simply won't have a note.
     """
-    key = (sku_id.upper(), customer_id.upper(), location_id.upper(), as_of_date)
-    return dict(MOCK_DEMAND_DRIVER_NOTES.get(key, {}))
+    key = _canonical_key(sku_id, customer_id, location_id, as_of_date)
+    return _FROZEN_NOTES.get(key, _EMPTY_PROXY)
 
 
 def get_demand_driver_scenario(
@@ -550,8 +733,8 @@ def get_demand_driver_scenario(
     """
     Returns scenario label like BASE/BULLISH/BEARISH (if available).
     """
-    key = (sku_id.upper(), customer_id.upper(), location_id.upper(), as_of_date)
-    return MOCK_DEMAND_DRIVER_SCENARIO.get(key)
+    rec = MOCK_TABLE.get(_canonical_key(sku_id, customer_id, location_id, as_of_date))
+    return rec.scenario if rec is not None else None
 
 
 def get_demand_driver_value(
@@ -564,12 +747,12 @@ def get_demand_driver_value(
     """
     Convenience accessor for one driver value.
     """
-    values = get_demand_driver_values(
-        sku_id=sku_id,
-        customer_id=customer_id,
-        location_id=location_id,
-        as_of_date=as_of_date,
-    )
-    return values.get(driver_name)
+    rec = MOCK_TABLE.get(_canonical_key(sku_id, customer_id, location_id, as_of_date))
+    if rec is None:
+        return None
+    attr = _NAME_TO_ATTR.get(driver_name)
+    if attr is None or rec.row is None:
+        return rec.values.get(driver_name)
+    return getattr(rec.row, attr)
 
 
@@ -0,0 +1,37 @@
+"""
+Print the consensus mock DB stores as indented JSON for inspection/diffing.
+
+The stores are written compactly (one JSON object per line); this reads them through the
+normal load path (deduped, normalized, display-sorted) and pretty-prints the result.
+
+Run:
+  venv/bin/python -m prototype2_demand_supply.DBmock.dump_pretty            # both stores
+  venv/bin/python -m prototype2_demand_supply.DBmock.dump_pretty consensus  # one store
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+
+from prototype2_demand_supply.DBmock.approved_consensus_demand import load_approved_consensus_demands
+from prototype2_demand_supply.DBmock.consensus_demand import load_consensus_demands
+
+
+_STORES = {
+    "consensus": load_consensus_demands,
+    "approved": load_approved_consensus_demands,
+}
+
+
+def main(argv: list[str]) -> None:
+    names = argv or list(_STORES)
+    unknown = [n for n in names if n not in _STORES]
+    if unknown:
+        raise SystemExit(f"Unknown store(s): {', '.join(unknown)}. Choose from: {', '.join(_STORES)}")
+    out = {name: _STORES[name]() for name in names}
+    print(json.dumps(out if len(names) > 1 else out[names[0]], indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
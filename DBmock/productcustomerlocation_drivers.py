@@ -1,448 +1,398 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from functools import cached_property
+from sys import intern
+from typing import Any, Dict, Iterable, Sequence, Tuple
 
+from ._norm import _norm
 
-def get_product_drivers(sku_id: str) -> List[Dict[str, Any]]:
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+    import json
+
+
+@dataclass(slots=True, frozen=True)
+class Driver:
     """
-    Returns the master list of applicable demand drivers for a product.
-    Drivers are organized into specific Real-Time categories.
+    One catalog entry. Slotted and frozen so the shared catalog tuple is safe to hand out.
+    """
+
+    category: str
+    driver_name: str
+    description: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"category": self.category, "driver_name": self.driver_name, "description": self.description}
+
+
+# Category labels, interned once and shared by every catalog entry.
+_CAT_STATISTICAL = intern("Statistical Demand Forecast")
+_CAT_SOCIAL = intern("Real Time Social Signals")
+_CAT_MARKETING = intern("Real Time Marketing Spend and Engagement Signals")
+_CAT_TRADE_PROMO = intern("Real Time Trade Promo Signals")
+_CAT_DIGITAL_SHELF = intern("Real Time Digital Shelf Analytics Signals")
+_CAT_WEATHER = intern("Real Time Weather/Environment Signals")
+_CAT_COMPETITOR = intern("Real Time Competitor Data")
+_CAT_POS = intern("Real Time POS Data & Open Orders")
+
+
+# 1. Consensus Demand Forecast Drivers
+_CONSENSUS_DEMAND_DRIVERS: Tuple[Driver, ...] = (
+    Driver(
+        category=_CAT_STATISTICAL,
+        driver_name="Statistical Baseline Forecast",
+        description=(
+            "The base volume predicted by internal time-series algorithms (ARIMA/Prophet) "
+            "using 3-year historical sales data."
+        ),
+    ),
+)
+
+# 2. Real Time Social Signals
+_SOCIAL_SIGNALS_DRIVERS: Tuple[Driver, ...] = (
+    Driver(
+        category=_CAT_SOCIAL,
+        driver_name="Ingredient Trend Velocity",
+        description=(
+            "Rate of change in search volume for key active ingredients "
+            "(e.g., 'Hyaluronic', 'Sulphate-Free')."
+        ),
+    ),
+    Driver(
+        category=_CAT_SOCIAL,
+        driver_name="Brand Sentiment Score",
+        description=(
+            "Net Promoter Score (NPS) derived from real-time sentiment analysis of "
+            "Twitter, Reddit, and Instagram comments."
+        ),
+    ),
+    Driver(
+        category=_CAT_SOCIAL,
+        driver_name="Viral Hashtag Volume",
+        description=(
+            "Frequency of brand-adjacent hashtags (e.g., #GlassSkin, #HairGoals) "
+            "appearing in top 100 trending topics."
+        ),
+    ),
+    Driver(
+        category=_CAT_SOCIAL,
+        driver_name="Influencer Mention Count",
+        description=(
+            "Number of unique mentions by Tier-1 and Tier-2 beauty influencers in the last 24 hours."
+        ),
+    ),
+)
+
+# 3. Real Time Marketing Spend and Engagement Signals
+_MARKETING_SPEND_DRIVERS: Tuple[Driver, ...] = (
+    Driver(
+        category=_CAT_MARKETING,
+        driver_name="Performance Marketing Spend",
+        description="Daily ad spend burn rate on Meta (Instagram/Facebook) and Google Ads for this SKU.",
+    ),
+    Driver(
+        category=_CAT_MARKETING,
+        driver_name="Campaign Click-Through-Rate (CTR)",
+        description=(
+            "Real-time efficiency metric of active digital ads; higher CTR indicates higher immediate "
+            "purchase intent."
+        ),
+    ),
+    Driver(
+        category=_CAT_MARKETING,
+        driver_name="Video Completion Rate",
+        description="Percentage of users watching full brand ads on YouTube/Reels; proxy for brand consideration.",
+    ),
+    Driver(
+        category=_CAT_MARKETING,
+        driver_name="Retargeting Pool Size",
+        description="Size of the audience who visited the product page but didn't buy, now being retargeted.",
+    ),
+)
+
+# 4. Real Time Trade Promo Signals
+_TRADE_PROMO_DRIVERS: Tuple[Driver, ...] = (
+    Driver(
+        category=_CAT_TRADE_PROMO,
+        driver_name="On-Platform Discount Depth",
+        description="Current percentage discount active on the retailer platform (e.g., Flat 20% Off).",
+    ),
+    Driver(
+        category=_CAT_TRADE_PROMO,
+        driver_name="Bundle Offer Active Status",
+        description="Flag indicating if the SKU is part of a 'Buy X Get Y' or 'Combo' pack promotion.",
+    ),
+    Driver(
+        category=_CAT_TRADE_PROMO,
+        driver_name="Flash Sale Participation",
+        description=(
+            "Whether the SKU is currently featured in a time-bound 'Lightning Deal' or 'Rush Hour' slot."
+        ),
+    ),
+    Driver(
+        category=_CAT_TRADE_PROMO,
+        driver_name="Cart-Level Offer Conversion",
+        description="Conversion rate uplift attributed to coupons applied at the checkout stage.",
+    ),
+)
+
+# 5. Real Time Digital Shelf Analytics Signals
+_DIGITAL_SHELF_DRIVERS: Tuple[Driver, ...] = (
+    Driver(
+        category=_CAT_DIGITAL_SHELF,
+        driver_name="Share of Search (Keyword Rank)",
+        description=(
+            "The organic ranking of the SKU when a user searches generic terms like 'Face Wash' or 'Shampoo'."
+        ),
+    ),
+    Driver(
+        category=_CAT_DIGITAL_SHELF,
+        driver_name="Product Detail Page (PDP) Views",
+        description="Traffic volume landing specifically on the product page in the last 24 hours.",
+    ),
+    Driver(
+        category=_CAT_DIGITAL_SHELF,
+        driver_name="Buy Box Win Rate",
+        description=(
+            "Percentage of time our seller account owns the 'Add to Cart' button vs. third-party sellers."
+        ),
+    ),
+    Driver(
+        category=_CAT_DIGITAL_SHELF,
+        driver_name="Rating & Review Velocity",
+        description="Number of new reviews added in the last 48 hours; high velocity often precedes a sales spike.",
+    ),
+)
+
+# 6. Real Time Weather/Environment Signals
+_WEATHER_ENVIRONMENT_DRIVERS: Tuple[Driver, ...] = (
+    Driver(
+        category=_CAT_WEATHER,
+        driver_name="Max Temperature Forecast",
+        description=(
+            "Predicted maximum temperature for the next 3 days; critical for summer portfolio "
+            "(Deos, Talc, Light Gels)."
+        ),
+    ),
+    Driver(
+        category=_CAT_WEATHER,
+        driver_name="Humidity Index",
+        description="Moisture levels in the air; triggers demand for Frizz-Control Hair products.",
+    ),
+    Driver(
+        category=_CAT_WEATHER,
+        driver_name="UV Index",
+        description=(
+            "Intensity of ultraviolet radiation; direct correlation with Sunscreen and Light Gel sales."
+        ),
+    ),
+    Driver(
+        category=_CAT_WEATHER,
+        driver_name="Air Quality Index (AQI)",
+        description="Pollution levels; triggers demand for Deep Cleanse and Anti-Pollution skincare.",
+    ),
+)
+
+# 7. Real Time Competitor Data
+_COMPETITOR_DATA_DRIVERS: Tuple[Driver, ...] = (
+    Driver(
+        category=_CAT_COMPETITOR,
+        driver_name="Competitor Price Gap",
+        description="The monetary difference between our SKU and the nearest equivalent competitor SKU.",
+    ),
+    Driver(
+        category=_CAT_COMPETITOR,
+        driver_name="Competitor Out-of-Stock Status",
+        description=(
+            "Flag indicating if the main competitor SKU is currently unavailable, creating a switch opportunity."
+        ),
+    ),
+    Driver(
+        category=_CAT_COMPETITOR,
+        driver_name="Competitor Promo Intensity",
+        description=(
+            "Aggressiveness of competitor discounting (e.g., are they running a 50% off deep discount?)."
+        ),
+    ),
+    Driver(
+        category=_CAT_COMPETITOR,
+        driver_name="Competitor New Launch Signal",
+        description="Detection of a new competitive variant launching in the same category.",
+    ),
+)
+
+# 8. Real Time POS Data & Open Orders
+_POS_DATA_DRIVERS: Tuple[Driver, ...] = (
+    Driver(
+        category=_CAT_POS,
+        driver_name="Real-Time Sales Velocity",
+        description="Units sold per hour recorded at the Point of Sale (POS) in the last 6 hours.",
+    ),
+    Driver(
+        category=_CAT_POS,
+        driver_name="Inventory Days on Hand (DOH)",
+        description="Current stock level expressed in days of coverage based on current run-rate.",
+    ),
+    Driver(
+        category=_CAT_POS,
+        driver_name="Distributor Open Orders",
+        description="Volume of confirmed orders from distributors that are yet to be shipped.",
+    ),
+    Driver(
+        category=_CAT_POS,
+        driver_name="Stock-Out Incidents",
+        description="Count of instances where demand could not be fulfilled due to zero inventory.",
+    ),
+)
+
+# Combine all lists into one master configuration (built once at import).
+# Entries are frozen, so the single shared tuple can be handed to every caller.
+_ALL_BPC_DRIVERS: Tuple[Driver, ...] = (
+    *_CONSENSUS_DEMAND_DRIVERS,
+    *_SOCIAL_SIGNALS_DRIVERS,
+    *_MARKETING_SPEND_DRIVERS,
+    *_TRADE_PROMO_DRIVERS,
+    *_DIGITAL_SHELF_DRIVERS,
+    *_WEATHER_ENVIRONMENT_DRIVERS,
+    *_COMPETITOR_DATA_DRIVERS,
+    *_POS_DATA_DRIVERS,
+)
+
+# Intern driver names so value lookups (demanddrivervalues interns its row keys) compare by
+# identity. Descriptions are unique free text, so interning them would only grow the table.
+_ALL_BPC_DRIVERS = tuple(
+    Driver(intern(d.category), intern(d.driver_name), d.description) for d in _ALL_BPC_DRIVERS
+)
+
+# Map to Products. Every SKU references the one shared catalog tuple (never a per-SKU copy),
+# so memory stays flat as SKUs are added and callers must treat the result as read-only.
+_MOCK_DB: Dict[str, Tuple[Driver, ...]] = dict.fromkeys(
+    ("PONDS_SUPER_LIGHT_GEL_100G", "DOVE_HAIR_FALL_RESCUE_650ML"),
+    _ALL_BPC_DRIVERS,
+)
+assert all(drivers is _ALL_BPC_DRIVERS for drivers in _MOCK_DB.values())
+
+_EMPTY: Tuple[Driver, ...] = ()
+
+# Column views (one tuple per Driver field) for callers that only need a single field.
+_DRIVER_NAMES: Tuple[str, ...] = tuple(d.driver_name for d in _ALL_BPC_DRIVERS)
+_DRIVER_CATEGORIES: Tuple[str, ...] = tuple(d.category for d in _ALL_BPC_DRIVERS)
+_DRIVER_DESCRIPTIONS: Tuple[str, ...] = tuple(d.description for d in _ALL_BPC_DRIVERS)
+
+_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "driver_name": _DRIVER_NAMES,
+    "category": _DRIVER_CATEGORIES,
+    "description": _DRIVER_DESCRIPTIONS,
+}
+
+
+def _encode_json(obj: Any) -> bytes:
+    # Compact UTF-8 JSON; orjson when available, same bytes shape from the stdlib fallback.
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _build_json_index() -> Dict[str, bytes]:
+    # SKUs sharing one catalog tuple share one encoded blob.
+    encoded: Dict[int, bytes] = {}
+    out: Dict[str, bytes] = {}
+    for sku, drivers in _MOCK_DB.items():
+        if id(drivers) not in encoded:
+            encoded[id(drivers)] = _encode_json([d.as_dict() for d in drivers])
+        out[sku] = encoded[id(drivers)]
+    return out
+
+
+# Pre-encoded JSON (compact, UTF-8) of get_product_drivers() per SKU, for JSON API boundaries.
+_JSON_BY_SKU: Dict[str, bytes] = _build_json_index()
+
+_KNOWN_SKUS: frozenset = frozenset(_MOCK_DB)
+
+
+def _lookup(sku_id: str) -> Tuple[Driver, ...]:
+    # Callers usually pass canonical ids already; only normalize when the raw id misses.
+    if sku_id in _KNOWN_SKUS:
+        return _MOCK_DB[sku_id]
+    return _MOCK_DB.get(_norm(sku_id), _EMPTY)
+
+
+class _Catalog:
     """
+    Per-category views of the catalog, grouped on first access and then cached.
+    """
+
+    @cached_property
+    def by_category(self) -> Dict[str, Tuple[Driver, ...]]:
+        grouped: Dict[str, list] = {}
+        for d in _ALL_BPC_DRIVERS:
+            grouped.setdefault(d.category, []).append(d)
+        return {cat: tuple(ds) for cat, ds in grouped.items()}
 
-    sku_id = (sku_id or "").strip().upper()
-
-    # 1. Consensus Demand Forecast Drivers
-    consensus_demand_drivers = [
-        {
-            "category": "Statistical Demand Forecast",
-            "driver_name": "Statistical Baseline Forecast",
-            "description": (
-                "The base volume predicted by internal time-series algorithms (ARIMA/Prophet) "
-                "using 3-year historical sales data."
-            ),
-        },
-    ]
-
-    # 2. Real Time Social Signals
-    social_signals_drivers = [
-        {
-            "category": "Real Time Social Signals",
-            "driver_name": "Ingredient Trend Velocity",
-            "description": (
-                "Rate of change in search volume for key active ingredients "
-                "(e.g., 'Hyaluronic', 'Sulphate-Free')."
-            ),
-        },
-        {
-            "category": "Real Time Social Signals",
-            "driver_name": "Brand Sentiment Score",
-            "description": (
-                "Net Promoter Score (NPS) derived from real-time sentiment analysis of "
-                "Twitter, Reddit, and Instagram comments."
-            ),
-        },
-        {
-            "category": "Real Time Social Signals",
-            "driver_name": "Viral Hashtag Volume",
-            "description": (
-                "Frequency of brand-adjacent hashtags (e.g., #GlassSkin, #HairGoals) "
-                "appearing in top 100 trending topics."
-            ),
-        },
-        {
-            "category": "Real Time Social Signals",
-            "driver_name": "Influencer Mention Count",
-            "description": (
-                "Number of unique mentions by Tier-1 and Tier-2 beauty influencers in the last 24 hours."
-            ),
-        },
-    ]
-
-    # 3. Real Time Marketing Spend and Engagement Signals
-    marketing_spend_drivers = [
-        {
-            "category": "Real Time Marketing Spend and Engagement Signals",
-            "driver_name": "Performance Marketing Spend",
-            "description": "Daily ad spend burn rate on Meta (Instagram/Facebook) and Google Ads for this SKU.",
-        },
-        {
-            "category": "Real Time Marketing Spend and Engagement Signals",
-            "driver_name": "Campaign Click-Through-Rate (CTR)",
-            "description": (
-                "Real-time efficiency metric of active digital ads; higher CTR indicates higher immediate "
-                "purchase intent."
-            ),
-        },
-        {
-            "category": "Real Time Marketing Spend and Engagement Signals",
-            "driver_name": "Video Completion Rate",
-            "description": "Percentage of users watching full brand ads on YouTube/Reels; proxy for brand consideration.",
-        },
-        {
-            "category": "Real Time Marketing Spend and Engagement Signals",
-            "driver_name": "Retargeting Pool Size",
-            "description": "Size of the audience who visited the product page but didn't buy, now being retargeted.",
-        },
-    ]
-
-    # 4. Real Time Trade Promo Signals
-    trade_promo_drivers = [
-        {
-            "category": "Real Time Trade Promo Signals",
-            "driver_name": "On-Platform Discount Depth",
-            "description": "Current percentage discount active on the retailer platform (e.g., Flat 20% Off).",
-        },
-        {
-            "category": "Real Time Trade Promo Signals",
-            "driver_name": "Bundle Offer Active Status",
-            "description": "Flag indicating if the SKU is part of a 'Buy X Get Y' or 'Combo' pack promotion.",
-        },
-        {
-            "category": "Real Time Trade Promo Signals",
-            "driver_name": "Flash Sale Participation",
-            "description": (
-                "Whether the SKU is currently featured in a time-bound 'Lightning Deal' or 'Rush Hour' slot."
-            ),
-        },
-        {
-            "category": "Real Time Trade Promo Signals",
-            "driver_name": "Cart-Level Offer Conversion",
-            "description": "Conversion rate uplift attributed to coupons applied at the checkout stage.",
-        },
-    ]
-
-    # 5. Real Time Digital Shelf Analytics Signals
-    digital_shelf_drivers = [
-        {
-            "category": "Real Time Digital Shelf Analytics Signals",
-            "driver_name": "Share of Search (Keyword Rank)",
-            "description": (
-                "The organic ranking of the SKU when a user searches generic terms like 'Face Wash' or 'Shampoo'."
-            ),
-        },
-        {
-            "category": "Real Time Digital Shelf Analytics Signals",
-            "driver_name": "Product Detail Page (PDP) Views",
-            "description": "Traffic volume landing specifically on the product page in the last 24 hours.",
-        },
-        {
-            "category": "Real Time Digital Shelf Analytics Signals",
-            "driver_name": "Buy Box Win Rate",
-            "description": (
-                "Percentage of time our seller account owns the 'Add to Cart' button vs. third-party sellers."
-            ),
-        },
-        {
-            "category": "Real Time Digital Shelf Analytics Signals",
-            "driver_name": "Rating & Review Velocity",
-            "description": "Number of new reviews added in the last 48 hours; high velocity often precedes a sales spike.",
-        },
-    ]
-
-    # 6. Real Time Weather/Environment Signals
-    weather_environment_drivers = [
-        {
-            "category": "Real Time Weather/Environment Signals",
-            "driver_name": "Max Temperature Forecast",
-            "description": (
-                "Predicted maximum temperature for the next 3 days; critical for summer portfolio "
-                "(Deos, Talc, Light Gels)."
-            ),
-        },
-        {
-            "category": "Real Time Weather/Environment Signals",
-            "driver_name": "Humidity Index",
-            "description": "Moisture levels in the air; triggers demand for Frizz-Control Hair products.",
-        },
-        {
-            "category": "Real Time Weather/Environment Signals",
-            "driver_name": "UV Index",
-            "description": (
-                "Intensity of ultraviolet radiation; direct correlation with Sunscreen and Light Gel sales."
-            ),
-        },
-        {
-            "category": "Real Time Weather/Environment Signals",
-            "driver_name": "Air Quality Index (AQI)",
-            "description": "Pollution levels; triggers demand for Deep Cleanse and Anti-Pollution skincare.",
-        },
-    ]
-
-    # 7. Real Time Competitor Data
-    competitor_data_drivers = [
-        {
-            "category": "Real Time Competitor Data",
-            "driver_name": "Competitor Price Gap",
-            "description": "The monetary difference between our SKU and the nearest equivalent competitor SKU.",
-        },
-        {
-            "category": "Real Time Competitor Data",
-            "driver_name": "Competitor Out-of-Stock Status",
-            "description": (
-                "Flag indicating if the main competitor SKU is currently unavailable, creating a switch opportunity."
-            ),
-        },
-        {
-            "category": "Real Time Competitor Data",
-            "driver_name": "Competitor Promo Intensity",
-            "description": (
-                "Aggressiveness of competitor discounting (e.g., are they running a 50% off deep discount?)."
-            ),
-        },
-        {
-            "category": "Real Time Competitor Data",
-            "driver_name": "Competitor New Launch Signal",
-            "description": "Detection of a new competitive variant launching in the same category.",
-        },
-    ]
-
-    # 8. Real Time POS Data & Open Orders
-    pos_data_drivers = [
-        {
-            "category": "Real Time POS Data & Open Orders",
-            "driver_name": "Real-Time Sales Velocity",
-            "description": "Units sold per hour recorded at the Point of Sale (POS) in the last 6 hours.",
-        },
-        {
-            "category": "Real Time POS Data & Open Orders",
-            "driver_name": "Inventory Days on Hand (DOH)",
-            "description": "Current stock level expressed in days of coverage based on current run-rate.",
-        },
-        {
-            "category": "Real Time POS Data & Open Orders",
-            "driver_name": "Distributor Open Orders",
-            "description": "Volume of confirmed orders from distributors that are yet to be shipped.",
-        },
-        {
-            "category": "Real Time POS Data & Open Orders",
-            "driver_name": "Stock-Out Incidents",
-            "description": "Count of instances where demand could not be fulfilled due to zero inventory.",
-        },
-    ]
-
-    # Combine all lists into one master configuration
-    all_bpc_drivers = (
-        consensus_demand_drivers
-        + social_signals_drivers
-        + marketing_spend_drivers
-        + trade_promo_drivers
-        + digital_shelf_drivers
-        + weather_environment_drivers
-        + competitor_data_drivers
-        + pos_data_drivers
-    )
-
-    # Map to Products
-    mock_db = {
-        "PONDS_SUPER_LIGHT_GEL_100G": all_bpc_drivers,
-        "DOVE_HAIR_FALL_RESCUE_650ML": all_bpc_drivers,
-    }
-
-    return mock_db.get(sku_id, [])
-
-
-__all__ = ["get_product_drivers"]
-
-def get_product_drivers(sku_id: str):
+
+_catalog = _Catalog()
+
+
+def get_product_drivers(sku_id: str) -> Sequence[Driver]:
     """
     Returns the master list of applicable demand drivers for a product.
     Drivers are organized into specific Real-Time categories.
+
+    Returns a shared tuple of frozen Driver entries; use d.as_dict() for a mutable dict.
+    """
+    return _lookup(sku_id)
+
+
+def get_drivers_by_categories(sku_id: str, categories: Iterable[str]) -> Tuple[Driver, ...]:
     """
+    Drivers of the given categories for a product, in the order the categories are passed.
+    A single category returns the shared per-category tuple. Unknown products/categories yield ().
+    """
+    if _lookup(sku_id) is not _ALL_BPC_DRIVERS:
+        return _EMPTY
+    by_category = _catalog.by_category
+    sections = [by_category.get(c, _EMPTY) for c in categories]
+    if len(sections) == 1:
+        return sections[0]
+    return tuple(d for section in sections for d in section)
+
+
+def get_product_drivers_json(sku_id: str) -> bytes:
+    """
+    get_product_drivers(sku_id) as JSON bytes (a list of driver objects), encoded once at import.
+    Returns b"[]" for unknown products.
+    """
+    if sku_id in _KNOWN_SKUS:
+        return _JSON_BY_SKU[sku_id]
+    return _JSON_BY_SKU.get(_norm(sku_id), b"[]")
+
+
+def get_driver_column(sku_id: str, field: str) -> Tuple[str, ...]:
+    """
+    One Driver field for every driver of a product, in catalog order (shared tuple).
+    Returns () for unknown products; raises KeyError for an unknown field.
+    """
+    column = _COLUMNS[field]
+    if _lookup(sku_id) is not _ALL_BPC_DRIVERS:
+        return ()
+    return column
+
+
+def get_driver_names(sku_id: str) -> Tuple[str, ...]:
+    """
+    Driver names for a product, in catalog order (shared tuple; () for unknown products).
+    """
+    return get_driver_column(sku_id, "driver_name")
+
 
-    # 1. Consensus Demand Forecast Drivers
-    consensus_demand_drivers = [
-        {
-            "category": "Statistical Demand Forecast",
-            "driver_name": "Statistical Baseline Forecast",
-            "description": "The base volume predicted by internal time-series algorithms (ARIMA/Prophet) using 3-year historical sales data."
-        },
-        
-    ]
-
-    # 2. Real Time Social Signals
-    social_signals_drivers = [
-        {
-            "category": "Real Time Social Signals",
-            "driver_name": "Ingredient Trend Velocity",
-            "description": "Rate of change in search volume for key active ingredients (e.g., 'Hyaluronic', 'Sulphate-Free')."
-        },
-        {
-            "category": "Real Time Social Signals",
-            "driver_name": "Brand Sentiment Score",
-            "description": "Net Promoter Score (NPS) derived from real-time sentiment analysis of Twitter, Reddit, and Instagram comments."
-        },
-        {
-            "category": "Real Time Social Signals",
-            "driver_name": "Viral Hashtag Volume",
-            "description": "Frequency of brand-adjacent hashtags (e.g., #GlassSkin, #HairGoals) appearing in top 100 trending topics."
-        },
-        {
-            "category": "Real Time Social Signals",
-            "driver_name": "Influencer Mention Count",
-            "description": "Number of unique mentions by Tier-1 and Tier-2 beauty influencers in the last 24 hours."
-        }
-    ]
-
-    # 3. Real Time Marketing Spend and Engagement Signals
-    marketing_spend_drivers = [
-        {
-            "category": "Real Time Marketing Spend and Engagement Signals",
-            "driver_name": "Performance Marketing Spend",
-            "description": "Daily ad spend burn rate on Meta (Instagram/Facebook) and Google Ads for this SKU."
-        },
-        {
-            "category": "Real Time Marketing Spend and Engagement Signals",
-            "driver_name": "Campaign Click-Through-Rate (CTR)",
-            "description": "Real-time efficiency metric of active digital ads; higher CTR indicates higher immediate purchase intent."
-        },
-        {
-            "category": "Real Time Marketing Spend and Engagement Signals",
-            "driver_name": "Video Completion Rate",
-            "description": "Percentage of users watching full brand ads on YouTube/Reels; proxy for brand consideration."
-        },
-        {
-            "category": "Real Time Marketing Spend and Engagement Signals",
-            "driver_name": "Retargeting Pool Size",
-            "description": "Size of the audience who visited the product page but didn't buy, now being retargeted."
-        }
-    ]
-
-    # 4. Real Time Trade Promo Signals
-    trade_promo_drivers = [
-        {
-            "category": "Real Time Trade Promo Signals",
-            "driver_name": "On-Platform Discount Depth",
-            "description": "Current percentage discount active on the retailer platform (e.g., Flat 20% Off)."
-        },
-        {
-            "category": "Real Time Trade Promo Signals",
-            "driver_name": "Bundle Offer Active Status",
-            "description": "Flag indicating if the SKU is part of a 'Buy X Get Y' or 'Combo' pack promotion."
-        },
-        {
-            "category": "Real Time Trade Promo Signals",
-            "driver_name": "Flash Sale Participation",
-            "description": "Whether the SKU is currently featured in a time-bound 'Lightning Deal' or 'Rush Hour' slot."
-        },
-        {
-            "category": "Real Time Trade Promo Signals",
-            "driver_name": "Cart-Level Offer Conversion",
-            "description": "Conversion rate uplift attributed to coupons applied at the checkout stage."
-        }
-    ]
-
-    # 5. Real Time Digital Shelf Analytics Signals
-    digital_shelf_drivers = [
-        {
-            "category": "Real Time Digital Shelf Analytics Signals",
-            "driver_name": "Share of Search (Keyword Rank)",
-            "description": "The organic ranking of the SKU when a user searches generic terms like 'Face Wash' or 'Shampoo'."
-        },
-        {
-            "category": "Real Time Digital Shelf Analytics Signals",
-            "driver_name": "Product Detail Page (PDP) Views",
-            "description": "Traffic volume landing specifically on the product page in the last 24 hours."
-        },
-        {
-            "category": "Real Time Digital Shelf Analytics Signals",
-            "driver_name": "Buy Box Win Rate",
-            "description": "Percentage of time our seller account owns the 'Add to Cart' button vs. third-party sellers."
-        },
-        {
-            "category": "Real Time Digital Shelf Analytics Signals",
-            "driver_name": "Rating & Review Velocity",
-            "description": "Number of new reviews added in the last 48 hours; high velocity often precedes a sales spike."
-        }
-    ]
-
-    # 6. Real Time Weather/Environment Signals
-    weather_environment_drivers = [
-        {
-            "category": "Real Time Weather/Environment Signals",
-            "driver_name": "Max Temperature Forecast",
-            "description": "Predicted maximum temperature for the next 3 days; critical for summer portfolio (Deos, Talc, Light Gels)."
-        },
-        {
-            "category": "Real Time Weather/Environment Signals",
-            "driver_name": "Humidity Index",
-            "description": "Moisture levels in the air; triggers demand for Frizz-Control Hair products."
-        },
-        {
-            "category": "Real Time Weather/Environment Signals",
-            "driver_name": "UV Index",
-            "description": "Intensity of ultraviolet radiation; direct correlation with Sunscreen and Light Gel sales."
-        },
-        {
-            "category": "Real Time Weather/Environment Signals",
-            "driver_name": "Air Quality Index (AQI)",
-            "description": "Pollution levels; triggers demand for Deep Cleanse and Anti-Pollution skincare."
-        }
-    ]
-
-    # 7. Real Time Competitor Data
-    competitor_data_drivers = [
-        {
-            "category": "Real Time Competitor Data",
-            "driver_name": "Competitor Price Gap",
-            "description": "The monetary difference between our SKU and the nearest equivalent competitor SKU."
-        },
-        {
-            "category": "Real Time Competitor Data",
-            "driver_name": "Competitor Out-of-Stock Status",
-            "description": "Flag indicating if the main competitor SKU is currently unavailable, creating a switch opportunity."
-        },
-        {
-            "category": "Real Time Competitor Data",
-            "driver_name": "Competitor Promo Intensity",
-            "description": "Aggressiveness of competitor discounting (e.g., are they running a 50% off deep discount?)."
-        },
-        {
-            "category": "Real Time Competitor Data",
-            "driver_name": "Competitor New Launch Signal",
-            "description": "Detection of a new competitive variant launching in the same category."
-        }
-    ]
-
-    # 8. Real Time POS Data & Open Orders
-    pos_data_drivers = [
-        {
-            "category": "Real Time POS Data & Open Orders",
-            "driver_name": "Real-Time Sales Velocity",
-            "description": "Units sold per hour recorded at the Point of Sale (POS) in the last 6 hours."
-        },
-        {
-            "category": "Real Time POS Data & Open Orders",
-            "driver_name": "Inventory Days on Hand (DOH)",
-            "description": "Current stock level expressed in days of coverage based on current run-rate."
-        },
-        {
-            "category": "Real Time POS Data & Open Orders",
-            "driver_name": "Distributor Open Orders",
-            "description": "Volume of confirmed orders from distributors that are yet to be shipped."
-        },
-        {
-            "category": "Real Time POS Data & Open Orders",
-            "driver_name": "Stock-Out Incidents",
-            "description": "Count of instances where demand could not be fulfilled due to zero inventory."
-        }
-    ]
-
-    # Combine all lists into one master configuration
-    all_bpc_drivers = (
-        consensus_demand_drivers +
-        social_signals_drivers +
-        marketing_spend_drivers +
-        trade_promo_drivers +
-        digital_shelf_drivers +
-        weather_environment_drivers +
-        competitor_data_drivers +
-        pos_data_drivers
-    )
-
-    # Map to Products
-    mock_db = {
-        "PONDS_SUPER_LIGHT_GEL_100G": all_bpc_drivers,
-        "DOVE_HAIR_FALL_RESCUE_650ML": all_bpc_drivers
-    }
-    
-    return mock_db.get(sku_id, [])
\ No newline at end of file
+__all__ = [
+    "Driver",
+    "get_driver_column",
+    "get_driver_names",
+    "get_drivers_by_categories",
+    "get_product_drivers",
+    "get_product_drivers_json",
+]
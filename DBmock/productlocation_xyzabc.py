@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ._norm import _norm
 
 # Key = (SKU_ID, LOCATION_ID)
 MOCK_PRODUCT_MASTER_DATA: Dict[Tuple[str, str], Dict[str, Any]] = {
@@ -27,29 +31,105 @@ MOCK_PRODUCT_MASTER_DATA: Dict[Tuple[str, str], Dict[str, Any]] = {
 }
 
 
+def _build_location_index() -> Dict[str, Tuple[Mapping[str, Any], ...]]:
+    by_location: Dict[str, List[Mapping[str, Any]]] = {}
+    for (sku_id, loc), data in MOCK_PRODUCT_MASTER_DATA.items():
+        row = MappingProxyType({"sku_id": sku_id, "location_id": loc, **data})
+        by_location.setdefault(loc, []).append(row)
+    return {loc: tuple(rows) for loc, rows in by_location.items()}
+
+
+# Location -> read-only master-data rows (sku_id/location_id merged in), in catalog order.
+_BY_LOCATION: Dict[str, Tuple[Mapping[str, Any], ...]] = _build_location_index()
+
+
+def _build_class_indexes() -> Tuple[
+    Dict[str, Tuple[str, ...]],
+    Dict[Tuple[str, str], Tuple[str, ...]],
+    Dict[Tuple[str, str], frozenset],
+]:
+    by_loc: Dict[str, List[str]] = {}
+    by_loc_abc: Dict[Tuple[str, str], List[str]] = {}
+    by_loc_xyz: Dict[Tuple[str, str], set] = {}
+    for (sku_id, loc), data in MOCK_PRODUCT_MASTER_DATA.items():
+        by_loc.setdefault(loc, []).append(sku_id)
+        by_loc_abc.setdefault((loc, data.get("abc_class")), []).append(sku_id)
+        by_loc_xyz.setdefault((loc, data.get("xyz_class")), set()).add(sku_id)
+    return (
+        {k: tuple(v) for k, v in by_loc.items()},
+        {k: tuple(v) for k, v in by_loc_abc.items()},
+        {k: frozenset(v) for k, v in by_loc_xyz.items()},
+    )
+
+
+# SKU lists keep catalog order (callers such as the AUTO product pick rely on it);
+# XYZ buckets are sets because they are only used for membership tests.
+_SKUS_BY_LOC, _BY_LOC_ABC, _BY_LOC_XYZ = _build_class_indexes()
+
+
 def get_product_master_data(sku_id: str, location_id: str) -> Optional[Dict[str, Any]]:
     """
     Returns ABC/XYZ classification and price for a specific Location.
     """
-    sku_id = (sku_id or "").strip().upper()
-    location_id = (location_id or "").strip().upper()
-    return MOCK_PRODUCT_MASTER_DATA.get((sku_id, location_id))
+    # Stored keys are canonical (stripped, uppercase); most callers already pass that form.
+    hit = MOCK_PRODUCT_MASTER_DATA.get((sku_id, location_id))
+    if hit is not None:
+        return hit
+    return MOCK_PRODUCT_MASTER_DATA.get((_norm(sku_id), _norm(location_id)))
 
 
-def list_product_master_data(location_id: str) -> List[Dict[str, Any]]:
+def list_product_master_data(location_id: str) -> List[Mapping[str, Any]]:
     """
     Returns all product master data entries for a location.
-    Each entry includes sku_id and location_id.
+    Each entry includes sku_id and location_id. Entries are shared read-only mappings.
     """
-    location_id = (location_id or "").strip().upper()
-    out: List[Dict[str, Any]] = []
-    for (sku_id, loc), data in MOCK_PRODUCT_MASTER_DATA.items():
-        if loc != location_id:
-            continue
-        row = {"sku_id": sku_id, "location_id": loc}
-        row.update(data)
-        out.append(row)
-    return out
+    return list(_BY_LOCATION.get(_norm(location_id), ()))
+
+
+@lru_cache(maxsize=1)
+def _master_soa() -> Any:
+    """
+    Columnar numpy structured array of the master data (one record per (sku, location), in
+    catalog order), built on first use. String widths are sized from the data.
+    """
+    import numpy as np
+
+    rows = [
+        (sku, loc, d.get("abc_class") or "", d.get("xyz_class") or "", float(d.get("unit_price") or 0))
+        for (sku, loc), d in MOCK_PRODUCT_MASTER_DATA.items()
+    ]
+
+    def width(i: int) -> int:
+        return max((len(r[i]) for r in rows), default=1) or 1
+
+    dtype = [
+        ("sku_id", f"U{width(0)}"),
+        ("location_id", f"U{width(1)}"),
+        ("abc_class", f"U{width(2)}"),
+        ("xyz_class", f"U{width(3)}"),
+        ("unit_price", "f8"),
+    ]
+    arr = np.array(rows, dtype=dtype)
+    arr.flags.writeable = False
+    return arr
+
+
+def get_master_data_array() -> Any:
+    """
+    Read-only numpy structured array (sku_id, location_id, abc_class, xyz_class, unit_price)
+    for vectorized scans/aggregations, e.g. arr["unit_price"][arr["abc_class"] == "A"].mean().
+    """
+    return _master_soa()
+
+
+@lru_cache(maxsize=256)
+def _norm_xyz(xyz_classes: Tuple[str, ...]) -> frozenset:
+    return frozenset(_norm(c) for c in xyz_classes)
+
+
+@lru_cache(maxsize=256)
+def _skus_in_xyz(location_id: str, xyz_classes: frozenset) -> frozenset:
+    return frozenset().union(*(_BY_LOC_XYZ.get((location_id, c), ()) for c in xyz_classes))
 
 
 def find_skus_by_class(
@@ -61,17 +141,16 @@ def find_skus_by_class(
     """
     Convenience selector for SKUs by ABC/XYZ classes at a location.
     """
-    abc_class_u = abc_class.strip().upper() if abc_class else None
-    xyz_set = {c.strip().upper() for c in xyz_classes} if xyz_classes else None
-
-    skus: List[str] = []
-    for row in list_product_master_data(location_id):
-        if abc_class_u and row.get("abc_class") != abc_class_u:
-            continue
-        if xyz_set and row.get("xyz_class") not in xyz_set:
-            continue
-        skus.append(str(row["sku_id"]))
-    return skus
+    loc = _norm(location_id)
+    abc_class_u = _norm(abc_class) if abc_class else None
+    if abc_class_u:
+        candidates = _BY_LOC_ABC.get((loc, abc_class_u), ())
+    else:
+        candidates = _SKUS_BY_LOC.get(loc, ())
+    if not xyz_classes:
+        return list(candidates)
+    xyz_skus = _skus_in_xyz(loc, _norm_xyz(tuple(xyz_classes)))
+    return [sku for sku in candidates if sku in xyz_skus]
 
 
 __all__ = [
@@ -79,4 +158,5 @@ __all__ = [
     "get_product_master_data",
     "list_product_master_data",
     "find_skus_by_class",
+    "get_master_data_array",
 ]
\ No newline at end of file
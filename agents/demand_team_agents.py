@@ -7,13 +7,17 @@ but we keep the logic deterministic for now (no LLM calls yet).
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, TypeVar
 
-from autogen_core import AgentId, MessageContext, RoutedAgent
+from autogen_core import AgentId, MessageContext, RoutedAgent, TopicId
 from autogen_core._routed_agent import message_handler
 
-from .llm import build_reasoning_client
+from .llm import SpeedTier, get_shared_reasoning_client
 from .tools import (
     build_boost_reasoning_context,
     calculate_final_demand_boost,
@@ -27,7 +31,7 @@ from .tools import (
 # ----------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActorRunRequest:
     sku_id: str
     customer_id: str = "BLINKIT"
@@ -40,7 +44,7 @@ class ActorRunRequest:
     user_query: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActorRunResult:
     sku_id: str
     customer_id: str
@@ -58,7 +62,27 @@ class ActorRunResult:
     executed_steps: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class ActorRunPartial:
+    """
+    Published by the Actor once its tools are done, before the (slow) LLM reasoning call,
+    so subscribers can start work that only needs the numbers.
+    """
+
+    sku_id: str
+    customer_id: str
+    location_id: str
+    as_of_date: str
+    attempt: int
+    final_boost: Dict[str, Any]
+    final_forecast: Dict[str, Any]
+
+
+# Topic type for ActorRunPartial (see build_demand_team_runtime for the Critic subscription).
+ACTOR_PARTIAL_TOPIC = "demand_actor_partial"
+
+
+@dataclass(frozen=True, slots=True)
 class CriticReviewRequest:
     sku_id: str
     customer_id: str = "BLINKIT"
@@ -69,7 +93,7 @@ class CriticReviewRequest:
     attempt: int = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CriticReviewResult:
     sku_id: str
     customer_id: str
@@ -78,12 +102,77 @@ class CriticReviewResult:
     attempt: int
     review: Dict[str, Any]
     reasoning: str
+    reasoning_source: str = "template"  # "llm" | "template"
 
 
 # ----------------------------
 # Agents
 # ----------------------------
 
+# Constant prompt prefixes. Every fixed instruction lives in the system prompt and only the
+# per-request payload goes in the user turn, so the prefix is byte-identical across calls and
+# providers' implicit prefix caching (Gemini 2.5, OpenAI) can skip re-prefilling it. For an
+# explicit Gemini cache, create it once with client.caches.create(config=...system_instruction=...)
+# and pass cached_content=<name> in GenerateContentConfig.
+_ACTOR_SYSTEM_PROMPT = (
+    "You are a demand planning assistant. Explain demand boost drivers clearly and briefly. "
+    "Use provided driver notes and the computed boost breakdown. Avoid jargon.\n"
+    "IMPORTANT: Use the as_of_date given in the request exactly. Do not invent dates.\n"
+    "IMPORTANT: total_boost_percent is a fraction (e.g., -0.3 means -30%). "
+    "Use boost_percent_display when provided.\n"
+    "Write 6-10 bullets max. End with one line: "
+    "'Baseline=<x>, TotalBoost=<y%>, FinalForecast=<z>'."
+)
+
+_T = TypeVar("_T")
+
+
+async def _coalesce(
+    inflight: Dict[Hashable, "asyncio.Future[Any]"],
+    key: Hashable,
+    run: Callable[[], Awaitable[_T]],
+) -> _T:
+    """
+    Run `run()` once per key at a time: concurrent duplicate requests await the first
+    caller's result (or exception) instead of repeating the tools + LLM call.
+    """
+    pending = inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+    fut: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+    inflight[key] = fut
+    try:
+        result = await run()
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            fut.cancel()
+        else:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved: there may be no joiners
+        raise
+    finally:
+        inflight.pop(key, None)
+    fut.set_result(result)
+    return result
+
+
+def _compact_json(obj: Any) -> str:
+    # Compact JSON is noticeably fewer prompt tokens than repr() of nested dicts.
+    return json.dumps(obj, separators=(",", ":"), default=str, ensure_ascii=False)
+
+
+_CRITIC_SYSTEM_PROMPT = (
+    "You are a demand planning QA critic. Explain threshold evaluation and tool health checks. "
+    "Be concise and action-oriented.\n"
+    "Explain: (1) threshold result, (2) tool health, (3) next action. 4-6 bullets."
+)
+
+# Changes whenever either system prompt does; keys cached LLM answers (graph/llm_cache.py).
+REASONING_PROMPT_VERSION = hashlib.sha256(
+    (_ACTOR_SYSTEM_PROMPT + _CRITIC_SYSTEM_PROMPT).encode("utf-8")
+).hexdigest()[:12]
+
+
 
 class DemandActorAgent(RoutedAgent):
     """
@@ -95,9 +184,17 @@ class DemandActorAgent(RoutedAgent):
     For now, it deterministically calls our Python tool functions.
     """
 
-    def __init__(self, *, enable_llm: bool = True) -> None:
+    def __init__(self, *, enable_llm: bool = True, speed_tier: SpeedTier = "fast") -> None:
         super().__init__(description="Demand Actor agent (deterministic tool runner + optional LLM reasoning)")
-        self._llm_client = build_reasoning_client(prefer="google") if enable_llm else None
+        # Shared across agents: one SDK client, dispatch queue and in-flight cap for all SKUs.
+        self._llm_client = (
+            get_shared_reasoning_client("google", batching=True, speed_tier=speed_tier) if enable_llm else None
+        )
+        # Planner-typed questions (ActorRunRequest.user_query) get the quality model.
+        self._llm_client_quality = (
+            get_shared_reasoning_client("google", batching=True, speed_tier="quality") if enable_llm else None
+        )
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
 
     def _template_reasoning(self, context: Dict[str, Any], final_forecast: Dict[str, Any]) -> str:
         boost = context["boost"]
@@ -119,31 +216,48 @@ class DemandActorAgent(RoutedAgent):
             else f"Baseline: {baseline} | Total boost: {total_frac} | Final demand forecast: {final_fc}",
             "Key driver notes:",
         ]
-        for k in list(notes.keys())[:6]:
-            lines.append(f"- {k}: {notes[k]}")
+        lines.extend(f"- {k}: {v}" for k, v in islice(notes.items(), 6))
         return "\n".join(lines)
 
     @message_handler
     async def on_run_request(self, message: ActorRunRequest, ctx: MessageContext) -> ActorRunResult:
+        key = (
+            message.sku_id,
+            message.customer_id,
+            message.location_id,
+            message.as_of_date,
+            message.attempt,
+            message.user_query,
+            tuple(message.rerun_tools or ()),
+        )
+        return await _coalesce(self._inflight, key, lambda: self._run(message))
+
+    async def _run(self, message: ActorRunRequest) -> ActorRunResult:
         executed_steps: List[str] = [
             "calculate_final_demand_boost",
             "calculate_final_demand_forecast",
         ]
         # If critic asked to rerun, we still recompute the full final boost for now.
-        final_boost = calculate_final_demand_boost(
-            sku_id=message.sku_id,
-            customer_id=message.customer_id,
-            location_id=message.location_id,
-            as_of_date=message.as_of_date,
-        )
-        final_forecast = calculate_final_demand_forecast(
-            sku_id=message.sku_id,
-            customer_id=message.customer_id,
-            location_id=message.location_id,
-            as_of_date=message.as_of_date,
+        # Boost and forecast are independent; run them off the event loop concurrently.
+        final_boost, final_forecast = await asyncio.gather(
+            asyncio.to_thread(
+                calculate_final_demand_boost,
+                sku_id=message.sku_id,
+                customer_id=message.customer_id,
+                location_id=message.location_id,
+                as_of_date=message.as_of_date,
+            ),
+            asyncio.to_thread(
+                calculate_final_demand_forecast,
+                sku_id=message.sku_id,
+                customer_id=message.customer_id,
+                location_id=message.location_id,
+                as_of_date=message.as_of_date,
+            ),
         )
 
-        reasoning_context = build_boost_reasoning_context(
+        reasoning_context = await asyncio.to_thread(
+            build_boost_reasoning_context,
             sku_id=message.sku_id,
             customer_id=message.customer_id,
             location_id=message.location_id,
@@ -155,9 +269,19 @@ class DemandActorAgent(RoutedAgent):
             reasoning = self._template_reasoning(reasoning_context, final_forecast)
             reasoning_source = "template"
         else:
-            system = (
-                "You are a demand planning assistant. Explain demand boost drivers clearly and briefly. "
-                "Use provided driver notes and the computed boost breakdown. Avoid jargon."
+            # Let the Critic start its deterministic review while the reasoning call decodes.
+            await self.publish_message(
+                ActorRunPartial(
+                    sku_id=final_boost["sku_id"],
+                    customer_id=final_boost["customer_id"],
+                    location_id=final_boost["location_id"],
+                    as_of_date=final_boost["as_of_date"],
+                    attempt=message.attempt,
+                    final_boost=final_boost,
+                    final_forecast=final_forecast,
+                ),
+                # Fixed source: pooled Actor workers (keys v1-<i>) all feed the one Critic.
+                topic_id=TopicId(ACTOR_PARTIAL_TOPIC, source=CRITIC_AGENT_ID.key),
             )
             # Provide derived, display-ready numbers so the model doesn't have to interpret fractions.
             try:
@@ -165,17 +289,15 @@ class DemandActorAgent(RoutedAgent):
             except Exception:
                 boost_pct = None
             user = (
+                f"as_of_date: {message.as_of_date}\n"
                 f"Demand planner request: {message.user_query or 'Explain the computed boost and final forecast.'}\n\n"
-                f"IMPORTANT: Use as_of_date={message.as_of_date} exactly. Do not invent dates.\n"
-                f"IMPORTANT: total_boost_percent is a fraction (e.g., -0.3 means -30%). Use boost_percent_display when provided.\n\n"
                 f"boost_percent_display: {boost_pct}%\n\n"
-                f"Reasoning context (dict):\n{reasoning_context}\n\n"
-                f"Final forecast (dict):\n{final_forecast}\n\n"
-                "Write 6-10 bullets max. End with one line: "
-                "'Baseline=<x>, TotalBoost=<y%>, FinalForecast=<z>'."
+                f"Reasoning context (JSON):\n{_compact_json(reasoning_context)}\n\n"
+                f"Final forecast (JSON):\n{_compact_json(final_forecast)}"
             )
             try:
-                reasoning = await self._llm_client.generate(system=system, user=user)
+                client = (message.user_query and self._llm_client_quality) or self._llm_client
+                reasoning = await client.submit(system=_ACTOR_SYSTEM_PROMPT, user=user)
                 reasoning_source = "llm"
             except Exception:
                 reasoning = self._template_reasoning(reasoning_context, final_forecast)
@@ -202,9 +324,13 @@ class DemandCriticAgent(RoutedAgent):
     - decides: rerun vs human approval vs ok
     """
 
-    def __init__(self, *, enable_llm: bool = True) -> None:
+    def __init__(self, *, enable_llm: bool = True, speed_tier: SpeedTier = "fast") -> None:
         super().__init__(description="Demand Critic agent (deterministic reviewer + optional LLM reasoning)")
-        self._llm_client = build_reasoning_client(prefer="google") if enable_llm else None
+        # Shared across agents: one SDK client, dispatch queue and in-flight cap for all SKUs.
+        self._llm_client = (
+            get_shared_reasoning_client("google", batching=True, speed_tier=speed_tier) if enable_llm else None
+        )
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
 
     def _template_reasoning(self, review: Dict[str, Any]) -> str:
         decision = review.get("decision")
@@ -214,6 +340,22 @@ class DemandCriticAgent(RoutedAgent):
 
     @message_handler
     async def on_review_request(self, message: CriticReviewRequest, ctx: MessageContext) -> CriticReviewResult:
+        # Every field is hashable and affects the result, so the request itself is the key.
+        return await _coalesce(self._inflight, message, lambda: self._review(message))
+
+    @message_handler
+    async def on_actor_partial(self, message: ActorRunPartial, ctx: MessageContext) -> None:
+        # Warm the memoized review for the default thresholds; the CriticReviewRequest that
+        # follows the Actor's reply then skips straight to the LLM explanation.
+        await asyncio.to_thread(
+            critic_review_consensus_demand_boost,
+            sku_id=message.sku_id,
+            customer_id=message.customer_id,
+            location_id=message.location_id,
+            as_of_date=message.as_of_date,
+        )
+
+    async def _review(self, message: CriticReviewRequest) -> CriticReviewResult:
         review = critic_review_consensus_demand_boost(
             sku_id=message.sku_id,
             customer_id=message.customer_id,
@@ -222,19 +364,14 @@ class DemandCriticAgent(RoutedAgent):
             upper_threshold=message.upper_threshold,
             lower_threshold=message.lower_threshold,
         )
+        reasoning_source = "template"
         if self._llm_client is None:
             reasoning = self._template_reasoning(review)
         else:
-            system = (
-                "You are a demand planning QA critic. Explain threshold evaluation and tool health checks. "
-                "Be concise and action-oriented."
-            )
-            user = (
-                f"Review payload:\n{review}\n\n"
-                "Explain: (1) threshold result, (2) tool health, (3) next action. 4-6 bullets."
-            )
+            user = f"Review payload (JSON):\n{_compact_json(review)}"
             try:
-                reasoning = await self._llm_client.generate(system=system, user=user)
+                reasoning = await self._llm_client.submit(system=_CRITIC_SYSTEM_PROMPT, user=user)
+                reasoning_source = "llm"
             except Exception:
                 reasoning = self._template_reasoning(review)
         return CriticReviewResult(
@@ -245,6 +382,26 @@ class DemandCriticAgent(RoutedAgent):
             attempt=message.attempt,
             review=review,
             reasoning=reasoning,
+            reasoning_source=reasoning_source,
+        )
+
+
+class DemandActorDispatcher(RoutedAgent):
+    """
+    Front door for a pool of DemandActorAgent workers (see build_demand_team_runtime_pooled).
+    Requests are routed by (sku, customer, location) so repeats for one context land on the
+    same worker and still share its in-flight dedupe; distinct contexts spread across workers.
+    """
+
+    def __init__(self, worker_ids: List[AgentId]) -> None:
+        super().__init__(description="Routes ActorRunRequest to a pool of Demand Actor workers")
+        self._worker_ids = worker_ids
+
+    @message_handler
+    async def on_run_request(self, message: ActorRunRequest, ctx: MessageContext) -> ActorRunResult:
+        slot = hash((message.sku_id, message.customer_id, message.location_id)) % len(self._worker_ids)
+        return await self.send_message(
+            message, self._worker_ids[slot], cancellation_token=ctx.cancellation_token
         )
 
 
@@ -254,5 +411,7 @@ class DemandCriticAgent(RoutedAgent):
 
 ACTOR_AGENT_ID = AgentId("demand_actor", "v1")
 CRITIC_AGENT_ID = AgentId("demand_critic", "v1")
+# Pooled runtime entry point (workers are AgentId("demand_actor", "v1-<i>")).
+ACTOR_POOL_ID = AgentId("demand_actor_pool", "v1")
 
 
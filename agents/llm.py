@@ -11,9 +11,13 @@ Supported providers:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
+import time
+import weakref
 from dataclasses import dataclass
-from typing import Optional, Protocol, runtime_checkable
+from typing import Awaitable, Callable, List, Literal, Optional, Protocol, Set, Tuple, runtime_checkable
 
 from dotenv import load_dotenv
 
@@ -23,42 +27,135 @@ from autogen_ext.models.openai import OpenAIChatCompletionClient
 import google.genai as genai
 from google.genai import types as genai_types
 
+# Load .env (project root) once; the client builders below only read os.environ.
+load_dotenv()
+
+# "fast" picks the *_FAST_MODEL env vars (bulk explanations); "quality" the regular models.
+SpeedTier = Literal["fast", "quality"]
+
 
 @runtime_checkable
 class ReasoningClient(Protocol):
     async def generate(self, *, system: str, user: str) -> str: ...
 
 
+class LLMUnavailableError(RuntimeError):
+    """Raised instead of calling the provider while the circuit breaker is open."""
+
+
+class _CircuitBreaker:
+    """
+    Opens for LLM_CB_OPEN_S seconds (default 30) after LLM_CB_FAILURES (default 5)
+    consecutive failures/timeouts; while open, calls fail fast so agents fall back to
+    template reasoning instead of queueing behind a degraded provider.
+    """
+
+    def __init__(self, *, failures: int, open_s: float) -> None:
+        self.failures = max(1, failures)
+        self.open_s = open_s
+        self._consecutive = 0
+        self._open_until = 0.0
+
+    def check(self) -> None:
+        if time.monotonic() < self._open_until:
+            raise LLMUnavailableError("LLM circuit open after repeated failures")
+
+    def record(self, ok: bool) -> None:
+        if ok:
+            self._consecutive = 0
+            return
+        self._consecutive += 1
+        if self._consecutive >= self.failures:
+            self._open_until = time.monotonic() + self.open_s
+            self._consecutive = 0
+
+
+# Shared by every provider client in the process.
+_LLM_TIMEOUT_S = float(os.getenv("LLM_TIMEOUT_S", "20"))
+_LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+_CIRCUIT = _CircuitBreaker(
+    failures=int(os.getenv("LLM_CB_FAILURES", "5")),
+    open_s=float(os.getenv("LLM_CB_OPEN_S", "30")),
+)
+# asyncio.Semaphore binds to one event loop and the demo/graph runs several
+# asyncio.run() calls, so keep one global cap per loop.
+_LLM_SEMAS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _llm_sema() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sema = _LLM_SEMAS.get(loop)
+    if sema is None:
+        sema = _LLM_SEMAS[loop] = asyncio.Semaphore(max(1, _LLM_MAX_CONCURRENCY))
+    return sema
+
+
+async def _guarded(call: Callable[[], Awaitable[str]]) -> str:
+    """
+    Run one provider call under the global concurrency cap, the LLM_TIMEOUT_S budget
+    (default 20) and the circuit breaker. Errors propagate; callers fall back to templates.
+    """
+    _CIRCUIT.check()
+    async with _llm_sema():
+        try:
+            result = await asyncio.wait_for(call(), timeout=_LLM_TIMEOUT_S)
+        except Exception:
+            _CIRCUIT.record(False)
+            raise
+    _CIRCUIT.record(True)
+    return result
+
+
 @dataclass
 class GeminiReasoningClient:
     client: genai.Client
     model: str
     temperature: float = 0.2
+    top_p: Optional[float] = 0.9
+    # Caps the visible answer (the prompts ask for a few bullets). None = provider default.
+    max_output_tokens: Optional[int] = 350
+    # Thinking models count thoughts against max_output_tokens; None leaves thinking at the
+    # provider default (and the cap unadjusted), so only set it for thinking models.
+    thinking_budget: Optional[int] = None
+
+    def _config(self, system: str) -> genai_types.GenerateContentConfig:
+        max_tokens = self.max_output_tokens
+        thinking = None
+        if self.thinking_budget is not None:
+            thinking = genai_types.ThinkingConfig(thinking_budget=self.thinking_budget)
+            if max_tokens is not None:
+                max_tokens += self.thinking_budget
+        return genai_types.GenerateContentConfig(
+            system_instruction=system,
+            temperature=self.temperature,
+            top_p=self.top_p,
+            max_output_tokens=max_tokens,
+            thinking_config=thinking,
+        )
 
     async def generate(self, *, system: str, user: str) -> str:
-        # google-genai is sync; run in a thread to keep our agent handlers async-friendly.
-        import asyncio
-
-        def _call() -> str:
-            resp = self.client.models.generate_content(
-                model=self.model,
-                contents=user,
-                config=genai_types.GenerateContentConfig(
-                    system_instruction=system,
-                    temperature=self.temperature,
-                ),
-            )
-            # The SDK typically exposes .text for convenience.
-            text = getattr(resp, "text", None)
-            if text:
-                return str(text).strip()
+        return await _guarded(lambda: self._generate(system=system, user=user))
+
+    async def _generate(self, *, system: str, user: str) -> str:
+        # Native async API: the event loop drives the request, no thread-pool hop per call.
+        resp = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=user,
+            config=self._config(system),
+        )
+        # The SDK typically exposes .text for convenience.
+        text = getattr(resp, "text", None)
+        if not text:
             # Fallback: try candidates structure
             try:
-                return str(resp.candidates[0].content.parts[0].text).strip()  # type: ignore[attr-defined]
+                text = resp.candidates[0].content.parts[0].text  # type: ignore[attr-defined]
             except Exception:
-                return ""
-
-        return await asyncio.to_thread(_call)
+                text = None
+        text = str(text or "").strip()
+        if not text:
+            # e.g. the token cap was spent before any visible text; callers fall back to templates.
+            raise RuntimeError(f"{self.model} returned no text")
+        return text
 
 
 @dataclass
@@ -66,50 +163,198 @@ class OpenAIReasoningClient:
     client: OpenAIChatCompletionClient
 
     async def generate(self, *, system: str, user: str) -> str:
+        return await _guarded(lambda: self._generate(system=system, user=user))
+
+    async def _generate(self, *, system: str, user: str) -> str:
         result = await self.client.create(
             messages=[
                 SystemMessage(content=system),
                 UserMessage(content=user),
             ]
         )
-        return (result.content or "").strip()
+        text = result.content.strip() if isinstance(result.content, str) else ""
+        if not text:
+            raise RuntimeError("OpenAI model returned no text")
+        return text
 
 
-def build_gemini_client() -> Optional[GeminiReasoningClient]:
+class BatchingReasoningClient:
+    """
+    Shared dispatch queue for reasoning calls from many agents.
+
+    submit() enqueues a (system, user) pair and awaits its result. A background drainer
+    takes whatever is queued (up to LLM_MAX_BATCH, default 16) and issues each call to the
+    wrapped client individually - there is no batched provider request - with at most
+    LLM_BATCH_CONCURRENCY (default 8) calls in flight across all agents.
+
+    LLM_BATCH_WINDOW_MS (default 0) optionally holds a batch open to collect more calls;
+    it only matters with ENABLE_PREFIX_SORT. At 0 a lone call goes straight through.
+
+    With ENABLE_PREFIX_SORT=1 each batch is dispatched ordered by (system prompt, first
+    128 chars of the user prompt), so requests sharing a prompt prefix hit the provider
+    back to back and its implicit prefix cache stays warm.
+
+    The drainer is bound to the running event loop and (re)started lazily on first use,
+    so the wrapper survives demos that call asyncio.run() more than once.
+    """
+
+    def __init__(
+        self,
+        inner: ReasoningClient,
+        *,
+        window_ms: Optional[float] = None,
+        max_batch: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        prefix_sort: Optional[bool] = None,
+    ) -> None:
+        self.inner = inner
+        self.window_s = (window_ms if window_ms is not None else float(os.getenv("LLM_BATCH_WINDOW_MS", "0"))) / 1000.0
+        self.max_batch = max_batch or int(os.getenv("LLM_MAX_BATCH", "16"))
+        self.concurrency = concurrency or int(os.getenv("LLM_BATCH_CONCURRENCY", "8"))
+        self.prefix_sort = prefix_sort if prefix_sort is not None else os.getenv("ENABLE_PREFIX_SORT", "0") == "1"
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[Tuple[str, str, asyncio.Future]]"] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._drainer: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """
+        Start the drainer on the running loop (no-op if it is already running there).
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._drainer is not None and not self._drainer.done():
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._sem = asyncio.Semaphore(self.concurrency)
+        self._inflight = set()
+        self._drainer = loop.create_task(self._drain())
+
+    async def submit(self, *, system: str, user: str) -> str:
+        self.start()
+        assert self._queue is not None and self._loop is not None
+        fut = self._loop.create_future()
+        self._queue.put_nowait((system, user, fut))
+        return await fut
+
+    # Drop-in for ReasoningClient.
+    generate = submit
+
+    async def _drain(self) -> None:
+        assert self._queue is not None and self._loop is not None
+        queue, loop = self._queue, self._loop
+        while True:
+            batch: List[Tuple[str, str, asyncio.Future]] = [await queue.get()]
+            # Whatever is already queued joins the batch without waiting.
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            deadline = loop.time() + self.window_s
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            if self.prefix_sort:
+                batch.sort(key=lambda item: (item[0], item[1][:128]))
+            # Dispatch without waiting, so the next window fills while this batch decodes.
+            task = loop.create_task(self._run_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        await asyncio.gather(*(self._run_one(system, user, fut) for system, user, fut in batch))
+
+    async def _run_one(self, system: str, user: str, fut: asyncio.Future) -> None:
+        assert self._sem is not None
+        if fut.done():  # caller was cancelled while queued
+            return
+        async with self._sem:
+            try:
+                result = await self.inner.generate(system=system, user=user)
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)
+                return
+        if not fut.done():
+            fut.set_result(result)
+
+
+def _max_output_tokens() -> Optional[int]:
+    # LLM_MAX_OUTPUT_TOKENS (default 350); 0 or negative disables the cap.
+    value = int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "350"))
+    return value if value > 0 else None
+
+
+def _thinking_budget(model: str) -> Optional[int]:
+    # LLM_THINKING_BUDGET overrides (-1 = provider default). Otherwise 2.5 models think as
+    # little as they allow: flash can switch thinking off, pro needs at least 128 tokens.
+    value = os.getenv("LLM_THINKING_BUDGET")
+    if value is not None:
+        budget = int(value)
+        return budget if budget >= 0 else None
+    if "2.5" not in model:
+        return None
+    return 0 if "flash" in model else 128
+
+
+def _gemini_model(speed_tier: SpeedTier) -> str:
+    if speed_tier == "fast":
+        return os.getenv("GOOGLE_FAST_MODEL", "gemini-2.5-flash")
+    return os.getenv("GOOGLE_MODEL", "gemini-2.5-pro")
+
+
+def _openai_model(speed_tier: SpeedTier) -> str:
+    model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    if speed_tier == "fast":
+        return os.getenv("OPENAI_FAST_MODEL", model)
+    return model
+
+
+def build_gemini_client(speed_tier: SpeedTier = "quality") -> Optional[GeminiReasoningClient]:
     """
     Create a Gemini reasoning client if GOOGLE_API_KEY is configured.
 
     Env vars:
     - GOOGLE_API_KEY (required)
     - GOOGLE_MODEL (optional, default: gemini-2.5-pro)
+    - GOOGLE_FAST_MODEL (optional, default: gemini-2.5-flash; used for speed_tier="fast")
+    - LLM_MAX_OUTPUT_TOKENS (optional, default: 350; visible answer tokens, the thinking budget is added on top)
+    - LLM_THINKING_BUDGET (optional; default 0 on 2.5 flash, 128 on 2.5 pro, -1 = provider default)
     """
-    load_dotenv()
-
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         return None
 
-    model = os.getenv("GOOGLE_MODEL", "gemini-2.5-pro")
-    return GeminiReasoningClient(client=genai.Client(api_key=api_key), model=model, temperature=0.2)
+    model = _gemini_model(speed_tier)
+    return GeminiReasoningClient(
+        client=genai.Client(api_key=api_key),
+        model=model,
+        temperature=0.2,
+        max_output_tokens=_max_output_tokens(),
+        thinking_budget=_thinking_budget(model),
+    )
 
 
-def build_openai_client() -> Optional[OpenAIChatCompletionClient]:
+def build_openai_client(speed_tier: SpeedTier = "quality") -> Optional[OpenAIChatCompletionClient]:
     """
     Create an OpenAI model client if OPENAI_API_KEY is configured.
 
     Env vars:
     - OPENAI_API_KEY (required)
     - OPENAI_MODEL (optional, default: gpt-4o-mini)
+    - OPENAI_FAST_MODEL (optional, default: OPENAI_MODEL; used for speed_tier="fast")
     - OPENAI_BASE_URL (optional)
+    - LLM_MAX_OUTPUT_TOKENS (optional, default: 350)
     """
-    # Load .env (project root) if present
-    load_dotenv()
-
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         return None
 
-    model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    model = _openai_model(speed_tier)
     base_url = os.getenv("OPENAI_BASE_URL")
 
     kwargs = {
@@ -117,34 +362,68 @@ def build_openai_client() -> Optional[OpenAIChatCompletionClient]:
         "model": model,
         "temperature": 0.2,
     }
+    max_tokens = _max_output_tokens()
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
     if base_url:
         kwargs["base_url"] = base_url
 
     return OpenAIChatCompletionClient(**kwargs)
 
 
-def build_reasoning_client(prefer: str = "google") -> Optional[ReasoningClient]:
+def build_reasoning_client(prefer: str = "google", speed_tier: SpeedTier = "fast") -> Optional[ReasoningClient]:
     """
     Returns a client that can generate reasoning text.
     Preference order:
     - if prefer == "google": Gemini first, then OpenAI
     - if prefer == "openai": OpenAI first, then Gemini
+    speed_tier selects the fast (default) or quality model of the chosen provider.
     """
     if prefer.lower() == "openai":
-        oai = build_openai_client()
+        oai = build_openai_client(speed_tier)
         if oai:
             return OpenAIReasoningClient(oai)
-        gem = build_gemini_client()
+        gem = build_gemini_client(speed_tier)
         if gem:
             return gem
         return None
 
-    gem = build_gemini_client()
+    gem = build_gemini_client(speed_tier)
     if gem:
         return gem
-    oai = build_openai_client()
+    oai = build_openai_client(speed_tier)
     if oai:
         return OpenAIReasoningClient(oai)
     return None
 
 
+def reasoning_model_name(prefer: str = "google", speed_tier: SpeedTier = "fast") -> Optional[str]:
+    """
+    "<provider>:<model>" that build_reasoning_client(prefer, speed_tier) would use, without
+    building a client; None when neither API key is configured.
+    """
+    google = f"google:{_gemini_model(speed_tier)}" if os.getenv("GOOGLE_API_KEY") else None
+    openai = f"openai:{_openai_model(speed_tier)}" if os.getenv("OPENAI_API_KEY") else None
+    if prefer.lower() == "openai":
+        return openai or google
+    return google or openai
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_reasoning_client(prefer: str, batching: bool, speed_tier: SpeedTier) -> Optional[ReasoningClient]:
+    client = build_reasoning_client(prefer=prefer, speed_tier=speed_tier)
+    if client is None or not batching:
+        return client
+    return BatchingReasoningClient(client)
+
+
+def get_shared_reasoning_client(
+    prefer: str = "google", *, batching: bool = False, speed_tier: SpeedTier = "fast"
+) -> Optional[ReasoningClient]:
+    """
+    Process-wide reasoning client per (provider preference, batching, speed tier): agents
+    share one SDK client (and its HTTP connection pool) instead of building one each.
+    With batching=True the shared client is a BatchingReasoningClient, so Actor and Critic
+    calls share one queue and in-flight cap.
+    """
+    return _shared_reasoning_client(prefer.lower(), batching, speed_tier)
@@ -2,16 +2,25 @@
 AutoGen runtime bootstrap for local, deterministic runs.
 
 We use SingleThreadedAgentRuntime to keep execution simple and easy to debug.
+build_demand_team_runtime_pooled() is the multi-SKU variant: several Actor instances
+behind a dispatcher, at the cost of request traces spread over many agent ids.
+get_demand_team_runtime() hands out one started runtime per event loop for the graph nodes.
 """
 
 from __future__ import annotations
 
-from autogen_core import SingleThreadedAgentRuntime
+import asyncio
+from typing import Any, Dict, List, Sequence
+
+from autogen_core import AgentId, SingleThreadedAgentRuntime, TypeSubscription
 
 from .demand_team_agents import (
     ACTOR_AGENT_ID,
+    ACTOR_PARTIAL_TOPIC,
+    ACTOR_POOL_ID,
     CRITIC_AGENT_ID,
     DemandActorAgent,
+    DemandActorDispatcher,
     DemandCriticAgent,
 )
 
@@ -20,6 +29,66 @@ async def build_demand_team_runtime(*, enable_llm: bool = True) -> SingleThreade
     runtime = SingleThreadedAgentRuntime()
     await runtime.register_agent_instance(DemandActorAgent(enable_llm=enable_llm), ACTOR_AGENT_ID)
     await runtime.register_agent_instance(DemandCriticAgent(enable_llm=enable_llm), CRITIC_AGENT_ID)
+    # The Critic warms its review from the Actor's partial result (published before LLM reasoning).
+    await runtime.add_subscription(TypeSubscription(ACTOR_PARTIAL_TOPIC, CRITIC_AGENT_ID.type))
+    return runtime
+
+
+# A started runtime is bound to the loop that started it, and the demos/Streamlit app call
+# asyncio.run() repeatedly, so keep one per loop. Storing the startup task (not the runtime)
+# lets concurrent first callers await the same build. The runtime's processing task is
+# cancelled with its loop; entries for closed loops are dropped on the next lookup (the task
+# references its loop, so a WeakKeyDictionary would never release them).
+_RUNTIMES: Dict[asyncio.AbstractEventLoop, "asyncio.Task[SingleThreadedAgentRuntime]"] = {}
+
+
+async def _start_demand_team_runtime() -> SingleThreadedAgentRuntime:
+    runtime = await build_demand_team_runtime()
+    runtime.start()
+    return runtime
+
+
+async def get_demand_team_runtime() -> SingleThreadedAgentRuntime:
+    """
+    Started demand-team runtime shared by every caller on the running event loop.
+    Do not stop() it; it lives as long as the loop.
+    """
+    loop = asyncio.get_running_loop()
+    task = _RUNTIMES.get(loop)
+    if task is None:
+        for stale in [lp for lp in _RUNTIMES if lp.is_closed()]:
+            del _RUNTIMES[stale]
+        task = _RUNTIMES[loop] = loop.create_task(_start_demand_team_runtime())
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        # Do not cache a failed build; the next caller retries.
+        if _RUNTIMES.get(loop) is task:
+            del _RUNTIMES[loop]
+        raise
+
+
+async def build_demand_team_runtime_pooled(
+    *, num_workers: int = 8, enable_llm: bool = True
+) -> SingleThreadedAgentRuntime:
+    """
+    Like build_demand_team_runtime, plus num_workers Actor instances behind a dispatcher
+    registered at ACTOR_POOL_ID; send ActorRunRequest there to spread SKUs over the pool.
+    ACTOR_AGENT_ID and CRITIC_AGENT_ID remain available as usual.
+    """
+    runtime = await build_demand_team_runtime(enable_llm=enable_llm)
+    worker_ids = [AgentId(ACTOR_AGENT_ID.type, f"{ACTOR_AGENT_ID.key}-{i}") for i in range(max(1, num_workers))]
+    for worker_id in worker_ids:
+        await runtime.register_agent_instance(DemandActorAgent(enable_llm=enable_llm), worker_id)
+    await runtime.register_agent_instance(DemandActorDispatcher(worker_ids), ACTOR_POOL_ID)
     return runtime
 
 
+async def send_all(runtime: SingleThreadedAgentRuntime, messages: Sequence[Any], recipient: AgentId) -> List[Any]:
+    """
+    Send messages concurrently and return the replies in input order.
+    The first failure cancels the remaining sends (asyncio.TaskGroup semantics).
+    """
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(runtime.send_message(m, recipient=recipient)) for m in messages]
+    return [t.result() for t in tasks]
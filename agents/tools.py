@@ -8,11 +8,30 @@ This file intentionally keeps the "tools" as plain Python callables so they can
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+import functools
+import inspect
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 try:
     # Local package imports (preferred when running as a module)
-    from ..DBmock.productcustomerlocation_drivers import get_product_drivers
+    from ..DBmock._norm import _norm
+    from ..DBmock.productcustomerlocation_drivers import (
+        _CAT_COMPETITOR,
+        _CAT_DIGITAL_SHELF,
+        _CAT_MARKETING,
+        _CAT_POS,
+        _CAT_SOCIAL,
+        _CAT_STATISTICAL,
+        _CAT_TRADE_PROMO,
+        _CAT_WEATHER,
+        Driver,
+        get_drivers_by_categories,
+        get_product_drivers,
+    )
     from ..DBmock.productlocation_xyzabc import (
         find_skus_by_class,
         get_product_master_data,
@@ -26,7 +45,18 @@ try:
     )
 except Exception:  # pragma: no cover
     # Fallback for ad-hoc execution where package context isn't set up.
+    from prototype2_demand_supply.DBmock._norm import _norm  # type: ignore
     from prototype2_demand_supply.DBmock.productcustomerlocation_drivers import (  # type: ignore
+        _CAT_COMPETITOR,
+        _CAT_DIGITAL_SHELF,
+        _CAT_MARKETING,
+        _CAT_POS,
+        _CAT_SOCIAL,
+        _CAT_STATISTICAL,
+        _CAT_TRADE_PROMO,
+        _CAT_WEATHER,
+        Driver,
+        get_drivers_by_categories,
         get_product_drivers,
     )
     from prototype2_demand_supply.DBmock.productlocation_xyzabc import (  # type: ignore
@@ -42,12 +72,46 @@ except Exception:  # pragma: no cover
     )
 
 
-def _norm_upper(value: str) -> str:
-    return (value or "").strip().upper()
+# Memoized: the same few ids are normalized on every tool call.
+_norm_upper = _norm
+
+# lru_cache'd implementations behind the memoized tools, cleared by invalidate_tool_caches().
+_TOOL_CACHES: List[Any] = []
 
 
-def _filter_drivers_by_category(drivers: Sequence[Dict[str, Any]], category: str) -> List[Dict[str, Any]]:
-    return [d for d in drivers if d.get("category") == category]
+def _memoized_tool(fn: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """
+    Memoize a deterministic (sku_id, customer_id, location_id, ...) tool over the mock DB.
+    Ids are normalized before the cache lookup so equivalent spellings share one entry.
+    Results are shared between callers: treat them as read-only.
+    """
+    cached = functools.lru_cache(maxsize=2048)(fn)
+    _TOOL_CACHES.append(cached)
+    # Parameters after the three ids, with their defaults. Calls are keyed positionally so that
+    # f(x, as_of_date=d), f(x, "BLINKIT", "BANGALORE", d) and f(x) with d == default share one entry.
+    rest = list(inspect.signature(fn).parameters.values())[3:]
+    rest_names = tuple(p.name for p in rest)
+    rest_defaults = tuple(p.default for p in rest)
+
+    @functools.wraps(fn)
+    def wrapper(sku_id: str, customer_id: str = "BLINKIT", location_id: str = "BANGALORE", *args: Any, **kwargs: Any):
+        n = len(args)
+        if n < len(rest_names):
+            args += tuple(kwargs.pop(name, default) for name, default in zip(rest_names[n:], rest_defaults[n:]))
+        if kwargs:
+            raise TypeError(f"{fn.__name__}() got unexpected keyword arguments {sorted(kwargs)}")
+        return cached(_norm_upper(sku_id), _norm_upper(customer_id), _norm_upper(location_id), *args)
+
+    return wrapper
+
+
+def invalidate_tool_caches() -> None:
+    """
+    Drop memoized tool results, e.g. after editing mock driver values
+    (call together with DBmock.demanddrivervalues.clear_demand_driver_cache()).
+    """
+    for cached in _TOOL_CACHES:
+        cached.cache_clear()
 
 
 def _safe_float(value: Any) -> Optional[float]:
@@ -73,60 +137,62 @@ def _safe_bool(value: Any) -> Optional[bool]:
     return None
 
 
+def _below(threshold: float) -> float:
+    # Largest float < threshold: turns a strict "x < t" rung into "x <= _below(t)".
+    return math.nextafter(threshold, -math.inf)
+
+
+# Step ladders as (upper bounds, outputs): outputs[i] for the first bound with x <= bounds[i],
+# else outputs[-1]. One bisect per call instead of walking an if/elif chain.
+_INTENSITY_BOUNDS: Tuple[float, ...] = (0.0, 0.20, 0.40, 0.60, 0.80, 1.00)
+_INTENSITY_BOOSTS: Tuple[float, ...] = (0.0, 0.10, 0.20, 0.30, 0.40, 0.50, 0.60)
+
+# Net score ladder for most categories (negative scenarios down to -30%):
+# <= -1.00: -30%, <= -0.70: -20%, <= -0.35: -10%, < 0.35: 0%, then +10% per rung at
+# 0.60/0.80/1.00/1.20/1.40 (0.60 => 50%+).
+_SIGNED_SCORE_BOUNDS: Tuple[float, ...] = (
+    -1.00,
+    -0.70,
+    -0.35,
+    _below(0.35),
+    _below(0.60),
+    _below(0.80),
+    _below(1.00),
+    _below(1.20),
+    _below(1.40),
+)
+_SIGNED_SCORE_BOOSTS: Tuple[float, ...] = (-0.30, -0.20, -0.10, 0.0, 0.10, 0.20, 0.30, 0.40, 0.50, 0.60)
+
+# Competitor net score (favorable or unfavorable): <= -0.80: -30%, <= -0.50: -20%, <= -0.20: -10%,
+# < 0.20: 0%, < 0.50: +10%, < 0.80: +20%, else +30%.
+_COMPETITOR_NET_BOUNDS: Tuple[float, ...] = (-0.80, -0.50, -0.20, _below(0.20), _below(0.50), _below(0.80))
+_COMPETITOR_NET_BOOSTS: Tuple[float, ...] = (-0.30, -0.20, -0.10, 0.0, 0.10, 0.20, 0.30)
+
+
 def _step_boost_from_intensity(intensity: float) -> float:
     """
-    Step boost calculator (as requested) using if/elif.
+    Step boost calculator (as requested) as a bisect over _INTENSITY_BOUNDS.
 
     intensity is a rough "signal strength" score where:
     - <= 0 means no boost
     - higher means stronger boost
     Returns a boost fraction: 0.10 => +10%, 0.50 => +50%, 0.60 => 50%+
     """
-    if intensity <= 0.0:
-        return 0.0
-    elif intensity <= 0.20:
-        return 0.10
-    elif intensity <= 0.40:
-        return 0.20
-    elif intensity <= 0.60:
-        return 0.30
-    elif intensity <= 0.80:
-        return 0.40
-    elif intensity <= 1.00:
-        return 0.50
-    else:
-        return 0.60  # 50%+
+    return _INTENSITY_BOOSTS[bisect_left(_INTENSITY_BOUNDS, intensity)]
 
 
-def _step_boost_from_signed_score(score: float) -> float:
+def _step_boosts(
+    scores: Any,
+    bounds: Sequence[float] = _SIGNED_SCORE_BOUNDS,
+    boosts: Sequence[float] = _SIGNED_SCORE_BOOSTS,
+) -> Any:
     """
-    Step boost calculator supporting negative scenarios (min down to -30%).
-
-    score is a rough "net signal" where:
-    - negative => headwind
-    - positive => tailwind
-    Returns a boost fraction: -0.10 => -10%, -0.30 => -30%, 0.60 => 50%+
+    Vectorized ladder lookup for batches of scores (numpy array in, numpy array out).
+    Same semantics as the scalar lookups (searchsorted side="left" == bisect_left).
     """
-    if score <= -1.00:
-        return -0.30
-    elif score <= -0.70:
-        return -0.20
-    elif score <= -0.35:
-        return -0.10
-    elif score < 0.35:
-        return 0.0
-    elif score < 0.60:
-        return 0.10
-    elif score < 0.80:
-        return 0.20
-    elif score < 1.00:
-        return 0.30
-    elif score < 1.20:
-        return 0.40
-    elif score < 1.40:
-        return 0.50
-    else:
-        return 0.60  # 50%+
+    import numpy as np
+
+    return np.asarray(boosts, dtype=np.float64)[np.searchsorted(np.asarray(bounds, dtype=np.float64), scores, side="left")]
 
 
 def _get_values(
@@ -134,7 +200,7 @@ def _get_values(
     customer_id: str,
     location_id: str,
     as_of_date: str,
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     return get_demand_driver_values(
         sku_id=_norm_upper(sku_id),
         customer_id=_norm_upper(customer_id),
@@ -143,32 +209,53 @@ def _get_values(
     )
 
 
+# Catalog driver -> its plain-dict form, built once per driver (catalog entries live for the process).
+_DRIVER_ROWS: Dict[Driver, Dict[str, Any]] = {}
+
+
+def _driver_row(d: Driver) -> Dict[str, Any]:
+    row = _DRIVER_ROWS.get(d)
+    if row is None:
+        row = _DRIVER_ROWS[d] = d.as_dict()
+    return row
+
+
 def _attach_values(
-    drivers: Sequence[Dict[str, Any]],
+    drivers: Sequence[Driver],
     sku_id: str,
     customer_id: str,
     location_id: str,
     as_of_date: str,
     include_values: bool,
 ) -> List[Dict[str, Any]]:
+    """
+    Driver rows for a tool result. With include_values=False the rows are shared per driver
+    (no per-call copies): treat them as read-only. Enriched rows are always fresh.
+    """
     if not include_values:
-        return [dict(d) for d in drivers]
+        return [_driver_row(d) for d in drivers]
 
+    # Context fields are the same for every row; normalize them once, then build each row in one literal.
+    customer_id_u = _norm_upper(customer_id)
+    location_id_u = _norm_upper(location_id)
     values = get_demand_driver_values(
         sku_id=_norm_upper(sku_id),
-        customer_id=_norm_upper(customer_id),
-        location_id=_norm_upper(location_id),
+        customer_id=customer_id_u,
+        location_id=location_id_u,
         as_of_date=as_of_date,
     )
-    enriched: List[Dict[str, Any]] = []
-    for d in drivers:
-        dd = dict(d)
-        dd["value"] = values.get(dd.get("driver_name"))
-        dd["as_of_date"] = as_of_date
-        dd["customer_id"] = _norm_upper(customer_id)
-        dd["location_id"] = _norm_upper(location_id)
-        enriched.append(dd)
-    return enriched
+    return [
+        {
+            "category": d.category,
+            "driver_name": d.driver_name,
+            "description": d.description,
+            "value": values.get(d.driver_name),
+            "as_of_date": as_of_date,
+            "customer_id": customer_id_u,
+            "location_id": location_id_u,
+        }
+        for d in drivers
+    ]
 
 
 # ======================================================================================
@@ -184,8 +271,7 @@ def fetch_consensus_demand_driver(
     """
     Tool 1: Fetch consensus demand driver(s) for a SKU.
     """
-    drivers = get_product_drivers(_norm_upper(sku_id))
-    subset = _filter_drivers_by_category(drivers, "Statistical Demand Forecast")
+    subset = get_drivers_by_categories(_norm_upper(sku_id), (_CAT_STATISTICAL,))
     return _attach_values(subset, sku_id, customer_id, location_id, as_of_date, include_values)
 
 
@@ -202,8 +288,7 @@ def fetch_social_signal_drivers(
     """
     Tool 2: Fetch social signal drivers for a SKU.
     """
-    drivers = get_product_drivers(_norm_upper(sku_id))
-    subset = _filter_drivers_by_category(drivers, "Real Time Social Signals")
+    subset = get_drivers_by_categories(_norm_upper(sku_id), (_CAT_SOCIAL,))
     return _attach_values(subset, sku_id, customer_id, location_id, as_of_date, include_values)
 
 
@@ -220,8 +305,7 @@ def fetch_marketing_spend_drivers(
     """
     Tool 3: Fetch marketing spend/engagement drivers for a SKU.
     """
-    drivers = get_product_drivers(_norm_upper(sku_id))
-    subset = _filter_drivers_by_category(drivers, "Real Time Marketing Spend and Engagement Signals")
+    subset = get_drivers_by_categories(_norm_upper(sku_id), (_CAT_MARKETING,))
     return _attach_values(subset, sku_id, customer_id, location_id, as_of_date, include_values)
 
 
@@ -238,8 +322,7 @@ def fetch_trade_promo_drivers(
     """
     Tool 4: Fetch trade promo drivers for a SKU.
     """
-    drivers = get_product_drivers(_norm_upper(sku_id))
-    subset = _filter_drivers_by_category(drivers, "Real Time Trade Promo Signals")
+    subset = get_drivers_by_categories(_norm_upper(sku_id), (_CAT_TRADE_PROMO,))
     return _attach_values(subset, sku_id, customer_id, location_id, as_of_date, include_values)
 
 
@@ -256,8 +339,7 @@ def fetch_digital_shelf_drivers(
     """
     Tool 5: Fetch digital shelf drivers for a SKU.
     """
-    drivers = get_product_drivers(_norm_upper(sku_id))
-    subset = _filter_drivers_by_category(drivers, "Real Time Digital Shelf Analytics Signals")
+    subset = get_drivers_by_categories(_norm_upper(sku_id), (_CAT_DIGITAL_SHELF,))
     return _attach_values(subset, sku_id, customer_id, location_id, as_of_date, include_values)
 
 
@@ -274,8 +356,7 @@ def fetch_weather_environment_drivers(
     """
     Tool 6: Fetch weather/environment drivers for a SKU.
     """
-    drivers = get_product_drivers(_norm_upper(sku_id))
-    subset = _filter_drivers_by_category(drivers, "Real Time Weather/Environment Signals")
+    subset = get_drivers_by_categories(_norm_upper(sku_id), (_CAT_WEATHER,))
     return _attach_values(subset, sku_id, customer_id, location_id, as_of_date, include_values)
 
 
@@ -292,8 +373,7 @@ def fetch_competitor_data_drivers(
     """
     Tool 7: Fetch competitor data drivers for a SKU.
     """
-    drivers = get_product_drivers(_norm_upper(sku_id))
-    subset = _filter_drivers_by_category(drivers, "Real Time Competitor Data")
+    subset = get_drivers_by_categories(_norm_upper(sku_id), (_CAT_COMPETITOR,))
     return _attach_values(subset, sku_id, customer_id, location_id, as_of_date, include_values)
 
 
@@ -310,11 +390,31 @@ def fetch_pos_data_drivers(
     """
     Tool 8: Fetch POS/open-orders drivers for a SKU.
     """
-    drivers = get_product_drivers(_norm_upper(sku_id))
-    subset = _filter_drivers_by_category(drivers, "Real Time POS Data & Open Orders")
+    subset = get_drivers_by_categories(_norm_upper(sku_id), (_CAT_POS,))
     return _attach_values(subset, sku_id, customer_id, location_id, as_of_date, include_values)
 
 
+# ======================================================================================
+# 1-8 in one call
+# ======================================================================================
+def fetch_all_driver_categories(
+    sku_id: str,
+    customer_id: str = "BLINKIT",
+    location_id: str = "BANGALORE",
+    as_of_date: str = DEFAULT_AS_OF_DATE,
+    include_values: bool = True,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Tools 1-8 together: every driver for a SKU grouped by category (catalog order), with the
+    driver list and values fetched once instead of once per category tool.
+    """
+    drivers = get_product_drivers(_norm_upper(sku_id))
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for row in _attach_values(drivers, sku_id, customer_id, location_id, as_of_date, include_values):
+        grouped.setdefault(row["category"], []).append(row)
+    return grouped
+
+
 # ======================================================================================
 # 9) ABC/XYZ Class fetcher
 # ======================================================================================
@@ -341,164 +441,225 @@ def fetch_relevant_products_by_abc_xyz(
     location_id_u = _norm_upper(location_id)
     skus = find_skus_by_class(location_id_u, abc_class=abc_class, xyz_classes=xyz_classes)
     # Return full master-data rows when possible
-    master_rows = {r["sku_id"]: r for r in list_product_master_data(location_id_u)}
+    # Copy out of the read-only DB rows: the result travels through graph state / UI tables.
+    master_rows = {r["sku_id"]: dict(r) for r in list_product_master_data(location_id_u)}
     return [master_rows.get(sku, {"sku_id": sku, "location_id": location_id_u}) for sku in skus]
 
 
 # ======================================================================================
-# Demand boost calculators (step-based, if/elif)
-# Note: POS drivers are intentionally excluded (not causal factor per request)
+# Driver rung tables (shared by the scalar calculators and the batch kernel)
 # ======================================================================================
 
 
-def calculate_social_signal_demand_boost(
-    sku_id: str,
-    customer_id: str = "BLINKIT",
-    location_id: str = "BANGALORE",
-    as_of_date: str = DEFAULT_AS_OF_DATE,
-) -> Dict[str, Any]:
+def _above(threshold: float) -> float:
+    # Smallest float > threshold: turns an inclusive "x <= t" rung into a half-open interval edge.
+    return math.nextafter(threshold, math.inf)
+
+
+# Each category ladder as half-open intervals per driver:
+# (driver, ascending edges, tailwind per interval, headwind per interval), interval index =
+# number of edges <= x. Booleans are encoded as 1.0 (True) / 0.0 (False); missing is NaN.
+_BoostRung = Tuple[str, Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]]
+
+_SOCIAL_RUNGS: Tuple[_BoostRung, ...] = (
+    # Ingredient Trend Velocity: WoW search velocity, typically 0..1
+    ("Ingredient Trend Velocity", (_above(-0.15), _above(-0.05), 0.05, 0.15, 0.30),
+     (0.0, 0.0, 0.0, 0.10, 0.25, 0.40), (0.30, 0.15, 0.0, 0.0, 0.0, 0.0)),
+    # Brand Sentiment Score: 0..100
+    ("Brand Sentiment Score", (_above(40), _above(50), 60, 70, 80),
+     (0.0, 0.0, 0.0, 0.10, 0.20, 0.30), (0.35, 0.20, 0.0, 0.0, 0.0, 0.0)),
+    # Viral Hashtag Volume: mentions/day
+    ("Viral Hashtag Volume", (200, 600, 1200, 2000),
+     (0.0, 0.0, 0.05, 0.15, 0.25), (0.10, 0.0, 0.0, 0.0, 0.0)),
+    # Influencer Mention Count: mentions/day
+    ("Influencer Mention Count", (2, 5, 15, 30),
+     (0.0, 0.0, 0.05, 0.15, 0.25), (0.10, 0.0, 0.0, 0.0, 0.0)),
+)
+_MARKETING_RUNGS: Tuple[_BoostRung, ...] = (
+    # Performance Marketing Spend: INR/day
+    ("Performance Marketing Spend", (15000, 30000, 60000, 120000, 200000),
+     (0.0, 0.0, 0.0, 0.15, 0.25, 0.35), (0.35, 0.20, 0.0, 0.0, 0.0, 0.0)),
+    # Campaign Click-Through-Rate (CTR): 0..1
+    ("Campaign Click-Through-Rate (CTR)", (0.006, 0.010, 0.012, 0.018, 0.025),
+     (0.0, 0.0, 0.0, 0.10, 0.18, 0.25), (0.30, 0.15, 0.0, 0.0, 0.0, 0.0)),
+    # Video Completion Rate: 0..1
+    ("Video Completion Rate", (0.10, 0.20, 0.30, 0.40),
+     (0.0, 0.0, 0.08, 0.15, 0.20), (0.20, 0.0, 0.0, 0.0, 0.0)),
+    ("Retargeting Pool Size", (1500, 6000, 12000, 20000),
+     (0.0, 0.0, 0.06, 0.12, 0.20), (0.15, 0.0, 0.0, 0.0, 0.0)),
+)
+_TRADE_PROMO_RUNGS: Tuple[_BoostRung, ...] = (
+    # On-Platform Discount Depth: 0..1
+    ("On-Platform Discount Depth", (0.01, 0.05, 0.10, 0.20, 0.30),
+     (0.0, 0.0, 0.10, 0.20, 0.35, 0.45), (0.10, 0.0, 0.0, 0.0, 0.0, 0.0)),
+    ("Bundle Offer Active Status", (1.0,), (0.0, 0.15), (0.0, 0.0)),
+    ("Flash Sale Participation", (1.0,), (0.0, 0.25), (0.0, 0.0)),
+    # Cart-Level Offer Conversion: 0..1
+    ("Cart-Level Offer Conversion", (0.01, 0.02, 0.03, 0.06, 0.10),
+     (0.0, 0.0, 0.0, 0.06, 0.12, 0.20), (0.15, 0.08, 0.0, 0.0, 0.0, 0.0)),
+)
+_DIGITAL_SHELF_RUNGS: Tuple[_BoostRung, ...] = (
+    # Share of Search (Keyword Rank): rank (lower is better)
+    ("Share of Search (Keyword Rank)", (_above(3), _above(6), _above(10), 15, 25),
+     (0.30, 0.20, 0.10, 0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 0.0, 0.20, 0.35)),
+    ("Product Detail Page (PDP) Views", (8000, 15000, 20000, 40000, 60000),
+     (0.0, 0.0, 0.0, 0.10, 0.18, 0.25), (0.25, 0.15, 0.0, 0.0, 0.0, 0.0)),
+    # Buy Box Win Rate: 0..1
+    ("Buy Box Win Rate", (0.70, 0.80, 0.90, 0.95),
+     (0.0, 0.0, 0.06, 0.12, 0.20), (0.35, 0.15, 0.0, 0.0, 0.0)),
+    ("Rating & Review Velocity", (3, 10, 25, 40),
+     (0.0, 0.0, 0.06, 0.12, 0.20), (0.20, 0.0, 0.0, 0.0, 0.0)),
+)
+_WEATHER_RUNGS: Tuple[_BoostRung, ...] = (
+    # Max Temperature Forecast: °C
+    ("Max Temperature Forecast", (_above(15), _above(20), 26, 30, 35),
+     (0.0, 0.0, 0.0, 0.15, 0.25, 0.35), (0.35, 0.20, 0.0, 0.0, 0.0, 0.0)),
+    # Humidity Index: 0..1
+    ("Humidity Index", (_above(0.25), 0.50, 0.65, 0.80),
+     (0.0, 0.0, 0.06, 0.12, 0.20), (0.15, 0.0, 0.0, 0.0, 0.0)),
+    ("UV Index", (_above(1.5), 4, 6, 8),
+     (0.0, 0.0, 0.08, 0.15, 0.25), (0.15, 0.0, 0.0, 0.0, 0.0)),
+    ("Air Quality Index (AQI)", (40, 100, 150, 200),
+     (0.0, 0.0, 0.06, 0.12, 0.20), (0.10, 0.0, 0.0, 0.0, 0.0)),
+)
+# Competitor keeps one signed accumulator: "tailwinds" carry the signed net, headwinds stay 0.
+_COMPETITOR_RUNGS: Tuple[_BoostRung, ...] = (
+    # Competitor Price Gap: INR; negative => we are cheaper (tailwind)
+    ("Competitor Price Gap", (_above(-20), _above(-5), 10, 30),
+     (0.40, 0.20, 0.0, -0.20, -0.40), (0.0,) * 5),
+    ("Competitor Out-of-Stock Status", (1.0,), (0.0, 0.50), (0.0, 0.0)),
+    # Competitor Promo Intensity: 0..1; higher => headwind
+    ("Competitor Promo Intensity", (0.10, 0.20, 0.30), (0.0, -0.15, -0.30, -0.45), (0.0,) * 4),
+    ("Competitor New Launch Signal", (1.0,), (0.0, -0.25), (0.0, 0.0)),
+)
+
+
+# Boolean drivers (parsed with _safe_bool); every other driver is parsed with _safe_float.
+_BOOL_DRIVERS = frozenset(
+    {
+        "Bundle Offer Active Status",
+        "Flash Sale Participation",
+        "Competitor Out-of-Stock Status",
+        "Competitor New Launch Signal",
+    }
+)
+
+
+def _rung_winds(rungs: Tuple[_BoostRung, ...], inputs: Sequence[Any]) -> Tuple[float, float]:
     """
-    Uses: Ingredient Trend Velocity, Brand Sentiment Score, Viral Hashtag Volume, Influencer Mention Count
-    Returns a dict with boost_percent and supporting details.
+    Scalar evaluation of one category's rung table: (tailwinds, headwinds), summed in driver order.
+    inputs line up with rungs; None (missing) and NaN contribute nothing.
     """
-    values = _get_values(sku_id, customer_id, location_id, as_of_date)
-    trend = _safe_float(values.get("Ingredient Trend Velocity"))  # typically 0..1 (WoW velocity)
-    sentiment = _safe_float(values.get("Brand Sentiment Score"))  # 0..100
-    hashtags = _safe_float(values.get("Viral Hashtag Volume"))  # mentions/day
-    influencer = _safe_float(values.get("Influencer Mention Count"))  # mentions/day
-
-    # Build a simple net score: tailwinds - headwinds
     tailwinds = 0.0
     headwinds = 0.0
-    if trend is not None:
-        if trend >= 0.30:
-            tailwinds += 0.40
-        elif trend >= 0.15:
-            tailwinds += 0.25
-        elif trend >= 0.05:
-            tailwinds += 0.10
-        elif trend <= -0.15:
-            headwinds += 0.30
-        elif trend <= -0.05:
-            headwinds += 0.15
-    if sentiment is not None:
-        if sentiment >= 80:
-            tailwinds += 0.30
-        elif sentiment >= 70:
-            tailwinds += 0.20
-        elif sentiment >= 60:
-            tailwinds += 0.10
-        elif sentiment <= 40:
-            headwinds += 0.35
-        elif sentiment <= 50:
-            headwinds += 0.20
-    if hashtags is not None:
-        if hashtags >= 2000:
-            tailwinds += 0.25
-        elif hashtags >= 1200:
-            tailwinds += 0.15
-        elif hashtags >= 600:
-            tailwinds += 0.05
-        elif hashtags < 200:
-            headwinds += 0.10
-    if influencer is not None:
-        if influencer >= 30:
-            tailwinds += 0.25
-        elif influencer >= 15:
-            tailwinds += 0.15
-        elif influencer >= 5:
-            tailwinds += 0.05
-        elif influencer < 2:
-            headwinds += 0.10
+    for (_, edges, tails, heads), x in zip(rungs, inputs):
+        if x is None or x != x:
+            continue
+        i = bisect_right(edges, x)
+        tailwinds += tails[i]
+        headwinds += heads[i]
+    return tailwinds, headwinds
+
+
+def _idle_promo_headwind(discount: Optional[float], bundle: Optional[bool], flash: Optional[bool], _cart: Any) -> float:
+    # Small extra headwind if no promo levers are active at all (to enable - scenarios)
+    if bundle is not True and flash is not True and discount is not None and discount < 0.02:
+        return 0.10
+    return 0.0
+
 
+@dataclass(frozen=True, slots=True)
+class _CategorySpec:
+    """
+    One boost category: its driver rung table, the net-score ladder and an optional extra
+    headwind computed from the parsed inputs (in rung order).
+    """
+
+    category: str
+    rungs: Tuple[_BoostRung, ...]
+    ladder_bounds: Tuple[float, ...] = _SIGNED_SCORE_BOUNDS
+    ladder_boosts: Tuple[float, ...] = _SIGNED_SCORE_BOOSTS
+    extra_headwind: Optional[Callable[..., float]] = None
+    driver_names: Tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "driver_names", tuple(rung[0] for rung in self.rungs))
+
+
+# Breakdown key -> spec, in calculate_final_demand_boost order.
+_CATEGORY_SPECS: Mapping[str, _CategorySpec] = MappingProxyType(
+    {
+        "social": _CategorySpec(_CAT_SOCIAL, _SOCIAL_RUNGS),
+        "marketing": _CategorySpec(_CAT_MARKETING, _MARKETING_RUNGS),
+        "trade_promo": _CategorySpec(_CAT_TRADE_PROMO, _TRADE_PROMO_RUNGS, extra_headwind=_idle_promo_headwind),
+        "digital_shelf": _CategorySpec(_CAT_DIGITAL_SHELF, _DIGITAL_SHELF_RUNGS),
+        "weather": _CategorySpec(_CAT_WEATHER, _WEATHER_RUNGS),
+        # Competitor keeps one signed accumulator (headwinds are all 0) and its own ladder.
+        "competitor": _CategorySpec(
+            _CAT_COMPETITOR, _COMPETITOR_RUNGS, _COMPETITOR_NET_BOUNDS, _COMPETITOR_NET_BOOSTS
+        ),
+    }
+)
+
+
+def _calculate_category_boost(spec: _CategorySpec, values: Mapping[str, Any], as_of_date: str) -> Dict[str, Any]:
+    inputs = tuple(
+        (_safe_bool if name in _BOOL_DRIVERS else _safe_float)(values.get(name)) for name in spec.driver_names
+    )
+    # Build a simple net score: tailwinds - headwinds
+    tailwinds, headwinds = _rung_winds(spec.rungs, inputs)
+    if spec.extra_headwind is not None:
+        headwinds += spec.extra_headwind(*inputs)
     net_score = tailwinds - headwinds
-    boost = _step_boost_from_signed_score(net_score)
+    boost = spec.ladder_boosts[bisect_left(spec.ladder_bounds, net_score)]
+    # One literal per call; the fixed keys cost less than copying a template dict and
+    # re-assigning four of its five fields.
     return {
-        "category": "Real Time Social Signals",
+        "category": spec.category,
         "boost_percent": boost,
         "net_score": round(float(net_score), 4),
         "as_of_date": as_of_date,
-        "inputs": {
-            "Ingredient Trend Velocity": trend,
-            "Brand Sentiment Score": sentiment,
-            "Viral Hashtag Volume": hashtags,
-            "Influencer Mention Count": influencer,
-        },
+        "inputs": dict(zip(spec.driver_names, inputs)),
     }
 
 
-def calculate_marketing_spend_demand_boost(
+# ======================================================================================
+# Demand boost calculators (step-based, via the rung tables above)
+# Note: POS drivers are intentionally excluded (not causal factor per request)
+# ======================================================================================
+
+
+def calculate_social_signal_demand_boost(
     sku_id: str,
     customer_id: str = "BLINKIT",
     location_id: str = "BANGALORE",
     as_of_date: str = DEFAULT_AS_OF_DATE,
+    *,
+    values: Optional[Mapping[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
-    Uses: Performance Marketing Spend, CTR, Video Completion Rate, Retargeting Pool Size
+    Uses: Ingredient Trend Velocity, Brand Sentiment Score, Viral Hashtag Volume, Influencer Mention Count
+    Returns a dict with boost_percent and supporting details.
     """
-    values = _get_values(sku_id, customer_id, location_id, as_of_date)
-    spend = _safe_float(values.get("Performance Marketing Spend"))  # INR/day
-    ctr = _safe_float(values.get("Campaign Click-Through-Rate (CTR)"))  # 0..1
-    vcr = _safe_float(values.get("Video Completion Rate"))  # 0..1
-    retarget = _safe_float(values.get("Retargeting Pool Size"))
+    if values is None:
+        values = _get_values(sku_id, customer_id, location_id, as_of_date)
+    return _calculate_category_boost(_CATEGORY_SPECS["social"], values, as_of_date)
 
-    tailwinds = 0.0
-    headwinds = 0.0
-    if spend is not None:
-        if spend >= 200000:
-            tailwinds += 0.35
-        elif spend >= 120000:
-            tailwinds += 0.25
-        elif spend >= 60000:
-            tailwinds += 0.15
-        elif spend < 15000:
-            headwinds += 0.35
-        elif spend < 30000:
-            headwinds += 0.20
-    if ctr is not None:
-        if ctr >= 0.025:
-            tailwinds += 0.25
-        elif ctr >= 0.018:
-            tailwinds += 0.18
-        elif ctr >= 0.012:
-            tailwinds += 0.10
-        elif ctr < 0.006:
-            headwinds += 0.30
-        elif ctr < 0.010:
-            headwinds += 0.15
-    if vcr is not None:
-        if vcr >= 0.40:
-            tailwinds += 0.20
-        elif vcr >= 0.30:
-            tailwinds += 0.15
-        elif vcr >= 0.20:
-            tailwinds += 0.08
-        elif vcr < 0.10:
-            headwinds += 0.20
-    if retarget is not None:
-        if retarget >= 20000:
-            tailwinds += 0.20
-        elif retarget >= 12000:
-            tailwinds += 0.12
-        elif retarget >= 6000:
-            tailwinds += 0.06
-        elif retarget < 1500:
-            headwinds += 0.15
 
-    net_score = tailwinds - headwinds
-    boost = _step_boost_from_signed_score(net_score)
-    return {
-        "category": "Real Time Marketing Spend and Engagement Signals",
-        "boost_percent": boost,
-        "net_score": round(float(net_score), 4),
-        "as_of_date": as_of_date,
-        "inputs": {
-            "Performance Marketing Spend": spend,
-            "Campaign Click-Through-Rate (CTR)": ctr,
-            "Video Completion Rate": vcr,
-            "Retargeting Pool Size": retarget,
-        },
-    }
+def calculate_marketing_spend_demand_boost(
+    sku_id: str,
+    customer_id: str = "BLINKIT",
+    location_id: str = "BANGALORE",
+    as_of_date: str = DEFAULT_AS_OF_DATE,
+    *,
+    values: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Uses: Performance Marketing Spend, CTR, Video Completion Rate, Retargeting Pool Size
+    """
+    if values is None:
+        values = _get_values(sku_id, customer_id, location_id, as_of_date)
+    return _calculate_category_boost(_CATEGORY_SPECS["marketing"], values, as_of_date)
 
 
 def calculate_trade_promo_demand_boost(
@@ -506,63 +667,15 @@ def calculate_trade_promo_demand_boost(
     customer_id: str = "BLINKIT",
     location_id: str = "BANGALORE",
     as_of_date: str = DEFAULT_AS_OF_DATE,
+    *,
+    values: Optional[Mapping[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Uses: Discount Depth, Bundle Status, Flash Sale Status, Cart-Level Offer Conversion
     """
-    values = _get_values(sku_id, customer_id, location_id, as_of_date)
-    discount = _safe_float(values.get("On-Platform Discount Depth"))  # 0..1
-    bundle = _safe_bool(values.get("Bundle Offer Active Status"))
-    flash = _safe_bool(values.get("Flash Sale Participation"))
-    cart_conv = _safe_float(values.get("Cart-Level Offer Conversion"))  # 0..1
-
-    tailwinds = 0.0
-    headwinds = 0.0
-    if discount is not None:
-        if discount >= 0.30:
-            tailwinds += 0.45
-        elif discount >= 0.20:
-            tailwinds += 0.35
-        elif discount >= 0.10:
-            tailwinds += 0.20
-        elif discount >= 0.05:
-            tailwinds += 0.10
-        elif discount < 0.01:
-            headwinds += 0.10
-    if bundle is True:
-        tailwinds += 0.15
-    if flash is True:
-        tailwinds += 0.25
-    if cart_conv is not None:
-        if cart_conv >= 0.10:
-            tailwinds += 0.20
-        elif cart_conv >= 0.06:
-            tailwinds += 0.12
-        elif cart_conv >= 0.03:
-            tailwinds += 0.06
-        elif cart_conv < 0.01:
-            headwinds += 0.15
-        elif cart_conv < 0.02:
-            headwinds += 0.08
-
-    # Small extra headwind if no promo levers are active at all (to enable - scenarios)
-    if (bundle is False or bundle is None) and (flash is False or flash is None) and (discount is not None and discount < 0.02):
-        headwinds += 0.10
-
-    net_score = tailwinds - headwinds
-    boost = _step_boost_from_signed_score(net_score)
-    return {
-        "category": "Real Time Trade Promo Signals",
-        "boost_percent": boost,
-        "net_score": round(float(net_score), 4),
-        "as_of_date": as_of_date,
-        "inputs": {
-            "On-Platform Discount Depth": discount,
-            "Bundle Offer Active Status": bundle,
-            "Flash Sale Participation": flash,
-            "Cart-Level Offer Conversion": cart_conv,
-        },
-    }
+    if values is None:
+        values = _get_values(sku_id, customer_id, location_id, as_of_date)
+    return _calculate_category_boost(_CATEGORY_SPECS["trade_promo"], values, as_of_date)
 
 
 def calculate_digital_shelf_demand_boost(
@@ -570,75 +683,15 @@ def calculate_digital_shelf_demand_boost(
     customer_id: str = "BLINKIT",
     location_id: str = "BANGALORE",
     as_of_date: str = DEFAULT_AS_OF_DATE,
+    *,
+    values: Optional[Mapping[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Uses: Keyword Rank, PDP Views, Buy Box Win Rate, Rating & Review Velocity
     """
-    values = _get_values(sku_id, customer_id, location_id, as_of_date)
-    rank = _safe_float(values.get("Share of Search (Keyword Rank)"))  # rank (lower is better)
-    pdp = _safe_float(values.get("Product Detail Page (PDP) Views"))
-    buybox = _safe_float(values.get("Buy Box Win Rate"))  # 0..1
-    reviews = _safe_float(values.get("Rating & Review Velocity"))
-
-    tailwinds = 0.0
-    headwinds = 0.0
-    if rank is not None:
-        if rank <= 3:
-            tailwinds += 0.30
-        elif rank <= 6:
-            tailwinds += 0.20
-        elif rank <= 10:
-            tailwinds += 0.10
-        elif rank >= 25:
-            headwinds += 0.35
-        elif rank >= 15:
-            headwinds += 0.20
-    if pdp is not None:
-        if pdp >= 60000:
-            tailwinds += 0.25
-        elif pdp >= 40000:
-            tailwinds += 0.18
-        elif pdp >= 20000:
-            tailwinds += 0.10
-        elif pdp < 8000:
-            headwinds += 0.25
-        elif pdp < 15000:
-            headwinds += 0.15
-    if buybox is not None:
-        if buybox >= 0.95:
-            tailwinds += 0.20
-        elif buybox >= 0.90:
-            tailwinds += 0.12
-        elif buybox >= 0.80:
-            tailwinds += 0.06
-        elif buybox < 0.70:
-            headwinds += 0.35
-        elif buybox < 0.85:
-            headwinds += 0.15
-    if reviews is not None:
-        if reviews >= 40:
-            tailwinds += 0.20
-        elif reviews >= 25:
-            tailwinds += 0.12
-        elif reviews >= 10:
-            tailwinds += 0.06
-        elif reviews < 3:
-            headwinds += 0.20
-
-    net_score = tailwinds - headwinds
-    boost = _step_boost_from_signed_score(net_score)
-    return {
-        "category": "Real Time Digital Shelf Analytics Signals",
-        "boost_percent": boost,
-        "net_score": round(float(net_score), 4),
-        "as_of_date": as_of_date,
-        "inputs": {
-            "Share of Search (Keyword Rank)": rank,
-            "Product Detail Page (PDP) Views": pdp,
-            "Buy Box Win Rate": buybox,
-            "Rating & Review Velocity": reviews,
-        },
-    }
+    if values is None:
+        values = _get_values(sku_id, customer_id, location_id, as_of_date)
+    return _calculate_category_boost(_CATEGORY_SPECS["digital_shelf"], values, as_of_date)
 
 
 def calculate_weather_environment_demand_boost(
@@ -646,92 +699,15 @@ def calculate_weather_environment_demand_boost(
     customer_id: str = "BLINKIT",
     location_id: str = "BANGALORE",
     as_of_date: str = DEFAULT_AS_OF_DATE,
+    *,
+    values: Optional[Mapping[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Uses: Max Temperature Forecast, Humidity Index, UV Index, AQI
     """
-    values = _get_values(sku_id, customer_id, location_id, as_of_date)
-    temp = _safe_float(values.get("Max Temperature Forecast"))  # °C
-    humidity = _safe_float(values.get("Humidity Index"))  # 0..1
-    uv = _safe_float(values.get("UV Index"))
-    aqi = _safe_float(values.get("Air Quality Index (AQI)"))
-
-    tailwinds = 0.0
-    headwinds = 0.0
-    if temp is not None:
-        if temp >= 35:
-            tailwinds += 0.35
-        elif temp >= 30:
-            tailwinds += 0.25
-        elif temp >= 26:
-            tailwinds += 0.15
-        elif temp <= 15:
-            headwinds += 0.35
-        elif temp <= 20:
-            headwinds += 0.20
-    if humidity is not None:
-        if humidity >= 0.80:
-            tailwinds += 0.20
-        elif humidity >= 0.65:
-            tailwinds += 0.12
-        elif humidity >= 0.50:
-            tailwinds += 0.06
-        elif humidity <= 0.25:
-            headwinds += 0.15
-    if uv is not None:
-        if uv >= 8:
-            tailwinds += 0.25
-        elif uv >= 6:
-            tailwinds += 0.15
-        elif uv >= 4:
-            tailwinds += 0.08
-        elif uv <= 1.5:
-            headwinds += 0.15
-    if aqi is not None:
-        if aqi >= 200:
-            tailwinds += 0.20
-        elif aqi >= 150:
-            tailwinds += 0.12
-        elif aqi >= 100:
-            tailwinds += 0.06
-        elif aqi < 40:
-            headwinds += 0.10
-
-    net_score = tailwinds - headwinds
-    boost = _step_boost_from_signed_score(net_score)
-    return {
-        "category": "Real Time Weather/Environment Signals",
-        "boost_percent": boost,
-        "net_score": round(float(net_score), 4),
-        "as_of_date": as_of_date,
-        "inputs": {
-            "Max Temperature Forecast": temp,
-            "Humidity Index": humidity,
-            "UV Index": uv,
-            "Air Quality Index (AQI)": aqi,
-        },
-    }
-
-
-def _step_boost_from_competitor_net(net_score: float) -> float:
-    """
-    Competitor can be favorable or unfavorable; map net_score into step boosts.
-    Positive => boost, Negative => reduction.
-    """
-    if net_score <= -0.80:
-        return -0.30
-    elif net_score <= -0.50:
-        return -0.20
-    elif net_score <= -0.20:
-        return -0.10
-    elif net_score < 0.20:
-        return 0.0
-    elif net_score < 0.50:
-        return 0.10
-    elif net_score < 0.80:
-        return 0.20
-    else:
-        return 0.30
+    if values is None:
+        values = _get_values(sku_id, customer_id, location_id, as_of_date)
+    return _calculate_category_boost(_CATEGORY_SPECS["weather"], values, as_of_date)
 
 
 def calculate_competitor_data_demand_boost(
@@ -739,57 +715,94 @@ def calculate_competitor_data_demand_boost(
     customer_id: str = "BLINKIT",
     location_id: str = "BANGALORE",
     as_of_date: str = DEFAULT_AS_OF_DATE,
+    *,
+    values: Optional[Mapping[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Uses: Competitor Price Gap, Competitor OOS, Competitor Promo Intensity, Competitor New Launch Signal
 
     Note: This category can produce negative boost (i.e., headwinds).
     """
-    values = _get_values(sku_id, customer_id, location_id, as_of_date)
-    price_gap = _safe_float(values.get("Competitor Price Gap"))  # INR; negative => we cheaper (tailwind)
-    oos = _safe_bool(values.get("Competitor Out-of-Stock Status"))
-    promo = _safe_float(values.get("Competitor Promo Intensity"))  # 0..1; higher => headwind
-    new_launch = _safe_bool(values.get("Competitor New Launch Signal"))
-
-    # net_score: positive tailwinds, negative headwinds
-    net_score = 0.0
-    if price_gap is not None:
-        # We are cheaper -> tailwind, we are more expensive -> headwind
-        if price_gap <= -20:
-            net_score += 0.40
-        elif price_gap <= -5:
-            net_score += 0.20
-        elif price_gap >= 30:
-            net_score -= 0.40
-        elif price_gap >= 10:
-            net_score -= 0.20
-    if oos is True:
-        net_score += 0.50
-    if promo is not None:
-        if promo >= 0.30:
-            net_score -= 0.45
-        elif promo >= 0.20:
-            net_score -= 0.30
-        elif promo >= 0.10:
-            net_score -= 0.15
-    if new_launch is True:
-        net_score -= 0.25
-
-    boost = _step_boost_from_competitor_net(net_score)
-    return {
-        "category": "Real Time Competitor Data",
-        "boost_percent": boost,
-        "net_score": round(float(net_score), 4),
-        "as_of_date": as_of_date,
-        "inputs": {
-            "Competitor Price Gap": price_gap,
-            "Competitor Out-of-Stock Status": oos,
-            "Competitor Promo Intensity": promo,
-            "Competitor New Launch Signal": new_launch,
-        },
-    }
+    if values is None:
+        values = _get_values(sku_id, customer_id, location_id, as_of_date)
+    return _calculate_category_boost(_CATEGORY_SPECS["competitor"], values, as_of_date)
+
+
+# ======================================================================================
+# Batch kernel: all six category boosts for N contexts at once (numpy)
+# ======================================================================================
 
 
+# Output columns of calculate_all_boosts_batch(), in calculate_final_demand_boost order.
+BATCH_BOOST_CATEGORIES: Tuple[str, ...] = tuple(_CATEGORY_SPECS)
+# (rungs, ladder bounds, ladder boosts) per output column.
+_BATCH_SPECS = tuple((spec.rungs, spec.ladder_bounds, spec.ladder_boosts) for spec in _CATEGORY_SPECS.values())
+# Column order of the (N, K) matrix consumed by calculate_all_boosts_batch().
+BATCH_DRIVER_COLUMNS: Tuple[str, ...] = tuple(rung[0] for rungs, _, _ in _BATCH_SPECS for rung in rungs)
+_BATCH_COL: Dict[str, int] = {name: i for i, name in enumerate(BATCH_DRIVER_COLUMNS)}
+# (column, driver, parser) per matrix column, resolved once so coercion is a single walk.
+_DRIVER_SCHEMA: Tuple[Tuple[int, str, Callable[[Any], Any]], ...] = tuple(
+    (j, name, _safe_bool if name in _BOOL_DRIVERS else _safe_float) for j, name in enumerate(BATCH_DRIVER_COLUMNS)
+)
+
+
+def _coerce_driver_row(values: Mapping[str, Any], out: Any) -> None:
+    # Parse one driver mapping into a preallocated NaN-filled float64 row (bools as 1.0/0.0).
+    get = values.get
+    for j, name, parse in _DRIVER_SCHEMA:
+        v = parse(get(name))
+        if v is not None:
+            out[j] = v
+
+
+def build_driver_matrix(rows: Sequence[Mapping[str, Any]]) -> Any:
+    """
+    (N, K) float64 matrix of BATCH_DRIVER_COLUMNS for N driver-value mappings (as returned by
+    get_demand_driver_values), parsed like the scalar calculators; missing/unparseable -> NaN.
+    """
+    import numpy as np
+
+    out = np.full((len(rows), len(BATCH_DRIVER_COLUMNS)), np.nan, dtype=np.float64)
+    for i, values in enumerate(rows):
+        _coerce_driver_row(values, out[i])
+    return out
+
+
+def calculate_all_boosts_batch(values_array: Any) -> Any:
+    """
+    Vectorized equivalent of the six calculate_*_demand_boost functions.
+
+    values_array: (N, K) float64 matrix laid out as BATCH_DRIVER_COLUMNS (see build_driver_matrix).
+    Returns an (N, 6) matrix of boost fractions, columns in BATCH_BOOST_CATEGORIES order.
+    Float64 and the same accumulation order as the scalar code, so results match exactly.
+    """
+    import numpy as np
+
+    x = np.asarray(values_array, dtype=np.float64)
+    missing = np.isnan(x)
+    out = np.empty((x.shape[0], len(_BATCH_SPECS)), dtype=np.float64)
+    for c, (rungs, ladder_bounds, ladder_boosts) in enumerate(_BATCH_SPECS):
+        tailwinds = np.zeros(x.shape[0])
+        headwinds = np.zeros(x.shape[0])
+        for name, edges, tails, heads in rungs:
+            j = _BATCH_COL[name]
+            idx = np.searchsorted(np.asarray(edges, dtype=np.float64), x[:, j], side="right")
+            tailwinds = tailwinds + np.where(missing[:, j], 0.0, np.asarray(tails)[idx])
+            headwinds = headwinds + np.where(missing[:, j], 0.0, np.asarray(heads)[idx])
+        if rungs is _TRADE_PROMO_RUNGS:
+            # Extra headwind when no promo lever is active (see calculate_trade_promo_demand_boost).
+            discount = x[:, _BATCH_COL["On-Platform Discount Depth"]]
+            idle = (
+                (x[:, _BATCH_COL["Bundle Offer Active Status"]] != 1.0)
+                & (x[:, _BATCH_COL["Flash Sale Participation"]] != 1.0)
+                & (discount < 0.02)
+            )
+            headwinds = headwinds + np.where(idle, 0.10, 0.0)
+        out[:, c] = _step_boosts(tailwinds - headwinds, ladder_bounds, ladder_boosts)
+    return out
+
+
+@_memoized_tool
 def calculate_final_demand_boost(
     sku_id: str,
     customer_id: str = "BLINKIT",
@@ -802,13 +815,16 @@ def calculate_final_demand_boost(
     Aggregates per-category boosts (excluding POS drivers).
     Returns total_boost_percent plus a breakdown.
     """
+    # One driver lookup shared by all six calculators.
+    values = _get_values(sku_id, customer_id, location_id, as_of_date)
+    args = (sku_id, customer_id, location_id, as_of_date)
     breakdown = {
-        "social": calculate_social_signal_demand_boost(sku_id, customer_id, location_id, as_of_date),
-        "marketing": calculate_marketing_spend_demand_boost(sku_id, customer_id, location_id, as_of_date),
-        "trade_promo": calculate_trade_promo_demand_boost(sku_id, customer_id, location_id, as_of_date),
-        "digital_shelf": calculate_digital_shelf_demand_boost(sku_id, customer_id, location_id, as_of_date),
-        "weather": calculate_weather_environment_demand_boost(sku_id, customer_id, location_id, as_of_date),
-        "competitor": calculate_competitor_data_demand_boost(sku_id, customer_id, location_id, as_of_date),
+        "social": calculate_social_signal_demand_boost(*args, values=values),
+        "marketing": calculate_marketing_spend_demand_boost(*args, values=values),
+        "trade_promo": calculate_trade_promo_demand_boost(*args, values=values),
+        "digital_shelf": calculate_digital_shelf_demand_boost(*args, values=values),
+        "weather": calculate_weather_environment_demand_boost(*args, values=values),
+        "competitor": calculate_competitor_data_demand_boost(*args, values=values),
     }
     raw_total = float(sum(v["boost_percent"] for v in breakdown.values()))
 
@@ -831,6 +847,7 @@ def calculate_final_demand_boost(
     }
 
 
+@_memoized_tool
 def calculate_final_demand_forecast(
     sku_id: str,
     customer_id: str = "BLINKIT",
@@ -883,8 +900,9 @@ def build_boost_reasoning_context(
         "location_id": _norm_upper(location_id),
         "as_of_date": as_of_date,
         "scenario": scenario,
-        "driver_values": values,
-        "driver_notes": notes,
+        # Plain dicts: the DB accessors return read-only views, and this payload is shown to the LLM.
+        "driver_values": dict(values),
+        "driver_notes": dict(notes),
         "boost": final_boost,
     }
 
@@ -894,6 +912,25 @@ def build_boost_reasoning_context(
 # ======================================================================================
 
 
+# Driver names each fetch tool must return for the Critic to mark it "ok" (tool order = report order).
+_REQUIRED_BY_TOOL: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "fetch_consensus_demand_driver": ("Statistical Baseline Forecast",),
+        # The category tools must return exactly the drivers their calculator reads.
+        "fetch_social_signal_drivers": tuple(r[0] for r in _SOCIAL_RUNGS),
+        "fetch_marketing_spend_drivers": tuple(r[0] for r in _MARKETING_RUNGS),
+        "fetch_trade_promo_drivers": tuple(r[0] for r in _TRADE_PROMO_RUNGS),
+        "fetch_digital_shelf_drivers": tuple(r[0] for r in _DIGITAL_SHELF_RUNGS),
+        "fetch_weather_environment_drivers": tuple(r[0] for r in _WEATHER_RUNGS),
+        "fetch_competitor_data_drivers": tuple(r[0] for r in _COMPETITOR_RUNGS),
+        # POS intentionally excluded (not a causal demand factor per your design)
+    }
+)
+_REQUIRED_SETS: Mapping[str, frozenset] = MappingProxyType({k: frozenset(v) for k, v in _REQUIRED_BY_TOOL.items()})
+_ALL_REQUIRED_DRIVERS: frozenset = frozenset().union(*_REQUIRED_SETS.values())
+
+
+@_memoized_tool
 def critic_review_consensus_demand_boost(
     sku_id: str,
     customer_id: str = "BLINKIT",
@@ -925,47 +962,6 @@ def critic_review_consensus_demand_boost(
     outside_thresholds = total > upper_threshold or total < lower_threshold
 
     # 2) Tool execution "health" = do we have the expected driver values?
-    required_by_tool: Dict[str, List[str]] = {
-        "fetch_consensus_demand_driver": ["Statistical Baseline Forecast"],
-        "fetch_social_signal_drivers": [
-            "Ingredient Trend Velocity",
-            "Brand Sentiment Score",
-            "Viral Hashtag Volume",
-            "Influencer Mention Count",
-        ],
-        "fetch_marketing_spend_drivers": [
-            "Performance Marketing Spend",
-            "Campaign Click-Through-Rate (CTR)",
-            "Video Completion Rate",
-            "Retargeting Pool Size",
-        ],
-        "fetch_trade_promo_drivers": [
-            "On-Platform Discount Depth",
-            "Bundle Offer Active Status",
-            "Flash Sale Participation",
-            "Cart-Level Offer Conversion",
-        ],
-        "fetch_digital_shelf_drivers": [
-            "Share of Search (Keyword Rank)",
-            "Product Detail Page (PDP) Views",
-            "Buy Box Win Rate",
-            "Rating & Review Velocity",
-        ],
-        "fetch_weather_environment_drivers": [
-            "Max Temperature Forecast",
-            "Humidity Index",
-            "UV Index",
-            "Air Quality Index (AQI)",
-        ],
-        "fetch_competitor_data_drivers": [
-            "Competitor Price Gap",
-            "Competitor Out-of-Stock Status",
-            "Competitor Promo Intensity",
-            "Competitor New Launch Signal",
-        ],
-        # POS intentionally excluded (not a causal demand factor per your design)
-    }
-
     values = _get_values(sku_id, customer_id, location_id, as_of_date)
 
     tool_health: Dict[str, Any] = {}
@@ -987,25 +983,28 @@ def critic_review_consensus_demand_boost(
             }
         )
         # In this case, everything should be rerun (or data populated).
-        rerun_recommendations = list(required_by_tool.keys())
-        tool_health = {k: {"status": "missing_context_data", "missing": required_by_tool[k]} for k in required_by_tool}
+        rerun_recommendations = list(_REQUIRED_BY_TOOL)
+        tool_health = {k: {"status": "missing_context_data", "missing": list(v)} for k, v in _REQUIRED_BY_TOOL.items()}
     else:
-        for tool_name, required_names in required_by_tool.items():
-            missing = [n for n in required_names if n not in values]
-            nulls = [n for n in required_names if n in values and values.get(n) is None]
-            if missing or nulls:
-                tool_health[tool_name] = {"status": "incomplete", "missing": missing, "nulls": nulls}
-                rerun_recommendations.append(tool_name)
-                issues.append(
-                    {
-                        "type": "missing_driver_values",
-                        "tool": tool_name,
-                        "missing": missing,
-                        "nulls": nulls,
-                    }
-                )
-            else:
+        present = {k for k, v in values.items() if v is not None}
+        all_present = _ALL_REQUIRED_DRIVERS <= present
+        for tool_name, required_names in _REQUIRED_BY_TOOL.items():
+            if all_present or _REQUIRED_SETS[tool_name] <= present:
                 tool_health[tool_name] = {"status": "ok"}
+                continue
+            # Lists (not set differences) keep the report in declared driver order.
+            missing = [n for n in required_names if n not in values]
+            nulls = [n for n in required_names if n in values and n not in present]
+            tool_health[tool_name] = {"status": "incomplete", "missing": missing, "nulls": nulls}
+            rerun_recommendations.append(tool_name)
+            issues.append(
+                {
+                    "type": "missing_driver_values",
+                    "tool": tool_name,
+                    "missing": missing,
+                    "nulls": nulls,
+                }
+            )
 
     all_tools_ok = all(v.get("status") == "ok" for v in tool_health.values()) if tool_health else False
 
@@ -1043,39 +1042,47 @@ def critic_review_consensus_demand_boost(
 
 
 # Optional registry to make it easy to plug into your agent layer later.
-DEMAND_ACTOR_TOOLS: Dict[str, Any] = {
-    "fetch_consensus_demand_driver": fetch_consensus_demand_driver,
-    "fetch_social_signal_drivers": fetch_social_signal_drivers,
-    "fetch_marketing_spend_drivers": fetch_marketing_spend_drivers,
-    "fetch_trade_promo_drivers": fetch_trade_promo_drivers,
-    "fetch_digital_shelf_drivers": fetch_digital_shelf_drivers,
-    "fetch_weather_environment_drivers": fetch_weather_environment_drivers,
-    "fetch_competitor_data_drivers": fetch_competitor_data_drivers,
-    "fetch_pos_data_drivers": fetch_pos_data_drivers,
-    "fetch_abc_xyz_classification": fetch_abc_xyz_classification,
-    "fetch_relevant_products_by_abc_xyz": fetch_relevant_products_by_abc_xyz,
-    # Boost calculators
-    "calculate_social_signal_demand_boost": calculate_social_signal_demand_boost,
-    "calculate_marketing_spend_demand_boost": calculate_marketing_spend_demand_boost,
-    "calculate_trade_promo_demand_boost": calculate_trade_promo_demand_boost,
-    "calculate_digital_shelf_demand_boost": calculate_digital_shelf_demand_boost,
-    "calculate_weather_environment_demand_boost": calculate_weather_environment_demand_boost,
-    "calculate_competitor_data_demand_boost": calculate_competitor_data_demand_boost,
-    "calculate_final_demand_boost": calculate_final_demand_boost,
-    "calculate_final_demand_forecast": calculate_final_demand_forecast,
-    "build_boost_reasoning_context": build_boost_reasoning_context,
-}
-
-
-CRITIC_TOOLS: Dict[str, Any] = {
-    "critic_review_consensus_demand_boost": critic_review_consensus_demand_boost,
-}
+# Read-only views: the registries are shared by every agent and must not change after import.
+DEMAND_ACTOR_TOOLS: Mapping[str, Any] = MappingProxyType(
+    {
+        "fetch_consensus_demand_driver": fetch_consensus_demand_driver,
+        "fetch_social_signal_drivers": fetch_social_signal_drivers,
+        "fetch_marketing_spend_drivers": fetch_marketing_spend_drivers,
+        "fetch_trade_promo_drivers": fetch_trade_promo_drivers,
+        "fetch_digital_shelf_drivers": fetch_digital_shelf_drivers,
+        "fetch_weather_environment_drivers": fetch_weather_environment_drivers,
+        "fetch_competitor_data_drivers": fetch_competitor_data_drivers,
+        "fetch_pos_data_drivers": fetch_pos_data_drivers,
+        "fetch_all_driver_categories": fetch_all_driver_categories,
+        "fetch_abc_xyz_classification": fetch_abc_xyz_classification,
+        "fetch_relevant_products_by_abc_xyz": fetch_relevant_products_by_abc_xyz,
+        # Boost calculators
+        "calculate_social_signal_demand_boost": calculate_social_signal_demand_boost,
+        "calculate_marketing_spend_demand_boost": calculate_marketing_spend_demand_boost,
+        "calculate_trade_promo_demand_boost": calculate_trade_promo_demand_boost,
+        "calculate_digital_shelf_demand_boost": calculate_digital_shelf_demand_boost,
+        "calculate_weather_environment_demand_boost": calculate_weather_environment_demand_boost,
+        "calculate_competitor_data_demand_boost": calculate_competitor_data_demand_boost,
+        "calculate_final_demand_boost": calculate_final_demand_boost,
+        "calculate_final_demand_forecast": calculate_final_demand_forecast,
+        "build_boost_reasoning_context": build_boost_reasoning_context,
+    }
+)
+
+
+CRITIC_TOOLS: Mapping[str, Any] = MappingProxyType(
+    {
+        "critic_review_consensus_demand_boost": critic_review_consensus_demand_boost,
+    }
+)
+
+_DEMAND_ACTOR_TOOL_NAMES: Tuple[str, ...] = tuple(sorted(DEMAND_ACTOR_TOOLS))
 
 
 def list_demand_actor_tools() -> List[str]:
     """
     Convenience for debugging / agent bootstrapping.
     """
-    return sorted(DEMAND_ACTOR_TOOLS.keys())
+    return list(_DEMAND_ACTOR_TOOL_NAMES)
 
 
@@ -1,8 +1,7 @@
 """
 Micro-step demo:
 - Spin up AutoGen runtime
-- Send ActorRunRequest
-- Send CriticReviewRequest
+- Send ActorRunRequest and CriticReviewRequest concurrently
 
 Run:
   venv/bin/python -m prototype2_demand_supply.demo_autogen_demand_team
@@ -11,7 +10,6 @@ Run:
 from __future__ import annotations
 
 import asyncio
-import json
 
 from autogen_core import AgentId
 
@@ -28,55 +26,44 @@ async def main() -> None:
     runtime = await build_demand_team_runtime()
     runtime.start()
     try:
-        # 1) Actor computes boosts
-        actor_result = await runtime.send_message(
-            ActorRunRequest(
-                sku_id="PONDS_SUPER_LIGHT_GEL_100G",
-                customer_id="BLINKIT",
-                location_id="BANGALORE",
-                as_of_date="2026-01-03",
-                attempt=1,
+        # Actor computes boosts; Critic reviews thresholds + tool health. The Critic recomputes
+        # from the store (it does not read the Actor's reply), so both round-trips overlap.
+        actor_result, critic_result = await asyncio.gather(
+            runtime.send_message(
+                ActorRunRequest(
+                    sku_id="PONDS_SUPER_LIGHT_GEL_100G",
+                    customer_id="BLINKIT",
+                    location_id="BANGALORE",
+                    as_of_date="2026-01-03",
+                    attempt=1,
+                ),
+                recipient=ACTOR_AGENT_ID,
             ),
-            recipient=ACTOR_AGENT_ID,
-        )
-
-        # 2) Critic reviews thresholds + tool health
-        critic_result = await runtime.send_message(
-            CriticReviewRequest(
-                sku_id="PONDS_SUPER_LIGHT_GEL_100G",
-                customer_id="BLINKIT",
-                location_id="BANGALORE",
-                as_of_date="2026-01-03",
-                upper_threshold=0.30,
-                lower_threshold=-0.20,
-                attempt=1,
+            runtime.send_message(
+                CriticReviewRequest(
+                    sku_id="PONDS_SUPER_LIGHT_GEL_100G",
+                    customer_id="BLINKIT",
+                    location_id="BANGALORE",
+                    as_of_date="2026-01-03",
+                    upper_threshold=0.30,
+                    lower_threshold=-0.20,
+                    attempt=1,
+                ),
+                recipient=CRITIC_AGENT_ID,
             ),
-            recipient=CRITIC_AGENT_ID,
         )
 
+        boost = actor_result.final_boost
+        review = critic_result.review
         print("=== Actor total boost ===")
-        print(
-            json.dumps(
-                {
-                    "as_of_date": actor_result.as_of_date,
-                    "total_boost_percent": actor_result.final_boost["total_boost_percent"],
-                    "raw_total_boost_percent": actor_result.final_boost["raw_total_boost_percent"],
-                },
-                indent=2,
-            )
-        )
+        print(f"  as_of_date: {actor_result.as_of_date}")
+        print(f"  total_boost_percent: {boost['total_boost_percent']}")
+        print(f"  raw_total_boost_percent: {boost['raw_total_boost_percent']}")
         print("\n=== Critic decision ===")
-        print(
-            json.dumps(
-                {
-                    "outside_thresholds": critic_result.review["outside_thresholds"],
-                    "decision": critic_result.review["decision"],
-                    "next_action": critic_result.review["next_action"],
-                    "rerun_recommendations": critic_result.review["rerun_recommendations"],
-                },
-                indent=2,
-            )
-        )
+        print(f"  outside_thresholds: {review['outside_thresholds']}")
+        print(f"  decision: {review['decision']}")
+        print(f"  next_action: {review['next_action']}")
+        print(f"  rerun_recommendations: {review['rerun_recommendations']}")
 
         print("\n=== Actor reasoning (template unless OPENAI_API_KEY configured) ===")
         print("source:", actor_result.reasoning_source)
@@ -2,8 +2,9 @@
 Micro-step demo:
 Human-in-the-loop (HITL) behavior in LangGraph.
 
-We run once to reach approval_status=pending and print the approval_request.
-Then we "resume" by providing human_decision=approve and run again to finalize.
+We run once until the graph pauses at human_approval and print the approval_request.
+Then we resume that same thread with the decision (approve); only the approval,
+finalize and store steps run again, from the checkpointed state.
 
 Run (network needed for Gemini parsing + reasoning):
   venv/bin/python -m prototype2_demand_supply.demo_langgraph_hitl
@@ -14,11 +15,15 @@ from __future__ import annotations
 import asyncio
 import json
 
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.types import Command
+
 from prototype2_demand_supply.graph.demand_flow import build_demand_flow_graph
 
 
 async def main() -> None:
-    graph = build_demand_flow_graph()
+    graph = build_demand_flow_graph(checkpointer=InMemorySaver())
+    config = {"configurable": {"thread_id": "hitl-1"}}
 
     # A request that typically triggers out-of-threshold approvals.
     user_query = (
@@ -33,26 +38,24 @@ async def main() -> None:
     }
 
     print("\n=== Run 1 (expect pending approval) ===")
-    out1 = await graph.ainvoke(state)
-    print("approval_status:", out1.get("approval_status"))
-    print("finalized:", out1.get("finalized"))
+    out1 = await graph.ainvoke(state, config=config)
+    interrupts = out1.get("__interrupt__") or []
+    print("paused_for_approval:", bool(interrupts))
     print("decision:", (out1.get("critic_result") or {}).get("decision"))
-    print("\napproval_request:")
-    print(json.dumps(out1.get("approval_request", {}), indent=2))
 
-    if out1.get("approval_status") != "pending":
-        print("\nUnexpected: did not stop at pending. Exiting.")
+    if not interrupts:
+        print("\nUnexpected: did not pause for approval. Exiting.")
         return
 
+    print("\napproval_request:")
+    print(json.dumps(interrupts[0].value, indent=2))
+
     print("\n=== Run 2 (resume with approve) ===")
-    out2_state = dict(out1)
-    out2_state["human_decision"] = "approve"
-    out2 = await graph.ainvoke(out2_state)
+    out2 = await graph.ainvoke(Command(resume="approve"), config=config)
     print("approval_status:", out2.get("approval_status"))
     print("finalized:", out2.get("finalized"))
     print("results:", json.dumps(out2.get("results", []), indent=2))
 
-
 if __name__ == "__main__":
     asyncio.run(main())
 
@@ -1,31 +1,63 @@
 """
-LangGraph demand-team workflow (Actor -> Critic -> route).
+LangGraph demand-team workflow (Actor + Critic -> route).
 
 We keep this workflow deterministic (no LLM) but still:
 - orchestration uses LangGraph v1.0+
 - agent-to-agent communication uses AutoGen (autogen_core runtime)
+
+Multi-SKU runs (scope=all_relevant) fan out one per-SKU subgraph per SKU with Send and
+merge their results[]; single-SKU runs (HITL) walk the queue serially as before.
+
+HITL: by default a run without human_decision ends with approval_status=pending and the
+caller re-invokes with the prior state plus human_decision. Compiled with a checkpointer,
+the graph instead pauses inside human_approval and resumes there with
+Command(resume="approve"|"reject") on the same thread_id (see demo_langgraph_hitl.py).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, TypedDict
+import asyncio
+import functools
+import operator
+import os
+from dataclasses import asdict, dataclass
+from typing import Annotated, Any, Callable, Dict, List, Optional, TypedDict, Union
 
 from langgraph.graph import END, StateGraph
+from langgraph.types import Send, interrupt
 
 from prototype2_demand_supply.agents.demand_team_agents import (
     ACTOR_AGENT_ID,
     CRITIC_AGENT_ID,
+    REASONING_PROMPT_VERSION,
     ActorRunRequest,
+    ActorRunResult,
     CriticReviewRequest,
+    CriticReviewResult,
 )
-from prototype2_demand_supply.agents.runtime import build_demand_team_runtime
+from prototype2_demand_supply.agents.llm import reasoning_model_name
+from prototype2_demand_supply.agents.runtime import get_demand_team_runtime
 from prototype2_demand_supply.agents.tools import fetch_relevant_products_by_abc_xyz
+from prototype2_demand_supply.graph.llm_cache import cache_key, get_answer_cache
 from prototype2_demand_supply.graph.planner_request_parser import parse_planner_request
 from prototype2_demand_supply.DBmock.approved_consensus_demand import save_approved_consensus_demand
 from prototype2_demand_supply.DBmock.consensus_demand import upsert_consensus_demand
 
 
+# Upper bound on SKU branches LangGraph runs at once in a fan-out (graph max_concurrency).
+_SKU_FANOUT_CONCURRENCY = int(os.getenv("SKU_FANOUT_CONCURRENCY", "8"))
+
+
+def _next_state(state: DemandFlowState) -> DemandFlowState:
+    """
+    Copy of `state` for a node to update and return, without results: results[] is an
+    append-only channel (operator.add), so a node adds to it by returning only new entries.
+    """
+    new_state: DemandFlowState = dict(state)
+    new_state.pop("results", None)
+    return new_state
+
+
 class DemandFlowState(TypedDict, total=False):
     # Inputs
     sku_id: str
@@ -55,7 +87,7 @@ class DemandFlowState(TypedDict, total=False):
     # Multi-SKU execution
     sku_queue: List[str]
     current_sku_index: int
-    results: List[Dict[str, Any]]
+    results: Annotated[List[Dict[str, Any]], operator.add]
 
     # Human-in-the-loop (per SKU)
     human_decision: str  # "approve" | "reject" | "" (optional)
@@ -71,10 +103,10 @@ async def parse_request_node(state: DemandFlowState) -> DemandFlowState:
     """
     user_query = state.get("user_query") or ""
     if not user_query:
-        return dict(state)
+        return _next_state(state)
 
     params = await parse_planner_request(user_query)
-    new_state: DemandFlowState = dict(state)
+    new_state = _next_state(state)
     # Only fill if not explicitly set by caller
     new_state.setdefault("customer_id", params.customer_id)
     new_state.setdefault("location_id", params.location_id)
@@ -115,10 +147,9 @@ def build_sku_queue_node(state: DemandFlowState) -> DemandFlowState:
             sku_queue = [sku_id]
         halt_on_pending_approval = True
 
-    new_state: DemandFlowState = dict(state)
+    new_state = _next_state(state)
     new_state["sku_queue"] = sku_queue
     new_state["current_sku_index"] = 0
-    new_state.setdefault("results", [])
     new_state.setdefault("halt_on_pending_approval", halt_on_pending_approval)
     return new_state
 
@@ -128,7 +159,7 @@ def set_current_sku_node(state: DemandFlowState) -> DemandFlowState:
     queue = state.get("sku_queue") or []
     sku_id = queue[idx] if 0 <= idx < len(queue) else ""
 
-    new_state: DemandFlowState = dict(state)
+    new_state = _next_state(state)
     new_state["sku_id"] = sku_id
     new_state["attempt"] = 1
     # clear per-sku artifacts
@@ -141,82 +172,89 @@ def set_current_sku_node(state: DemandFlowState) -> DemandFlowState:
     return new_state
 
 
-def select_products_node(state: DemandFlowState) -> DemandFlowState:
+async def _send_cached(runtime: Any, msg: Any, recipient: Any, result_type: Any, kind: str) -> Any:
     """
-    Micro-step 1: Product selection.
-
-    If sku_id is missing or "AUTO", select the first relevant SKU by ABC/XYZ filters.
+    runtime.send_message through the answer cache (graph/llm_cache.py) when it is enabled.
     """
-    sku_id = (state.get("sku_id") or "").strip().upper()
-    if sku_id and sku_id != "AUTO":
-        return dict(state)
-
-    location_id = state.get("location_id", "BANGALORE")
-    products = fetch_relevant_products_by_abc_xyz(location_id=location_id, abc_class="A", xyz_classes=("Y", "Z"))
-    chosen = products[0]["sku_id"] if products else ""
+    cache = get_answer_cache()
+    if cache is None:
+        return await runtime.send_message(msg, recipient=recipient)
+    fields = asdict(msg)
+    if fields.get("user_query"):
+        # Whitespace/case variants of the same planner question share an entry.
+        fields["user_query"] = " ".join(fields["user_query"].split()).lower()
+    # Switching models or editing the system prompts must not serve old answers. The Actor
+    # answers planner questions (user_query) with the quality tier.
+    speed_tier = "quality" if fields.get("user_query") else "fast"
+    fields["model"] = reasoning_model_name("google", speed_tier)
+    fields["prompt_version"] = REASONING_PROMPT_VERSION
+    key = cache_key(kind, fields)
+    hit = cache.get(key)
+    if hit is not None:
+        return result_type(**hit)
+    result = await runtime.send_message(msg, recipient=recipient)
+    if result.reasoning_source == "llm" and result.reasoning.strip():
+        cache.set(key, asdict(result))
+    return result
+
+
+async def _run_actor(state: DemandFlowState) -> ActorRunResult:
+    runtime = await get_demand_team_runtime()
+    msg = ActorRunRequest(
+        sku_id=state["sku_id"],
+        customer_id=state.get("customer_id", "BLINKIT"),
+        location_id=state.get("location_id", "BANGALORE"),
+        as_of_date=state.get("as_of_date", "2026-01-01"),
+        attempt=int(state.get("attempt", 1)),
+        user_query=state.get("user_query"),
+    )
+    return await _send_cached(runtime, msg, ACTOR_AGENT_ID, ActorRunResult, "actor")
+
+
+async def _run_critic(state: DemandFlowState) -> CriticReviewResult:
+    runtime = await get_demand_team_runtime()
+    msg = CriticReviewRequest(
+        sku_id=state["sku_id"],
+        customer_id=state.get("customer_id", "BLINKIT"),
+        location_id=state.get("location_id", "BANGALORE"),
+        as_of_date=state.get("as_of_date", "2026-01-01"),
+        upper_threshold=float(state.get("upper_threshold", 0.30)),
+        lower_threshold=float(state.get("lower_threshold", -0.20)),
+        attempt=int(state.get("attempt", 1)),
+    )
+    return await _send_cached(runtime, msg, CRITIC_AGENT_ID, CriticReviewResult, "critic")
 
-    new_state: DemandFlowState = dict(state)
-    new_state["sku_id"] = chosen
-    return new_state
 
+async def actor_critic_node(state: DemandFlowState) -> DemandFlowState:
+    """
+    Actor and Critic for the current SKU/attempt, sent concurrently.
 
-async def actor_node(state: DemandFlowState) -> DemandFlowState:
-    runtime = await build_demand_team_runtime()
-    runtime.start()
-    try:
-        attempt = int(state.get("attempt", 1))
-        msg = ActorRunRequest(
-            sku_id=state["sku_id"],
-            customer_id=state.get("customer_id", "BLINKIT"),
-            location_id=state.get("location_id", "BANGALORE"),
-            as_of_date=state.get("as_of_date", "2026-01-01"),
-            attempt=attempt,
-            user_query=state.get("user_query"),
-        )
-        actor_result = await runtime.send_message(msg, recipient=ACTOR_AGENT_ID)
-        new_state: DemandFlowState = dict(state)
-        new_state["actor_result"] = actor_result.final_boost
-        new_state["actor_forecast"] = actor_result.final_forecast
-        new_state["actor_reasoning"] = actor_result.reasoning
-        return new_state
-    finally:
-        await runtime.stop()
-
-
-async def critic_node(state: DemandFlowState) -> DemandFlowState:
-    runtime = await build_demand_team_runtime()
-    runtime.start()
-    try:
-        attempt = int(state.get("attempt", 1))
-        msg = CriticReviewRequest(
-            sku_id=state["sku_id"],
-            customer_id=state.get("customer_id", "BLINKIT"),
-            location_id=state.get("location_id", "BANGALORE"),
-            as_of_date=state.get("as_of_date", "2026-01-01"),
-            upper_threshold=float(state.get("upper_threshold", 0.30)),
-            lower_threshold=float(state.get("lower_threshold", -0.20)),
-            attempt=attempt,
-        )
-        critic_result = await runtime.send_message(msg, recipient=CRITIC_AGENT_ID)
-        new_state: DemandFlowState = dict(state)
-        new_state["critic_result"] = critic_result.review
-        new_state["critic_reasoning"] = critic_result.reasoning
-
-        # Track history for debugging / UI
-        history = list(state.get("history", []))
-        history.append(
-            {
-                "attempt": attempt,
-                "as_of_date": state.get("as_of_date"),
-                "actor_total_boost": state.get("actor_result", {}).get("total_boost_percent"),
-                "critic_decision": critic_result.review.get("decision"),
-                "rerun_recommendations": critic_result.review.get("rerun_recommendations"),
-            }
-        )
-        new_state["history"] = history
-        return new_state
-    finally:
-        await runtime.stop()
+    The Critic recomputes the boost from the same driver store instead of reading the Actor's
+    reply, so its review never depends on the Actor's result: both LLM explanations overlap
+    and nothing has to be speculated or discarded.
+    """
+    actor_result, critic_result = await asyncio.gather(_run_actor(state), _run_critic(state))
+    attempt = int(state.get("attempt", 1))
+    new_state = _next_state(state)
+    new_state["actor_result"] = actor_result.final_boost
+    new_state["actor_forecast"] = actor_result.final_forecast
+    new_state["actor_reasoning"] = actor_result.reasoning
+    new_state["critic_result"] = critic_result.review
+    new_state["critic_reasoning"] = critic_result.reasoning
+
+    # Track history for debugging / UI
+    history = list(state.get("history", []))
+    history.append(
+        {
+            "attempt": attempt,
+            "as_of_date": state.get("as_of_date"),
+            "actor_total_boost": actor_result.final_boost.get("total_boost_percent"),
+            "critic_decision": critic_result.review.get("decision"),
+            "rerun_recommendations": critic_result.review.get("rerun_recommendations"),
+        }
+    )
+    new_state["history"] = history
+    return new_state
 
 
 def route_node(state: DemandFlowState) -> DemandFlowState:
@@ -241,7 +279,7 @@ def route_node(state: DemandFlowState) -> DemandFlowState:
         # within_thresholds OR retries exhausted
         route = "finalize"
 
-    new_state: DemandFlowState = dict(state)
+    new_state = _next_state(state)
     new_state["route"] = route
     return new_state
 
@@ -259,7 +297,7 @@ def human_approval_node(state: DemandFlowState) -> DemandFlowState:
     """
     decision = (state.get("human_decision") or "").strip().lower()
 
-    new_state: DemandFlowState = dict(state)
+    new_state = _next_state(state)
     new_state["approval_request"] = {
         "sku_id": state.get("sku_id"),
         "customer_id": state.get("customer_id"),
@@ -285,11 +323,24 @@ def human_approval_node(state: DemandFlowState) -> DemandFlowState:
     return new_state
 
 
+def human_approval_interrupt_node(state: DemandFlowState) -> DemandFlowState:
+    """
+    human_approval for checkpointed graphs: in single-SKU runs (halt_on_pending_approval) with
+    no human_decision, pause the run with the approval_request as the interrupt payload; the
+    resume value is the decision. Multi-SKU runs record pending and continue as usual.
+    """
+    if state.get("halt_on_pending_approval") and not (state.get("human_decision") or "").strip():
+        pending = human_approval_node(state)
+        decision = interrupt(pending["approval_request"])
+        state = {**state, "human_decision": str(decision or "")}
+    return human_approval_node(state)
+
+
 def finalize_node(state: DemandFlowState) -> DemandFlowState:
     """
     Finalization marker (consensus demand can be considered finalized for this SKU).
     """
-    new_state: DemandFlowState = dict(state)
+    new_state = _next_state(state)
     new_state["finalized"] = True
     new_state.setdefault("approval_status", "not_required")
 
@@ -319,25 +370,22 @@ def finalize_node(state: DemandFlowState) -> DemandFlowState:
 
 def store_result_node(state: DemandFlowState) -> DemandFlowState:
     """
-    Store per-SKU final artifacts into results[].
+    Store per-SKU final artifacts into results[] (returned as the one new entry).
     """
-    results = list(state.get("results", []))
-    results.append(
-        {
-            "sku_id": state.get("sku_id"),
-            "as_of_date": state.get("as_of_date"),
-            "actor_forecast": state.get("actor_forecast"),
-            "actor_result": state.get("actor_result"),
-            "actor_reasoning": state.get("actor_reasoning"),
-            "critic_result": state.get("critic_result"),
-            "critic_reasoning": state.get("critic_reasoning"),
-            "approval_status": state.get("approval_status"),
-            "human_decision": state.get("human_decision"),
-            "finalized": state.get("finalized", False),
-            # Include approval_request so UI can later show pending SKUs and approve them.
-            "approval_request": state.get("approval_request"),
-        }
-    )
+    entry = {
+        "sku_id": state.get("sku_id"),
+        "as_of_date": state.get("as_of_date"),
+        "actor_forecast": state.get("actor_forecast"),
+        "actor_result": state.get("actor_result"),
+        "actor_reasoning": state.get("actor_reasoning"),
+        "critic_result": state.get("critic_result"),
+        "critic_reasoning": state.get("critic_reasoning"),
+        "approval_status": state.get("approval_status"),
+        "human_decision": state.get("human_decision"),
+        "finalized": state.get("finalized", False),
+        # Include approval_request so UI can later show pending SKUs and approve them.
+        "approval_request": state.get("approval_request"),
+    }
 
     # Persist "planned consensus" for this SKU (regardless of approval status).
     af = state.get("actor_forecast") or {}
@@ -361,8 +409,8 @@ def store_result_node(state: DemandFlowState) -> DemandFlowState:
             "approval_status": state.get("approval_status") or "pending",
         }
     )
-    new_state: DemandFlowState = dict(state)
-    new_state["results"] = results
+    new_state = _next_state(state)
+    new_state["results"] = [entry]
     return new_state
 
 
@@ -376,49 +424,61 @@ def next_sku_or_end_node(state: DemandFlowState) -> DemandFlowState:
         route = "next_sku"
     else:
         route = "end"
-    new_state: DemandFlowState = dict(state)
+    new_state = _next_state(state)
     new_state["route"] = route
     return new_state
 
 
 def bump_sku_index_node(state: DemandFlowState) -> DemandFlowState:
-    new_state: DemandFlowState = dict(state)
+    new_state = _next_state(state)
     new_state["current_sku_index"] = int(state.get("current_sku_index", 0)) + 1
     return new_state
 
 
 def bump_attempt_node(state: DemandFlowState) -> DemandFlowState:
-    new_state: DemandFlowState = dict(state)
+    new_state = _next_state(state)
     new_state["attempt"] = int(state.get("attempt", 1)) + 1
     return new_state
 
 
-def build_demand_flow_graph():
+def _fan_out_router(state: DemandFlowState) -> Union[str, List[Send]]:
     """
-    Returns a compiled LangGraph runnable.
+    Serial walk for single-SKU (HITL) runs; otherwise one run_sku branch per queued SKU.
+    """
+    queue = state.get("sku_queue") or []
+    if state.get("halt_on_pending_approval") or len(queue) < 2:
+        return "set_current_sku"
+    return [
+        Send("run_sku", {**state, "current_sku_index": i, "results": []})
+        for i in range(len(queue))
+    ]
+
+
+async def run_sku_node(state: DemandFlowState) -> DemandFlowState:
+    """
+    One fan-out branch: run the per-SKU subgraph and hand back only its results[] entries.
+    """
+    out = await _sku_graph().ainvoke(state)
+    return {"results": out.get("results") or []}
+
+
+def _add_sku_nodes(g: StateGraph, *, human_approval: Callable[[DemandFlowState], DemandFlowState]) -> None:
+    """
+    Per-SKU pipeline: set_current_sku -> actor_critic -> route -> ... -> store_result.
+    The caller wires what follows store_result.
     """
-    g = StateGraph(DemandFlowState)
-    g.add_node("parse_request", parse_request_node)
-    g.add_node("build_sku_queue", build_sku_queue_node)
     g.add_node("set_current_sku", set_current_sku_node)
-    g.add_node("actor", actor_node)
-    g.add_node("critic", critic_node)
+    g.add_node("actor_critic", actor_critic_node)
     g.add_node("route", route_node)
     g.add_node("bump_attempt", bump_attempt_node)
-    g.add_node("human_approval", human_approval_node)
+    g.add_node("human_approval", human_approval)
     g.add_node("finalize", finalize_node)
     g.add_node("store_result", store_result_node)
-    g.add_node("next_sku_or_end", next_sku_or_end_node)
-    g.add_node("bump_sku_index", bump_sku_index_node)
 
-    g.set_entry_point("parse_request")
-    g.add_edge("parse_request", "build_sku_queue")
-    g.add_edge("build_sku_queue", "set_current_sku")
-    g.add_edge("set_current_sku", "actor")
-    g.add_edge("actor", "critic")
-    g.add_edge("critic", "route")
+    g.add_edge("set_current_sku", "actor_critic")
+    g.add_edge("actor_critic", "route")
 
-    # Conditional route: rerun => bump attempt => actor, else end
+    # Conditional route: rerun => bump attempt => actor_critic, else end
     def _router(state: DemandFlowState) -> str:
         return state.get("route", "end")
 
@@ -431,7 +491,7 @@ def build_demand_flow_graph():
             "finalize": "finalize",
         },
     )
-    g.add_edge("bump_attempt", "actor")
+    g.add_edge("bump_attempt", "actor_critic")
     # HITL routing: pending ends early, approved finalizes, rejected stores result.
     def _hitl_router(state: DemandFlowState) -> str:
         status = state.get("approval_status", "pending")
@@ -449,6 +509,49 @@ def build_demand_flow_graph():
         },
     )
     g.add_edge("finalize", "store_result")
+
+
+@functools.lru_cache(maxsize=1)
+def _sku_graph():
+    """
+    Compiled per-SKU subgraph used by the fan-out branches (built once).
+    """
+    g = StateGraph(DemandFlowState)
+    _add_sku_nodes(g, human_approval=human_approval_node)
+    g.set_entry_point("set_current_sku")
+    g.add_edge("store_result", END)
+    return g.compile()
+
+
+def build_demand_flow_graph(*, checkpointer: Optional[Any] = None):
+    """
+    Returns a compiled LangGraph runnable.
+
+    Output: results[] holds one entry per processed SKU (append-only; entries passed in the
+    input are kept, so only pass results on a fresh invocation/thread). Single-SKU runs also
+    leave that SKU's sku_id, actor_result, actor_forecast, critic_result, history etc. at
+    the top level. Multi-SKU runs (scope=all_relevant, 2+ SKUs) run each SKU in its own
+    fan-out branch and only merge results[]: the top-level per-SKU fields are absent and
+    sku_id keeps its input value (e.g. "AUTO").
+
+    Pass a checkpointer (e.g. langgraph.checkpoint.memory.InMemorySaver()) to pause single-SKU
+    HITL runs at human_approval instead of ending them; invoke with
+    config={"configurable": {"thread_id": ...}} and resume with Command(resume=decision).
+    """
+    g = StateGraph(DemandFlowState)
+    g.add_node("parse_request", parse_request_node)
+    g.add_node("build_sku_queue", build_sku_queue_node)
+    g.add_node("run_sku", run_sku_node)
+    _add_sku_nodes(
+        g, human_approval=human_approval_interrupt_node if checkpointer is not None else human_approval_node
+    )
+    g.add_node("next_sku_or_end", next_sku_or_end_node)
+    g.add_node("bump_sku_index", bump_sku_index_node)
+
+    g.set_entry_point("parse_request")
+    g.add_edge("parse_request", "build_sku_queue")
+    g.add_conditional_edges("build_sku_queue", _fan_out_router, ["set_current_sku", "run_sku"])
+    g.add_edge("run_sku", END)
     g.add_edge("store_result", "next_sku_or_end")
 
     def _post_router(state: DemandFlowState) -> str:
@@ -464,6 +567,4 @@ def build_demand_flow_graph():
     )
     g.add_edge("bump_sku_index", "set_current_sku")
 
-    return g.compile()
-
-
+    return g.compile(checkpointer=checkpointer).with_config(max_concurrency=_SKU_FANOUT_CONCURRENCY)
@@ -0,0 +1,96 @@
+"""
+Answer cache for the graph's Actor/Critic round-trips (opt-in).
+
+The actor_critic node re-runs the agents (and their LLM reasoning calls) whenever the graph
+runs, e.g. a plain HITL re-invoke repeats the whole pipeline for an unchanged SKU. With
+ENABLE_ANSWER_CACHE=1 each request looks up its result here first, keyed by a sha256 of the
+structured request; LLM-backed results are stored on a miss.
+
+Entries live in a SQLite file (ANSWER_CACHE_PATH, default graph/llm_cache.db) and expire after
+ANSWER_CACHE_TTL_S seconds (default 3600). Template fallbacks are never stored, so a transient
+provider failure is retried on the next run instead of being pinned for the TTL.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+
+_DEFAULT_PATH = Path(__file__).resolve().parent / "llm_cache.db"
+
+
+def cache_key(kind: str, fields: Mapping[str, Any]) -> str:
+    """
+    Deterministic key for one request: kind ("actor" / "critic") plus its structured inputs.
+    """
+    payload = json.dumps({"kind": kind, **fields}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    - path: the sqlite database file
+    - ttl_s: entries older than this are treated as misses (and replaced on the next set)
+    """
+
+    def __init__(self, path: Path, *, ttl_s: float = 3600.0) -> None:
+        self.path = path
+        self.ttl_s = ttl_s
+        self._conn: Optional[sqlite3.Connection] = None
+        # Streamlit reruns scripts on worker threads; one connection guarded by a lock.
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS answers (key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with self._lock:
+                hit = self._connect().execute("SELECT value, created_at FROM answers WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        if hit is None or time.time() - hit[1] > self.ttl_s:
+            return None
+        return json.loads(hit[0])
+
+    def set(self, key: str, value: Mapping[str, Any]) -> None:
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO answers (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, separators=(",", ":")), time.time()),
+                )
+        except sqlite3.Error:
+            # A cache write failure only costs a future hit.
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM answers")
+
+
+@functools.lru_cache(maxsize=1)
+def get_answer_cache() -> Optional[LLMCache]:
+    """
+    The process-wide cache, or None unless ENABLE_ANSWER_CACHE=1.
+    """
+    if os.getenv("ENABLE_ANSWER_CACHE", "0") != "1":
+        return None
+    path = Path(os.getenv("ANSWER_CACHE_PATH") or _DEFAULT_PATH)
+    return LLMCache(path, ttl_s=float(os.getenv("ANSWER_CACHE_TTL_S", "3600")))
@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from prototype2_demand_supply.agents.llm import build_reasoning_client
+from prototype2_demand_supply.agents.llm import get_shared_reasoning_client
 from dateutil import parser as date_parser
 
 
@@ -174,7 +174,7 @@ async def parse_planner_request(user_query: str) -> PlannerRunParams:
     """
     inferred_sku = _infer_sku_from_text(user_query)
     inferred_date = _infer_date_from_text(user_query)
-    client = build_reasoning_client(prefer="google")
+    client = get_shared_reasoning_client("google")
     if client is None:
         return _fallback_parse(user_query)
 
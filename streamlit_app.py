@@ -41,12 +41,13 @@ if "prototype2_demand_supply" not in sys.modules:
 from prototype2_demand_supply.agents.tools import fetch_relevant_products_by_abc_xyz
 from prototype2_demand_supply.graph.demand_flow import build_demand_flow_graph
 from prototype2_demand_supply.DBmock.approved_consensus_demand import (
-    load_approved_consensus_demands,
+    load_approved_consensus_demands_table,
     save_approved_consensus_demand,
 )
 from prototype2_demand_supply.graph.planner_request_parser import parse_planner_request
 from prototype2_demand_supply.DBmock.consensus_demand import (
     load_consensus_demands,
+    load_consensus_demands_table,
     set_consensus_approval_status,
 )
 
@@ -158,12 +159,12 @@ async def _run_graph_with_events(state: Dict[str, Any], status_box: Any) -> Dict
             st.session_state.run.active_node = ev.get("name")
             _status_update(status_box, f"Running: {ev.get('name')}", state="running")
             # High-signal progress message (avoid spamming).
-            if ev.get("name") in {"parse_request", "build_sku_queue", "actor", "critic", "human_approval", "finalize"}:
+            if ev.get("name") in {"parse_request", "build_sku_queue", "actor_critic", "human_approval", "finalize"}:
                 _chat_add("assistant", f"Step started: `{ev.get('name')}`")
         if ev["event"] == "on_chain_end":
             st.session_state.run.active_node = None
             _status_update(status_box, f"Completed: {ev.get('name')}", state="running")
-            if ev.get("name") in {"parse_request", "build_sku_queue", "actor", "critic", "human_approval", "finalize"}:
+            if ev.get("name") in {"parse_request", "build_sku_queue", "actor_critic", "human_approval", "finalize"}:
                 _chat_add("assistant", f"Step completed: `{ev.get('name')}`")
         if ev["event"] == "on_chain_stream":
             # sometimes final state is streamed here (not always)
@@ -468,16 +469,19 @@ def _render_results_and_approvals(out: Dict[str, Any]) -> None:
 
         show_all = st.checkbox("Show all planned consensus history", value=False)
         if show_all:
-            st.dataframe(consensus, use_container_width=True, hide_index=True)
+            st.dataframe(load_consensus_demands_table(), use_container_width=True, hide_index=True)
         else:
             st.caption("Showing planned consensus matching the current run context (SKU/customer/location/date).")
-            st.dataframe(filtered if filtered else consensus, use_container_width=True, hide_index=True)
+            if filtered:
+                st.dataframe(filtered, use_container_width=True, hide_index=True)
+            else:
+                st.dataframe(load_consensus_demands_table(), use_container_width=True, hide_index=True)
     else:
         st.caption("No planned consensus records yet. Run a flow to populate this table.")
 
     st.subheader("Approved consensus demand (mock DB)")
-    approvals = load_approved_consensus_demands()
-    if approvals:
+    approvals = load_approved_consensus_demands_table()
+    if approvals.num_rows:
         st.dataframe(approvals, use_container_width=True, hide_index=True)
     else:
         st.caption("No approved records yet.")